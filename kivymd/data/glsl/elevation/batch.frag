@@ -0,0 +1,31 @@
+/*
+Fragment shader of the batched shadow renderer.
+
+Uses the same rounded box SDF as `elevation.frag`, but takes the shadow
+parameters from the vertex attributes instead of uniforms.
+*/
+
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+varying vec2 local;
+varying vec2 half_size;
+varying vec4 shadow_radius;
+varying float shadow_softness;
+varying vec4 shadow_color;
+
+float roundedBoxSDF(vec2 centerPosition, vec2 size, vec4 radius) {
+    radius.xy = (centerPosition.x > 0.0) ? radius.xy : radius.zw;
+    radius.x = (centerPosition.y > 0.0) ? radius.x : radius.y;
+
+    vec2 q = abs(centerPosition) - (size - shadow_softness) + radius.x;
+    return min(max(q.x, q.y), 0.0) + length(max(q, 0.0)) - radius.x;
+}
+
+void main(void) {
+    float softness = max(shadow_softness, 0.0001);
+    float shadowDistance = roundedBoxSDF(local, half_size, shadow_radius);
+    float shadowAlpha = 1.0 - smoothstep(-softness, softness, shadowDistance);
+    gl_FragColor = vec4(shadow_color.rgb, shadow_color.a * shadowAlpha);
+}
@@ -0,0 +1,36 @@
+/*
+Vertex shader of the batched shadow renderer
+(see `kivymd.uix.behaviors.elevation.ShadowBatchBehavior`).
+
+Every shadow is a quad with per-vertex shadow attributes, so the shadows of
+all children of a container are drawn with a single mesh.
+*/
+
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+attribute vec2 vPosition;
+attribute vec2 vLocal;
+attribute vec2 vHalfSize;
+attribute vec4 vRadius;
+attribute float vSoftness;
+attribute vec4 vColor;
+
+uniform mat4 modelview_mat;
+uniform mat4 projection_mat;
+
+varying vec2 local;
+varying vec2 half_size;
+varying vec4 shadow_radius;
+varying float shadow_softness;
+varying vec4 shadow_color;
+
+void main(void) {
+    local = vLocal;
+    half_size = vHalfSize;
+    shadow_radius = vRadius;
+    shadow_softness = vSoftness;
+    shadow_color = vColor;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition, 0.0, 1.0);
+}
@@ -57,6 +57,9 @@ register("MDFillRoundFlatIconButton", module="kivymd.uix.button")
 register("MDCard", module="kivymd.uix.card")
 register("MDSeparator", module="kivymd.uix.card")
 register("MDSelectionList", module="kivymd.uix.selection")
+register("MDRecycleSelectionList", module="kivymd.uix.selection")
+register("MDRecycleSelectionListLayout", module="kivymd.uix.selection")
+register("RecycleSelectionItem", module="kivymd.uix.selection")
 register("MDChip", module="kivymd.uix.chip")
 register("MDSmartTile", module="kivymd.uix.imagelist")
 register("MDLabel", module="kivymd.uix.label")
@@ -81,6 +84,23 @@ register("ThreeLineRightIconListItem", module="kivymd.uix.list")
 register("OneLineAvatarIconListItem", module="kivymd.uix.list")
 register("TwoLineAvatarIconListItem", module="kivymd.uix.list")
 register("ThreeLineAvatarIconListItem", module="kivymd.uix.list")
+register("MDRecycleList", module="kivymd.uix.list")
+register("MDRecycleListLayout", module="kivymd.uix.list")
+register("RecycleOneLineListItem", module="kivymd.uix.list")
+register("RecycleTwoLineListItem", module="kivymd.uix.list")
+register("RecycleThreeLineListItem", module="kivymd.uix.list")
+register("RecycleOneLineAvatarListItem", module="kivymd.uix.list")
+register("RecycleTwoLineAvatarListItem", module="kivymd.uix.list")
+register("RecycleThreeLineAvatarListItem", module="kivymd.uix.list")
+register("RecycleOneLineIconListItem", module="kivymd.uix.list")
+register("RecycleTwoLineIconListItem", module="kivymd.uix.list")
+register("RecycleThreeLineIconListItem", module="kivymd.uix.list")
+register("RecycleOneLineRightIconListItem", module="kivymd.uix.list")
+register("RecycleTwoLineRightIconListItem", module="kivymd.uix.list")
+register("RecycleThreeLineRightIconListItem", module="kivymd.uix.list")
+register("RecycleOneLineAvatarIconListItem", module="kivymd.uix.list")
+register("RecycleTwoLineAvatarIconListItem", module="kivymd.uix.list")
+register("RecycleThreeLineAvatarIconListItem", module="kivymd.uix.list")
 register("HoverBehavior", module="kivymd.uix.behaviors.hover_behavior")
 register("FocusBehavior", module="kivymd.uix.behaviors.focus_behavior")
 register("MagicBehavior", module="kivymd.uix.behaviors.magic_behavior")
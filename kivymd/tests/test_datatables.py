@@ -0,0 +1,703 @@
+def test_table_cell_data_materializes_cells_on_demand():
+    from kivymd.uix.datatables.store import TableCellData, TableRowStore
+
+    rows = [
+        ("1", ("alert", [1, 0, 0, 1], "Red"), ("check", "Done")),
+        ("2", "Plain", 3),
+        ("3", "Last", ""),
+    ]
+    store = TableRowStore(rows, 3)
+    assert store.columns[0] == ["1", "2", "3"]
+    assert store.get_row(1) == ["2", "Plain", 3]
+
+    cells = TableCellData(store, 1, 3, {"viewclass": "CellRow"})
+    assert len(cells) == 6
+    assert cells[0] == {
+        "Index": "0",
+        "range": [0, 2],
+        "viewclass": "CellRow",
+        "text": "2",
+    }
+    assert cells[2]["text"] == "3"
+    assert cells[-1]["range"] == [3, 5]
+
+    page = TableCellData(store, 0, 1, {"viewclass": "CellRow"})
+    assert page[1]["icon"] == "alert"
+    assert page[1]["icon_color"] == [1, 0, 0, 1]
+    assert page[1]["text"] == "Red"
+    assert page[2]["icon"] == "check"
+    assert "icon_color" not in page[2]
+    assert page.get_layout_item() == {"viewclass": "CellRow"}
+
+
+def test_data_table_uses_columnar_store():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.store import TableCellData
+
+    MDApp()
+
+    row_data = [(str(i), f"Name {i}", str(i * 2)) for i in range(100)]
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30)), ("Value", dp(30))],
+        row_data=row_data,
+        rows_num=10,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+
+    # The rows are kept in one list and in the columns of the store.
+    assert table_data.row_data is table.row_data
+    assert isinstance(table_data.recycle_data, TableCellData)
+    assert len(table_data.recycle_data) == 30
+    assert table_data.recycle_data[4]["text"] == "Name 1"
+    assert table_data.data_first_cells[:3] == [0, 3, 6]
+
+    table_data.set_next_row_data_parts("forward")
+    assert table_data.recycle_data[0]["text"] == "10"
+
+
+def test_data_table_recycle_data_keeps_list_methods():
+    import pytest
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.store import TableCellData
+
+    MDApp()
+
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30))],
+        row_data=[(str(i), f"Name {i}") for i in range(3)],
+        rows_num=10,
+    )
+    table_data = table.table_data
+    cells = table_data.recycle_data
+    cell = dict(cells[0], text="Added", Index="6", range=[6, 7])
+
+    with pytest.deprecated_call():
+        cells.append(cell)
+    assert len(cells) == 7
+    assert cells[6]["text"] == "Added"
+    assert cells[1]["text"] == "Name 0"
+    assert cells.get_row_range(6) == [6, 7]
+    assert table_data.data_first_cells[:4] == [0, 2, 4, 6]
+    assert len(table_data.data_model.data) == 7
+
+    with pytest.deprecated_call():
+        table_data.recycle_data = [
+            dict(cell, text="1", Index="0", range=[0, 1]),
+            dict(cell, Index="1", range=[0, 1]),
+        ]
+    assert isinstance(table_data.recycle_data, TableCellData)
+    assert len(table_data.recycle_data) == 2
+    assert table_data.recycle_data[1]["text"] == "Added"
+
+
+def test_data_table_selection_is_kept_by_row_number():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30))],
+        row_data=[(str(i), f"Name {i}") for i in range(25)],
+        rows_num=10,
+        check=True,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+
+    table_data.select_row_id(3, "down")
+    table_data.select_row_id(12, "down")
+    assert table.get_row_checks() == [["3", "Name 3"], ["12", "Name 12"]]
+    assert table_data.current_selection_check == {0: [6], 1: [4]}
+
+    table_data.select_all("down")
+    assert table_data.check_all("down")
+    assert len(table.get_row_checks()) == 25
+
+    table_data.select_all("normal")
+    assert table_data.check_all("normal")
+    table_data.current_selection_check = {2: [2]}
+    assert table_data.get_selected_rows() == {21}
+
+    # The pages follow the displayed order.
+    table.sort_by([("No.", "DSC", "numeric")])
+    assert table_data.current_selection_check == {0: [6]}
+    table_data.current_selection_check = {0: [0], 2: [8]}
+    assert table_data.get_selected_rows() == {24, 0}
+
+
+def test_data_table_row_changes_update_displayed_page_only():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30))],
+        row_data=[(str(i), f"Name {i}") for i in range(25)],
+        rows_num=10,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+    changes = []
+    table_data.data_model.bind(
+        on_data_changed=lambda *args, **kwargs: changes.append(kwargs)
+    )
+    table_data.set_next_row_data_parts("forward")
+    table_data.set_next_row_data_parts("forward")
+    store = table_data.get_row_store()
+    changes.clear()
+
+    table_data.select_row_id(22, "down")
+    table.add_row(("25", "Name 25"))
+    assert changes == [{"appended": slice(10, 12)}]
+    assert table_data.recycle_data[10]["text"] == "25"
+    assert table_data.get_row_store() is store
+
+    changes.clear()
+    table.remove_row(table.row_data[0])
+    assert changes == [
+        {"modified": slice(0, 10)},
+        {"removed": slice(10, 12)},
+    ]
+    assert table_data.get_selected_rows() == {21}
+    assert len(table.row_data) == len(table_data.row_data) == 25
+
+    changes.clear()
+    table.update_row(table.row_data[1], ("X", "Y"))
+    assert changes == []
+    assert store.get_row(1) == ["X", "Y"]
+
+    with table.batch():
+        for row in table.row_data[20:]:
+            table.remove_row(row)
+    assert table_data._rows_number == 1
+    assert table_data.recycle_data[0]["text"] == "11"
+
+
+def test_data_sources_fetch_pages_with_bounded_cache():
+    import sqlite3
+
+    import pytest
+
+    from kivymd.uix.datatables.sources import (
+        PagedRowStore,
+        SequenceDataSource,
+        SQLiteDataSource,
+        TableDataSource,
+    )
+
+    with pytest.raises(TypeError):
+        TableDataSource()
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE people (id INTEGER, name TEXT)")
+    connection.executemany(
+        "INSERT INTO people VALUES (?, ?)",
+        [(i, f"Name {i}") for i in range(100)],
+    )
+    source = SQLiteDataSource(connection, "SELECT id, name FROM people")
+    assert source.get_row_count() == 100
+    assert source.fetch_rows(10, 12) == [(10, "Name 10"), (11, "Name 11")]
+
+    source.set_sort(0, "DSC")
+    assert source.fetch_rows(0, 1) == [(99, "Name 99")]
+    source.set_filter({1: "Name 5"})
+    assert source.get_row_count() == 11
+
+    # Sequential pages are fetched after the last key of the previous one.
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name)")
+    connection.executemany(
+        "INSERT INTO items VALUES (?, ?)",
+        [(i, f"Item {i}") for i in range(100, 0, -1)],
+    )
+    statements = []
+    connection.set_trace_callback(statements.append)
+    source = SQLiteDataSource(
+        connection, "SELECT id, name FROM items", key="id"
+    )
+    assert source.fetch_rows(0, 10)[0] == (1, "Item 1")
+    assert source.fetch_rows(10, 20)[0] == (11, "Item 11")
+    assert '"id" > 10' in statements[-1] and "OFFSET" not in statements[-1]
+    source.set_filter({1: "Item 9"})
+    assert source.fetch_rows(0, 5)[-1] == (93, "Item 93")
+    assert source.fetch_rows(5, 10)[0] == (94, "Item 94")
+    assert "OFFSET" not in statements[-1]
+    source.set_sort(1, "DSC")
+    assert source.fetch_rows(0, 1) == [(99, "Item 99")]
+    connection.set_trace_callback(None)
+
+    sequence = SequenceDataSource([(str(i), f"Name {i}") for i in range(30)])
+    sequence.set_filter({1: "name 2"})
+    assert sequence.get_row_count() == 11
+    sequence.set_sort(0, "DSC")
+    assert sequence.fetch_rows(0, 1) == [("29", "Name 29")]
+
+    rows = [(i,) for i in range(100)]
+    store = PagedRowStore(SequenceDataSource(rows), 1, 10, 2, prefetch=0)
+    for row in range(0, 100, 10):
+        store.get_value(row, 0)
+    assert store.fetches == 10
+    assert len(store._blocks) == 2
+    assert store.get_value(95, 0) == 95
+    assert store.fetches == 10
+
+
+def test_data_table_reads_rows_from_data_source():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.sources import SequenceDataSource
+
+    MDApp()
+    source = SequenceDataSource([(str(i), f"Name {i}") for i in range(25)])
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30), True)],
+        data_source=source,
+        rows_num=10,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+
+    assert table_data.row_count == 25
+    assert table_data.recycle_data[1]["text"] == "Name 0"
+    table_data.set_next_row_data_parts("forward")
+    assert table_data.recycle_data[0]["text"] == "10"
+
+    assert table_data.sort_data_source(1, "DSC")
+    assert table_data._rows_number == 0
+    assert table_data.recycle_data[1]["text"] == "Name 9"
+
+
+def test_data_sources_refresh_changed_rows():
+    import sqlite3
+
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.sources import (
+        SequenceDataSource,
+        SQLiteDataSource,
+    )
+
+    MDApp()
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE people (id INTEGER, name TEXT)")
+    connection.executemany(
+        "INSERT INTO people VALUES (?, ?)", [(i, str(i)) for i in range(30)]
+    )
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Name", dp(30))],
+        data_source=SQLiteDataSource(
+            connection, "SELECT id, name FROM people"
+        ),
+        rows_num=10,
+        use_pagination=True,
+    )
+    assert table.table_data.row_count == 30
+    connection.executemany(
+        "INSERT INTO people VALUES (?, ?)",
+        [(i, str(i)) for i in range(30, 50)],
+    )
+    table.update_data_source()
+    assert table.table_data.row_count == 50
+
+    # Icon cells, numbers and `None` are sorted by their texts.
+    rows = [("1", ("account", "B")), ("2", 3), ("3", None), ("4", "A")]
+    sequence = SequenceDataSource(rows)
+    sequence.set_sort(1, "ASC")
+    assert [row[0] for row in sequence.fetch_rows(0, 4)] == [
+        "2",
+        "4",
+        "1",
+        "3",
+    ]
+    rows.append(("5", "0"))
+    sequence.refresh()
+    assert sequence.get_row_count() == 5
+    assert sequence.fetch_rows(0, 1) == [("5", "0")]
+
+
+def test_table_sorter_sorts_by_several_columns():
+    from kivymd.uix.datatables.sort import TableSorter
+    from kivymd.uix.datatables.store import TableRowStore
+
+    store = TableRowStore(
+        [("b", "10"), ("a10", "2"), ("a2", "2"), ("c", "x")], 2
+    )
+    sorter = TableSorter(store)
+
+    assert sorter.sort([(1, "ASC", "numeric"), (0, "ASC", "natural")]) == [
+        2,
+        1,
+        0,
+        3,
+    ]
+    keys = sorter.get_keys(1, "numeric")
+    order = sorter.order
+    assert sorter.sort_column(1, "DSC", "numeric") is order
+    assert order == [3, 0, 1, 2]
+    assert sorter.get_keys(1, "numeric") is keys
+
+    assert sorter.sort_column(0, "ASC", "natural") == [2, 1, 0, 3]
+    assert sorter.spec[1] == (1, "DSC", "numeric")
+
+
+def test_data_table_sort_keeps_checked_rows():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30), "numeric"), ("Name", dp(30))],
+        row_data=[(str(i), f"Name {i}") for i in range(25)],
+        rows_num=10,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+    table_data.select_row_id(3, "down")
+
+    table.sort_by([("No.", "DSC", "numeric")])
+    assert table_data.recycle_data[0]["text"] == "24"
+    assert table_data.recycle_data.get_row_id(0) == 24
+    assert table.get_row_checks() == [["3", "Name 3"]]
+    assert table.row_data[0] == ("0", "Name 0")
+
+    table.add_row(("25", "Name 25"))
+    assert table_data.recycle_data[0]["text"] == "25"
+
+
+def test_table_search_index_narrows_previous_rows():
+    from kivymd.uix.datatables.search import TableSearchIndex
+    from kivymd.uix.datatables.store import TableRowStore
+
+    store = TableRowStore(
+        [("1", "Tom", "2021"), ("2", "Tommy", "2022"), ("3", "Ann", "tom")],
+        3,
+    )
+    index = TableSearchIndex(store)
+
+    assert index.match(1, "TO") == [0, 1]
+    index._texts[1][0] = "changed"
+    # Only the rows found for "to" are checked again.
+    assert index.match(1, "tom") == [1]
+    index.refresh()
+    assert index.match(1, "tom") == [0, 1]
+    assert index.filter({1: "tom", 2: "2022"}) == [1]
+    assert index.search("tom") == [0, 1, 2]
+    assert index.search("tom", [1]) == [0, 1]
+
+    assert index.get_trigrams(1)["omm"] == [1]
+    index.refresh()
+    index.index_min_rows = 0
+    assert index.match(2, "202") == [0, 1]
+    while index._builders:
+        index._build_step()
+    assert index.match(2, "022") == [1]
+
+
+def test_data_table_filter_combines_with_sort():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30), "numeric"), ("Name", dp(30))],
+        row_data=[(str(i), f"Name {i % 3}") for i in range(30)],
+        rows_num=5,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+
+    table.sort_by([("No.", "DSC", "numeric")])
+    table.filter({"Name": "name 1"})
+    assert table_data.get_row_count() == 10
+    assert table_data.recycle_data[0]["text"] == "28"
+    assert table_data.recycle_data.get_row_id(2) == 25
+
+    table_data.select_all("down")
+    assert table_data.check_all("down")
+    assert len(table.get_row_checks()) == 10
+
+    # The selection of the hidden rows is kept.
+    table.filter({"Name": "name 2"})
+    assert table_data.check_all("normal")
+    table_data.select_all("down")
+    assert len(table.get_row_checks()) == 20
+    table_data.select_all("normal")
+    assert not table_data.check_all("down")
+    assert len(table.get_row_checks()) == 10
+    table.filter({"Name": "name 1"})
+    assert table_data.check_all("down")
+
+    table.search("2", ["No."])
+    assert [table_data.recycle_data[i]["text"] for i in (0, 2, 4)] == [
+        "29",
+        "28",
+        "27",
+    ]
+
+    table.add_row(("30", "Name 0"))
+    assert table_data.recycle_data[0]["text"] == "29"
+    table.search("")
+    assert table_data.get_row_count() == 31
+    assert table_data.recycle_data[0]["text"] == "30"
+
+
+def test_data_table_row_changes_keep_sort_and_filter_caches():
+    import random
+
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    names = iter(random.Random(4).sample(range(10000), 400))
+    table = MDDataTable(
+        column_data=[("No.", dp(30), "numeric"), ("Name", dp(30))],
+        row_data=[(str(next(names)), f"Name {i % 3}") for i in range(100)],
+        rows_num=10,
+    )
+    table_data = table.table_data
+    table.sort_by([("No.", "DSC", "numeric")])
+    table.filter({"Name": "name 1"})
+    sorter = table_data.get_sorter()
+    keys = sorter.get_keys(0, "numeric")
+
+    rng = random.Random(7)
+
+    def row():
+        return (str(next(names)), f"Name {rng.randrange(3)}")
+
+    for i in range(60):
+        count = len(table_data.get_row_store())
+        row_id = rng.randrange(count)
+        if i % 3 == 0:
+            table_data.insert_rows(rng.choice((row_id, count)), [row()])
+        elif i % 3 == 1:
+            table_data.remove_rows(row_id, 2)
+        else:
+            table_data.update_rows(row_id, [row(), row()])
+
+    # The cached keys were updated, not computed again.
+    assert sorter.get_keys(0, "numeric") is keys
+    view = list(table_data._view_indices)
+    filter_rows = list(table_data._filter_rows)
+    table_data._refresh_row_view()
+    assert view == table_data._view_indices
+    assert filter_rows == table_data._filter_rows
+
+
+def test_data_table_header_creates_visible_columns_only():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    column_data = [(f"Col {i}", dp(20)) for i in range(60)]
+    column_data[55] = ("Col 55", dp(20), "natural")
+    table = MDDataTable(
+        column_data=column_data,
+        row_data=[tuple(str(i) for i in range(60))],
+        size_hint=(None, None),
+        size=(dp(400), dp(400)),
+    )
+    header = table.header
+    header.width = dp(400)
+    assert len(header._header_cells) < 10
+    # The spacers keep the header as wide as the table rows.
+    assert sum(header.ids.header.cols_minimum.values()) == sum(
+        header.cols_minimum.values()
+    )
+
+    texts = {cell.text for cell in header._header_cells.values()}
+    table._scroll_with_header(table.table_data, 1)
+    assert 59 in header._header_cells
+    assert header._header_cells[59].text == "Col 59"
+    # The cells of the hidden columns are reused.
+    assert {cell.text for cell in header._free_cells}.isdisjoint(texts)
+    assert len(header._free_cells) + len(header._header_cells) < 20
+    assert header.get_sort_cells() == [header._header_cells[55]]
+
+
+def test_data_table_loads_rows_in_background():
+    from kivy.clock import Clock
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30)), ("Value", dp(30))],
+        row_data=[("old", "row")],
+        rows_num=10,
+    )
+    events = []
+    table.bind(
+        on_load_progress=lambda instance, loaded, total: events.append(
+            (loaded, total)
+        ),
+        on_load_complete=lambda instance: events.append("complete"),
+    )
+
+    loader = table.load_rows(
+        range(2500), formatter=lambda i: (str(i), f"{i / 2:.1f}")
+    )
+    loader._thread.join()
+    while not loader.done:
+        Clock.tick()
+    assert events[-2:] == [(2500, 2500), "complete"]
+    assert len(table.row_data) == 2500
+    assert table.table_data.recycle_data[3]["text"] == "0.5"
+
+    loader = table.load_rows(iter(range(5000)), chunk_size=100)
+    loader.cancel()
+    loader._thread.join()
+    Clock.tick()
+    assert loader.cancelled and loader.done
+    assert loader.total is None
+    assert table.table_data.row_count == loader.loaded == 0
+
+
+def test_row_loader_reads_ahead_a_few_chunks_and_reports_errors():
+    import time
+
+    from kivy.clock import Clock
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+
+    MDApp()
+    table = MDDataTable(column_data=[("No.", dp(30))], rows_num=10)
+    loader = table.load_rows(
+        iter(range(100000)), formatter=lambda i: (str(i),), chunk_size=10
+    )
+    time.sleep(0.2)
+    # The worker waits for the table instead of reading the whole input.
+    assert loader._chunks.qsize() == loader.max_queued_chunks
+    assert loader._thread.is_alive()
+    loader.cancel()
+    loader._thread.join(1)
+    assert not loader._thread.is_alive()
+
+    def read_rows():
+        yield from [(str(i),) for i in range(25)]
+        raise OSError("broken file")
+
+    errors = []
+    table.bind(on_load_error=lambda instance, error: errors.append(error))
+    loader = table.load_rows(read_rows(), chunk_size=10)
+    start = time.perf_counter()
+    while not loader.done and time.perf_counter() - start < 2:
+        Clock.tick()
+    assert isinstance(loader.error, OSError)
+    assert errors == [loader.error]
+    assert loader.loaded == 20
+
+
+def test_table_pages_are_computed_without_copying_rows():
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.store import TablePages
+
+    pages = TablePages(list(range(23)), 10)
+    assert len(pages) == 3
+    assert list(pages[-1]) == [20, 21, 22]
+    assert pages[1][-1] == 19
+    assert pages.get_page_bounds(2) == (20, 23)
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30))],
+        row_data=[(str(i),) for i in range(5000)],
+        rows_num=10,
+        use_pagination=True,
+    )
+    table_data = table.table_data
+    assert len(table_data._row_data_parts) == 500
+    table_data.rows_num = 100
+    assert len(table_data._row_data_parts) == table_data.get_page_count() == 50
+    assert table._get_rows_per_page_options() == [
+        10,
+        20,
+        30,
+        40,
+        50,
+        100,
+        200,
+        500,
+        1000,
+        2000,
+    ]
+
+
+def test_data_table_csv_import_and_export(tmp_path):
+    from kivy.clock import Clock
+    from kivy.metrics import dp
+
+    from kivymd.app import MDApp
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.files import read_csv_rows
+
+    path = tmp_path / "rows.csv"
+    path.write_text(
+        "Name,Extra,No.\n" + "".join(f"n{i},x,{i}\n" for i in range(30)),
+        encoding="utf-8",
+    )
+    assert next(read_csv_rows(path, ["No.", "Name", "Missing"])) == (
+        "0",
+        "n0",
+        "",
+    )
+
+    MDApp()
+    table = MDDataTable(
+        column_data=[("No.", dp(30), "numeric"), ("Name", dp(30))],
+        rows_num=10,
+    )
+    loader = table.load_csv(path)
+    loader._thread.join()
+    while not loader.done:
+        Clock.tick()
+    assert table.row_data[29] == ("29", "n29")
+
+    table.sort_by([("No.", "DSC", "numeric")])
+    table.filter({"Name": "2"})
+    assert table.export_csv(tmp_path / "view.csv") == 12
+    lines = (tmp_path / "view.csv").read_text(encoding="utf-8").splitlines()
+    assert lines[:3] == ["No.,Name", "29,n29", "28,n28"]
+
+
+def test_data_table_arrow_round_trip(tmp_path):
+    import pytest
+
+    pytest.importorskip("pyarrow")
+    from kivymd.uix.datatables.files import read_arrow_rows, write_arrow_rows
+
+    path = str(tmp_path / "rows.arrow")
+    rows = [(str(i), f"n{i}") for i in range(25)]
+    assert write_arrow_rows(path, rows, ["No.", "Name"], batch_size=10) == 25
+    assert list(read_arrow_rows(path, ["Name", "No."], memory_map=True))[
+        24
+    ] == ("n24", "24")
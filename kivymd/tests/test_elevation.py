@@ -0,0 +1,201 @@
+def test_elevation_shader_source_is_cached():
+    from kivymd.uix.behaviors.elevation import ElevationShaderCache
+
+    ElevationShaderCache.clear()
+    ElevationShaderCache.reset_stats()
+
+    source = ElevationShaderCache.get_source()
+    assert "roundedBoxSDF" in source
+    assert ElevationShaderCache.get_source() is source
+
+    stats = ElevationShaderCache.get_stats()
+    assert stats["loads"] == 1
+    assert stats["hits"] == 1
+
+
+def test_elevation_manager_skips_unmoved_widgets():
+    from kivy.uix.widget import Widget
+
+    from kivymd.uix.behaviors.elevation import ElevationManager
+
+    class Elevated(Widget):
+        _baked_shadow = None
+        _shadow_batch = None
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.context = type("Context", (), {"use_parent_modelview": 0})
+            self.calls = 0
+
+        def update_window_position(self, *args):
+            self.calls += 1
+
+    manager = ElevationManager()
+    parent = Widget()
+    widget = Elevated()
+    parent.add_widget(widget)
+    manager.register(widget)
+
+    manager.update()
+    manager.update()
+    assert widget.calls == 1
+    assert manager.skips == 1
+
+    widget.x += 10
+    manager.update()
+    assert widget.calls == 2
+
+    # Clean widgets are skipped without computing the window position.
+    to_window_calls = []
+    widget.to_window = lambda *args: to_window_calls.append(args) or args
+    manager.update()
+    assert not to_window_calls
+
+    # Moved and reparented ancestors mark the widget as moved.
+    root = Widget()
+    root.add_widget(parent)
+    root.x += 5
+    manager.update()
+    assert len(to_window_calls) == 1
+    parent.remove_widget(widget)
+    Widget().add_widget(widget)
+    manager.update()
+    assert len(to_window_calls) == 2
+    # The former ancestors are unbound.
+    root.x += 5
+    manager.update()
+    assert len(to_window_calls) == 2
+
+    manager.unregister(widget)
+    assert not len(manager)
+    widget.parent.x += 5
+    manager.update()
+    assert len(to_window_calls) == 2
+
+
+def test_elevation_manager_coalesces_uniform_updates():
+    from kivymd.uix.behaviors.elevation import ElevationManager
+
+    class Elevated:
+        flushes = 0
+
+        def flush_uniforms(self):
+            self.flushes += 1
+
+    manager = ElevationManager()
+    widget = Elevated()
+    for _ in range(3):
+        manager.mark_dirty(widget)
+    manager.flush()
+
+    assert widget.flushes == 1
+    assert manager.coalesced_events == 2
+
+
+def test_shadow_texture_cache_is_bounded():
+    from kivymd.uix.behaviors.elevation import ShadowTextureCache
+
+    ShadowTextureCache.clear()
+    max_size = ShadowTextureCache.max_size
+    ShadowTextureCache.max_size = 2
+    try:
+        texture, border = ShadowTextureCache.get_texture(
+            [4, 4, 4, 4], 6, [0, 0, 0, 1]
+        )
+        assert texture.size == (2 * border + 1, 2 * border + 1)
+        assert ShadowTextureCache.get_texture(
+            [4, 4, 4, 4], 6, [0, 0, 0, 0.5]
+        ) == (texture, border)
+
+        ShadowTextureCache.get_texture([8, 8, 8, 8], 6, [0, 0, 0, 1])
+        ShadowTextureCache.get_texture([4, 4, 4, 4], 2, [0, 0, 0, 1])
+
+        stats = ShadowTextureCache.get_stats()
+        assert stats["size"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["evictions"] == 1
+    finally:
+        ShadowTextureCache.max_size = max_size
+        ShadowTextureCache.clear()
+
+
+def test_shadow_batch_behavior_draws_children_with_one_mesh():
+    from kivy.uix.boxlayout import BoxLayout
+
+    from kivymd.uix.behaviors import (
+        CommonElevationBehavior,
+        ShadowBatchBehavior,
+    )
+    from kivymd.uix.behaviors.elevation import elevation_manager
+
+    class ShadowBox(ShadowBatchBehavior, BoxLayout):
+        pass
+
+    box = ShadowBox()
+    children = [
+        CommonElevationBehavior(elevation=2, batched_shadow=True)
+        for _ in range(3)
+    ]
+    for child in children:
+        box.add_widget(child)
+    box.add_widget(CommonElevationBehavior(elevation=2))
+
+    for child in children:
+        child.after_init()
+    elevation_manager.flush()
+    box.update_shadow_batch()
+
+    fmt_size = sum(size for name, size, fmt in box.shadow_batch_fmt)
+    assert len(box._shadow_batch_mesh.vertices) == 3 * 4 * fmt_size
+    assert children[0].context not in children[0].canvas.before.children
+
+    box.remove_widget(children[0])
+    assert children[0].context in children[0].canvas.before.children
+
+
+def test_baked_shadow_keeps_the_canvas_color():
+    from kivy.graphics import Color, PopState, PushState
+
+    from kivymd.uix.behaviors import CommonElevationBehavior
+    from kivymd.uix.behaviors.elevation import elevation_manager
+
+    widget = CommonElevationBehavior(
+        elevation=0, shadow_render_mode="baked", size=(100, 50)
+    )
+    widget.after_init()
+    elevation_manager.flush()
+
+    instructions = widget._baked_shadow.children
+    assert isinstance(instructions[0], PushState)
+    assert isinstance(instructions[-1], PopState)
+    assert [
+        instruction.a
+        for instruction in instructions
+        if isinstance(instruction, Color)
+    ] == [1]
+    assert tuple(widget._baked_shadow_image.size) == (0, 0)
+
+    widget.elevation = 2
+    elevation_manager.flush()
+    assert widget._baked_shadow_image.size[0] > 100
+
+
+def test_shadow_texture_alpha_without_numpy(monkeypatch):
+    from kivymd.uix.behaviors import elevation
+    from kivymd.uix.behaviors.elevation import ShadowTextureCache
+
+    for radius, softness in (((4, 4, 4, 4), 6), ((12, 46, 12, 46), 8)):
+        border = int(max(radius) + 2 * softness) + 1
+        alpha = ShadowTextureCache.get_alpha(radius, softness, border)
+        assert len(alpha) == (2 * border + 1) ** 2
+        # Opaque center, transparent corners.
+        assert alpha[len(alpha) // 2] == 255
+        assert alpha[0] == 0
+
+        with monkeypatch.context() as patch:
+            patch.setattr(elevation, "numpy", None)
+            assert (
+                ShadowTextureCache.get_alpha(radius, softness, border)
+                == alpha
+            )
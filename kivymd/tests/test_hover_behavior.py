@@ -0,0 +1,98 @@
+def test_hover_manager_dispatches_only_changed_widgets():
+    from kivy.core.window import Window
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.widget import Widget
+
+    from kivymd.uix.behaviors import HoverBehavior
+    from kivymd.uix.behaviors.hover_behavior import hover_manager
+
+    calls = []
+
+    class HoverWidget(Widget, HoverBehavior):
+        def on_mouse_update(self, *args):
+            calls.append(self)
+            super().on_mouse_update(*args)
+
+    box = BoxLayout(size=(400, 100), size_hint=(None, None))
+    items = [HoverWidget() for _ in range(4)]
+    for item in items:
+        box.add_widget(item)
+    box.do_layout()
+    Window.add_widget(box)
+
+    try:
+        hover_manager.on_mouse_pos(Window, (50, 50))
+        assert items[0].hover_visible
+        assert calls == [items[0]]
+
+        calls.clear()
+        hover_manager.on_mouse_pos(Window, (350, 50))
+        assert not items[0].hover_visible
+        assert items[3].hover_visible
+        assert calls == [items[0], items[3]]
+    finally:
+        Window.remove_widget(box)
+
+
+def test_hover_manager_coalesces_pointer_events():
+    from kivy.core.window import Window
+
+    from kivymd.uix.behaviors.hover_behavior import HoverManager
+
+    manager = HoverManager()
+    manager.coalesce_events = True
+    for x in range(5):
+        manager.on_mouse_pos(Window, (x, 0))
+
+    assert manager.received == 5
+    assert manager.processed == 0
+    assert manager.coalesced == 4
+
+    manager._process_pending()
+    assert manager.processed == 1
+    assert manager._pending_pos is None
+
+
+def test_hover_manager_unbinds_ancestors():
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.relativelayout import RelativeLayout
+    from kivy.uix.widget import Widget
+
+    from kivymd.uix.behaviors import HoverBehavior
+    from kivymd.uix.behaviors.hover_behavior import HoverManager
+
+    class HoverWidget(Widget, HoverBehavior):
+        pass
+
+    def observers(ancestor):
+        # The callbacks of the manager.
+        return sum(
+            getattr(callback, "__name__", None) == "<lambda>"
+            for name in ("pos", "size", "parent")
+            for callback in ancestor.get_property_observers(name)
+        )
+
+    first = RelativeLayout()
+    second = RelativeLayout()
+    box = BoxLayout()
+    widget = HoverWidget()
+    manager = HoverManager()
+    manager.register(widget)
+    first.add_widget(widget)
+    manager._update_index()
+    assert set(manager._ancestors) == {first}
+    assert observers(first) == 3
+
+    # Moved to another tree: the bindings of the old ancestors are removed.
+    first.remove_widget(widget)
+    box.add_widget(second)
+    second.add_widget(widget)
+    manager._update_index()
+    assert set(manager._ancestors) == {second, box}
+    assert observers(first) == 0
+    assert observers(second) == 2
+    assert observers(box) == 1
+
+    manager.unregister(widget)
+    assert not manager._ancestors
+    assert not any(map(observers, (first, second, box)))
@@ -65,3 +65,104 @@ class ListTest(BaseTest):
                 )
             )
         )
+
+
+def test_recycle_list_reuses_item_views():
+    from kivy.clock import Clock
+
+    from kivymd.app import MDApp
+    from kivymd.uix.list import (
+        MDRecycleList,
+        RecycleOneLineAvatarIconListItem,
+        RecycleTwoLineListItem,
+    )
+
+    MDApp()
+    recycle_list = MDRecycleList(size_hint=(None, None), size=(400, 600))
+    recycle_list.data = [
+        {
+            "viewclass": "OneLineAvatarIconListItem",
+            "text": f"Item {i}",
+            "left_checkbox": i % 2 == 0,
+            "right_icon": "phone",
+        }
+        if i % 3
+        else {
+            "viewclass": "TwoLineListItem",
+            "text": f"Item {i}",
+            "secondary_text": "Secondary",
+        }
+        for i in range(10000)
+    ]
+    for _ in range(3):
+        Clock.tick()
+
+    layout = recycle_list.layout_manager
+    assert 0 < len(layout.children) < 20
+    assert {type(view) for view in layout.children} == {
+        RecycleOneLineAvatarIconListItem,
+        RecycleTwoLineListItem,
+    }
+    # The item heights are known without creating the views.
+    assert (
+        layout.view_opts[0]["size"][1] == RecycleTwoLineListItem._item_height
+    )
+    assert (
+        layout.view_opts[1]["size"][1]
+        == RecycleOneLineAvatarIconListItem._item_height
+    )
+
+    recycle_list.scroll_y = 0
+    for _ in range(3):
+        Clock.tick()
+    assert len(layout.children) < 20
+    view = next(
+        view
+        for view in layout.children
+        if isinstance(view, RecycleOneLineAvatarIconListItem)
+    )
+    assert view.text == recycle_list.data[view.index]["text"]
+    checkbox = view.ids._left_container.children[0]
+    assert checkbox.active == recycle_list.data[view.index]["left_checkbox"]
+    checkbox.active = not checkbox.active
+    assert recycle_list.data[view.index]["left_checkbox"] == checkbox.active
+
+    # The properties of the previous item are reset on reuse.
+    view.refresh_view_attrs(
+        recycle_list, 1, {"text": "Custom", "theme_text_color": "Custom"}
+    )
+    assert view.theme_text_color == "Custom"
+    assert not view.ids._left_container.children
+    view.refresh_view_attrs(recycle_list, 1, {"text": "Plain"})
+    assert view.theme_text_color == "Primary"
+
+
+def test_list_bulk_add_updates_height_once():
+    from kivymd.app import MDApp
+    from kivymd.uix.list import MDList, OneLineListItem
+
+    MDApp()
+    md_list = MDList()
+    heights = []
+    md_list.bind(height=lambda instance, value: heights.append(value))
+    start_height = md_list.height
+    items = [OneLineListItem(text=f"Item {i}") for i in range(50)]
+
+    md_list.bulk_add(items)
+    assert md_list.children == items[::-1]
+    assert len(heights) == 1
+    assert md_list.height == start_height + sum(item.height for item in items)
+
+    with md_list.batch():
+        md_list.remove_widget(items[0])
+        md_list.remove_widget(items[1])
+    assert len(heights) == 2
+    assert md_list.height == start_height + sum(
+        item.height for item in items[2:]
+    )
+
+    declarative_list = MDList(*items[:2])
+    assert declarative_list.children == items[1::-1]
+    assert declarative_list.height == MDList().height + sum(
+        item.height for item in items[:2]
+    )
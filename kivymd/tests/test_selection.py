@@ -0,0 +1,119 @@
+def test_selection_model_bitset():
+    from kivymd.uix.selection import SelectionModel
+
+    changes = []
+    selection = SelectionModel(100)
+    selection.bind(on_change=lambda instance, indices: changes.append(indices))
+    for index in (3, 64, 99):
+        selection.select(index)
+    selection.select(3)
+    assert selection.get_selected() == [3, 64, 99]
+    assert selection.selected_count == 3
+    assert changes == [[3], [64], [99]]
+
+    selection.resize(70)
+    assert selection.get_selected() == [3, 64]
+    assert selection.selected_count == 2
+
+    selection.select_all()
+    assert selection.selected_count == 70
+    assert selection.get_selected() == list(range(70))
+    selection.resize(200)
+    assert selection.is_selected(69) and not selection.is_selected(70)
+
+    selection.deselect(5)
+    assert selection.selected_count == 69
+    selection.clear()
+    assert selection.selected_count == 0
+    assert selection.get_selected() == []
+
+
+def test_recycle_selection_list_reflects_model():
+    from kivy.clock import Clock
+
+    from kivymd.app import MDApp
+    from kivymd.uix.selection import MDRecycleSelectionList
+
+    MDApp()
+    selection_list = MDRecycleSelectionList(
+        size_hint=(None, None), size=(400, 600)
+    )
+    selection_list.data = [
+        {"viewclass": "OneLineListItem", "text": f"Item {i}"}
+        for i in range(10000)
+    ]
+    for _ in range(3):
+        Clock.tick()
+
+    views = selection_list.view_adapter.views
+    assert 0 < len(views) < 20
+    assert selection_list.selection.count == 10000
+
+    selection_list.selected_all()
+    assert selection_list.selection.selected_count == 10000
+    assert selection_list.selected_mode
+    assert all(view.selected for view in views.values())
+
+    selection_list.unselected_all()
+    assert not selection_list.selected_mode
+    views[1].do_selected_item()
+    assert selection_list.selection.get_selected() == [1]
+    assert selection_list.get_selected_list_items()[0]["text"] == "Item 1"
+    assert selection_list.selected_mode
+    assert views[1].selected and not views[0].selected
+
+    # The reused views show the selection of their new items.
+    selection_list.scroll_y = 0
+    for _ in range(3):
+        Clock.tick()
+    views = selection_list.view_adapter.views
+    assert 1 not in views
+    assert not any(view.selected for view in views.values())
+    selection_list.scroll_y = 1
+    for _ in range(3):
+        Clock.tick()
+    views = selection_list.view_adapter.views
+    assert views[1].selected
+
+    views[1].do_unselected_item()
+    assert not selection_list.selected_mode
+
+
+def test_recycle_selection_list_clears_selection_of_moved_items():
+    from kivymd.app import MDApp
+    from kivymd.uix.selection import MDRecycleSelectionList
+
+    MDApp()
+    selection_list = MDRecycleSelectionList()
+    selection_list.data = [{"text": f"Item {i}"} for i in range(5)]
+    selection_list.selection.select(3)
+
+    # Appended items keep the selection.
+    selection_list.data.append({"text": "Item 5"})
+    assert selection_list.selection.count == 6
+    assert selection_list.get_selected_list_items()[0]["text"] == "Item 3"
+
+    # Inserted and removed items move the indices, replaced data has
+    # other items: the selection is cleared.
+    selection_list.data.insert(0, {"text": "New"})
+    assert selection_list.selection.get_selected() == []
+    assert not selection_list.selected_mode
+
+    selection_list.selection.select(2)
+    del selection_list.data[0]
+    assert selection_list.selection.get_selected() == []
+
+    selection_list.selection.select(2)
+    selection_list.data.extend([{"text": "Item 6"}])
+    assert selection_list.selection.get_selected() == [2]
+    selection_list.data[2] = {"text": "Replaced"}
+    assert selection_list.selection.get_selected() == []
+
+    selection_list.selection.select(2)
+    selection_list.data.reverse()
+    assert selection_list.selection.get_selected() == []
+
+    selection_list.selection.select(2)
+    selection_list.data = [{"text": f"Other {i}"} for i in range(5)]
+    assert selection_list.selection.get_selected() == []
+    assert selection_list.selection.count == 5
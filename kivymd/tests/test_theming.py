@@ -0,0 +1,285 @@
+def test_theme_colors_use_rgba_table():
+    from kivy.utils import get_color_from_hex
+
+    from kivymd.app import MDApp
+    from kivymd.color_definitions import colors, text_colors
+
+    theme_cls = MDApp().theme_cls
+    theme_cls.primary_palette = "Teal"
+    assert theme_cls.primary_color == get_color_from_hex(
+        colors["Teal"][theme_cls.primary_hue]
+    )
+    assert theme_cls.bg_normal == get_color_from_hex(
+        colors[theme_cls.theme_style]["Background"]
+    )
+    assert theme_cls.get_text_rgba("Teal", "500") == get_color_from_hex(
+        text_colors["Teal"]["500"]
+    )
+    # The returned colors are copies.
+    theme_cls.primary_color[0] = -1
+    assert theme_cls.primary_color[0] >= 0
+
+    custom_colors = dict(colors)
+    custom_colors["Teal"] = dict(colors["Teal"], **{"500": "FF0000"})
+    theme_cls.colors = custom_colors
+    assert theme_cls.get_rgba("Teal", "500") == [1.0, 0.0, 0.0, 1.0]
+    theme_cls.colors = colors
+
+
+def test_theme_transition_interpolates_in_one_callback(monkeypatch):
+    import time
+
+    import pytest
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+
+    import kivymd.theming_transition
+    from kivymd.app import MDApp
+    from kivymd.uix.boxlayout import MDBoxLayout
+    from kivymd.uix.label import MDLabel
+
+    theme_cls = MDApp().theme_cls
+    labels = [MDLabel(text=str(i)) for i in range(20)]
+    box = MDBoxLayout(*labels)
+    Window.add_widget(box)
+    transition = theme_cls.theme_transition
+    completed = []
+    transition.bind(on_complete=lambda instance: completed.append(True))
+    theme_cls.theme_style_switch_animation = True
+    theme_cls.theme_style_switch_animation_duration = 0.1
+
+    for numpy in (kivymd.theming_transition.numpy, None):
+        monkeypatch.setattr(kivymd.theming_transition, "numpy", numpy)
+        completed.clear()
+        theme_cls.theme_style = (
+            "Dark" if theme_cls.theme_style == "Light" else "Light"
+        )
+        assert transition.active
+        # One target per animated property, not per theme update.
+        assert len(transition._targets) == len(
+            {(widget.uid, name) for widget, name in transition._targets}
+        )
+        start = time.perf_counter()
+        while transition.active and time.perf_counter() - start < 2:
+            Clock.tick()
+        assert not transition.active
+        assert completed == [True]
+        assert all(label.color == theme_cls.text_color for label in labels)
+
+    label = labels[0]
+    transition.animate(label, 10, color=[1, 0, 0, 1])
+    transition.cancel(label)
+    assert not transition._targets
+    transition.animate(label, 0, color=[0, 1, 0, 1])
+    assert label.color == pytest.approx([0, 1, 0, 1])
+    theme_cls.theme_style_switch_animation = False
+    theme_cls.theme_style = "Light"
+    Window.remove_widget(box)
+
+
+def test_theme_batch_sets_the_final_values():
+    import pytest
+
+    from kivymd.app import MDApp
+
+    theme_cls = MDApp().theme_cls
+    theme_cls.primary_palette = "Blue"
+    theme_cls.primary_hue = "500"
+    theme_cls.accent_hue = "500"
+    palettes = []
+    colors = []
+    theme_cls.bind(
+        primary_palette=lambda instance, value: palettes.append(value),
+        primary_color=lambda instance, value: colors.append(value),
+    )
+
+    def on_hue(instance, value):
+        hues.append(value)
+
+    hues = []
+    theme_cls.fbind("primary_hue", on_hue)
+    theme_cls.fbind("accent_hue", on_hue)
+
+    def change_colors():
+        theme_cls.primary_palette = "Red"
+        theme_cls.primary_palette = "Green"
+        theme_cls.primary_hue = "700"
+        theme_cls.accent_hue = "700"
+        theme_cls.accent_hue = "500"
+
+    version = theme_cls.theme_version
+    theme_cls.observer_calls = 0
+    with theme_cls.batch():
+        with theme_cls.batch():
+            change_colors()
+        with pytest.raises(ValueError):
+            theme_cls.primary_palette = "Unknown"
+        # The values are held until the outermost transaction ends.
+        assert theme_cls.primary_palette == "Blue"
+        assert not palettes and not colors and not hues
+    assert theme_cls.theme_version == version + 1
+    assert palettes == ["Green"]
+    assert colors[-1] == theme_cls.get_rgba("Green", "700")
+    # The value that is set back is not dispatched.
+    assert hues == ["700"]
+    batched_calls = theme_cls.observer_calls
+    assert batched_calls
+
+    with theme_cls.batch():
+        theme_cls.primary_palette = "Blue"
+        theme_cls.primary_hue = "500"
+    theme_cls.observer_calls = 0
+    change_colors()
+    assert palettes[-2:] == ["Red", "Green"]
+    assert hues[-3:] == ["700", "700", "500"]
+    assert theme_cls.observer_calls > batched_calls
+
+
+def test_theme_options_are_dispatched_by_kivy():
+    from kivy.factory import Factory
+    from kivy.lang import Builder
+    from kivy.properties import OptionProperty
+
+    from kivymd.app import MDApp
+    from kivymd.color_definitions import palette
+    from kivymd.theming import ThemeManager
+
+    theme_cls = MDApp().theme_cls
+    theme_style = theme_cls.property("theme_style")
+    assert isinstance(theme_style, OptionProperty)
+    assert theme_style.options == ["Light", "Dark"]
+    assert theme_cls.property("primary_palette").options == palette
+
+    # A kv rule bound to several theme properties ends with the final values.
+    Builder.load_string(
+        """
+<ThemeOptionsLabel@MDLabel>:
+    text:
+        " ".join((self.theme_cls.theme_style, \
+        self.theme_cls.primary_palette, self.theme_cls.accent_hue))
+"""
+    )
+    theme_cls.theme_style = "Light"
+    label = Factory.ThemeOptionsLabel()
+    assert label.text == f"Light {theme_cls.primary_palette} 500"
+    with theme_cls.batch():
+        theme_cls.theme_style = "Dark"
+        theme_cls.primary_palette = "Red"
+        theme_cls.accent_hue = "700"
+    assert label.text == "Dark Red 700"
+    theme_cls.set_colors(
+        "Blue", "500", "200", "700", "Amber", "500", "200", "700"
+    )
+    assert label.text == "Dark Blue 500"
+    theme_cls.theme_style = "Light"
+
+    calls = []
+
+    class Manager(ThemeManager):
+        def on_theme_style(self, instance, value):
+            calls.append(("on_theme_style", value))
+
+    manager = Manager()
+    manager.fbind(
+        "theme_style", lambda instance, value: calls.append(("theme", value))
+    )
+    manager.fbind(
+        "primary_palette",
+        lambda instance, value: calls.append(("palette", value)),
+    )
+    with manager.batch():
+        manager.primary_palette = "Red"
+        manager.theme_style = "Dark"
+    # In the order of the assignments, the default handler first.
+    assert calls == [
+        ("palette", "Red"),
+        ("on_theme_style", "Dark"),
+        ("theme", "Dark"),
+    ]
+
+
+def test_theme_animation_skips_detached_widgets():
+    from kivy.core.window import Window
+
+    from kivymd.app import MDApp
+    from kivymd.uix.boxlayout import MDBoxLayout
+    from kivymd.uix.label import MDLabel
+    from kivymd.uix.screen import MDScreen
+
+    theme_cls = MDApp().theme_cls
+    theme_cls.theme_style = "Light"
+    theme_cls.theme_style_switch_animation = True
+    transition = theme_cls.theme_transition
+    shown = MDLabel()
+    hidden = MDLabel()
+    MDScreen(MDBoxLayout(hidden))
+    Window.add_widget(shown)
+
+    # By default, the detached widgets are animated too.
+    assert not theme_cls.defer_detached_updates
+    theme_cls.theme_style = "Dark"
+    animated = {widget for widget, name in transition._targets}
+    assert {shown, hidden} <= animated
+
+    theme_cls.defer_detached_updates = True
+    theme_cls.theme_style = "Light"
+    animated = {widget for widget, name in transition._targets}
+    assert shown in animated and hidden not in animated
+    assert hidden.color == theme_cls.text_color
+
+    transition.cancel(shown)
+    Window.remove_widget(shown)
+    theme_cls.defer_detached_updates = False
+    theme_cls.theme_style_switch_animation = False
+
+
+def test_contrast_text_colors_match_scalar_results(monkeypatch):
+    import kivymd.theming_dynamic_text
+    from kivymd.theming_dynamic_text import (
+        get_contrast_text_color,
+        get_contrast_text_colors,
+    )
+
+    colors = [
+        [i / 10, (i * 7 % 11) / 10, (i * 3 % 11) / 10, 1] for i in range(11)
+    ]
+    for use_color_brightness in (True, False):
+        expected = [
+            get_contrast_text_color(color, use_color_brightness)
+            for color in colors
+        ]
+        assert set(expected) == {(1, 1, 1, 1), (0, 0, 0, 1)}
+        for numpy in (kivymd.theming_dynamic_text.numpy, None):
+            monkeypatch.setattr(kivymd.theming_dynamic_text, "numpy", numpy)
+            assert (
+                get_contrast_text_colors(colors, use_color_brightness)
+                == expected
+            )
+    assert get_contrast_text_color([1, 1, 1, 1]) == (0, 0, 0, 1)
+    assert get_contrast_text_color([0, 0, 0, 0.5], False) == (1, 1, 1, 1)
+
+
+def test_theme_change_updates_kv_canvas_rules():
+    from kivy.core.window import Window
+
+    from kivymd.app import MDApp
+    from kivymd.uix.selectioncontrol import MDCheckbox
+    from kivymd.uix.textfield import MDTextField
+
+    theme_cls = MDApp().theme_cls
+    theme_cls.theme_style = "Light"
+    checkbox = MDCheckbox()
+    text_field = MDTextField()
+    Window.add_widget(checkbox)
+    Window.add_widget(text_field)
+
+    # The canvas rules of the widgets depend on the theme.
+    theme_cls.theme_style = "Dark"
+    with theme_cls.batch():
+        theme_cls.theme_style = "Light"
+        theme_cls.primary_palette = "Red"
+    assert checkbox.color_active == theme_cls.get_rgba("Red", "500")
+
+    Window.remove_widget(checkbox)
+    Window.remove_widget(text_field)
+    theme_cls.primary_palette = "Blue"
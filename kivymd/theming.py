@@ -212,7 +212,8 @@ respects, the theming stays as documented.
     dictionary :attr:`kivymd.color_definition.colors`.
 """
 
-from kivy.animation import Animation
+from contextlib import contextmanager
+
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.window import Window
@@ -228,11 +229,24 @@ from kivy.properties import (
     OptionProperty,
     StringProperty,
 )
+from kivy.uix.widget import Widget
 from kivy.utils import get_color_from_hex
 
-from kivymd.color_definitions import colors, hue, palette
+from kivymd.color_definitions import colors, hue, palette, text_colors
 from kivymd.font_definitions import theme_font_styles
 from kivymd.material_resources import DEVICE_IOS, DEVICE_TYPE
+from kivymd.theming_transition import ThemeTransition
+
+
+def _build_rgba_table(color_table: dict) -> dict:
+    # Converts the hex colors of the palettes to `rgba` tuples once.
+    return {
+        name: {
+            key: tuple(get_color_from_hex(value))
+            for key, value in hues.items()
+        }
+        for name, hues in color_table.items()
+    }
 
 
 class ThemeManager(EventDispatcher):
@@ -400,9 +414,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_primary_color(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.primary_palette][self.primary_hue]
-        )
+        return self.get_rgba(self.primary_palette, self.primary_hue)
 
     primary_color = AliasProperty(
         _get_primary_color, bind=("primary_palette", "primary_hue")
@@ -415,9 +427,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_primary_light(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.primary_palette][self.primary_light_hue]
-        )
+        return self.get_rgba(self.primary_palette, self.primary_light_hue)
 
     primary_light = AliasProperty(
         _get_primary_light, bind=("primary_palette", "primary_light_hue")
@@ -509,9 +519,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_primary_dark(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.primary_palette][self.primary_dark_hue]
-        )
+        return self.get_rgba(self.primary_palette, self.primary_dark_hue)
 
     primary_dark = AliasProperty(
         _get_primary_dark, bind=("primary_palette", "primary_dark_hue")
@@ -559,9 +567,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_accent_color(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.accent_palette][self.accent_hue]
-        )
+        return self.get_rgba(self.accent_palette, self.accent_hue)
 
     accent_color = AliasProperty(
         _get_accent_color, bind=["accent_palette", "accent_hue"]
@@ -575,9 +581,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_accent_light(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.accent_palette][self.accent_light_hue]
-        )
+        return self.get_rgba(self.accent_palette, self.accent_light_hue)
 
     accent_light = AliasProperty(
         _get_accent_light, bind=["accent_palette", "accent_light_hue"]
@@ -591,9 +595,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_accent_dark(self) -> list:
-        return get_color_from_hex(
-            self.colors[self.accent_palette][self.accent_dark_hue]
-        )
+        return self.get_rgba(self.accent_palette, self.accent_dark_hue)
 
     accent_dark = AliasProperty(
         _get_accent_dark, bind=["accent_palette", "accent_dark_hue"]
@@ -623,6 +625,30 @@ class ThemeManager(EventDispatcher):
     and defaults to `'M2'`.
     """
 
+    shadow_render_mode = OptionProperty("shader", options=["shader", "baked"])
+    """
+    The way the shadows of widgets with the elevation effect are rendered.
+    Available options are: `'shader'`, `'baked'`.
+
+    In the `'baked'` mode, shadows are rendered once into cached nine-patch
+    textures instead of being computed by the elevation shader for every pixel
+    on every frame. This is recommended for devices with software rendering.
+    The mode can be overridden for individual widgets, see
+    :attr:`~kivymd.uix.behaviors.elevation.CommonElevationBehavior.shadow_render_mode`.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        class Example(MDApp):
+            def build(self):
+                self.theme_cls.shadow_render_mode = "baked"
+                ...
+
+    :attr:`shadow_render_mode` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `'shader'`.
+    """
+
     theme_style_switch_animation = BooleanProperty(False)
     """
     Animate app colors when switching app color scheme ('Dark/light').
@@ -769,6 +795,19 @@ class ThemeManager(EventDispatcher):
     and defaults to `0.2`.
     """
 
+    theme_transition = ObjectProperty()
+    """
+    Driver of the color animations of :attr:`theme_style_switch_animation`:
+    the colors of all widgets are interpolated in one clock callback, see
+    :class:`~kivymd.theming_transition.ThemeTransition`.
+
+    .. versionadded:: 1.1.0
+
+    :attr:`theme_transition` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to a :class:`~kivymd.theming_transition.ThemeTransition`
+    object.
+    """
+
     theme_style = OptionProperty("Light", options=["Light", "Dark"])
     """
     App theme style.
@@ -840,11 +879,7 @@ class ThemeManager(EventDispatcher):
             return self.theme_style
 
     def _get_bg_darkest(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(self.colors["Light"]["StatusBar"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(self.colors["Dark"]["StatusBar"])
+        return self.get_rgba(self._get_theme_style(opposite), "StatusBar")
 
     bg_darkest = AliasProperty(_get_bg_darkest, bind=["theme_style"])
     """
@@ -942,11 +977,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_bg_dark(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(self.colors["Light"]["AppBar"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(self.colors["Dark"]["AppBar"])
+        return self.get_rgba(self._get_theme_style(opposite), "AppBar")
 
     bg_dark = AliasProperty(_get_bg_dark, bind=["theme_style"])
     """
@@ -971,11 +1002,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_bg_normal(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(self.colors["Light"]["Background"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(self.colors["Dark"]["Background"])
+        return self.get_rgba(self._get_theme_style(opposite), "Background")
 
     bg_normal = AliasProperty(_get_bg_normal, bind=["theme_style"])
     """
@@ -1000,11 +1027,7 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_bg_light(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(self.colors["Light"]["CardsDialogs"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(self.colors["Dark"]["CardsDialogs"])
+        return self.get_rgba(self._get_theme_style(opposite), "CardsDialogs")
 
     bg_light = AliasProperty(_get_bg_light, bind=["theme_style"])
     """"
@@ -1030,13 +1053,9 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_divider_color(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            color = get_color_from_hex("000000")
-        elif theme_style == "Dark":
-            color = get_color_from_hex("FFFFFF")
-        color[3] = 0.12
-        return color
+        if self._get_theme_style(opposite) == "Light":
+            return [0.0, 0.0, 0.0, 0.12]
+        return [1.0, 1.0, 1.0, 0.12]
 
     divider_color = AliasProperty(_get_divider_color, bind=["theme_style"])
     """
@@ -1103,13 +1122,9 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_text_color(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            color = get_color_from_hex("000000")
-            color[3] = 0.87
-        elif theme_style == "Dark":
-            color = get_color_from_hex("FFFFFF")
-        return color
+        if self._get_theme_style(opposite) == "Light":
+            return [0.0, 0.0, 0.0, 0.87]
+        return [1.0, 1.0, 1.0, 1.0]
 
     text_color = AliasProperty(_get_text_color, bind=["theme_style"])
     """
@@ -1135,14 +1150,9 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_secondary_text_color(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            color = get_color_from_hex("000000")
-            color[3] = 0.54
-        elif theme_style == "Dark":
-            color = get_color_from_hex("FFFFFF")
-            color[3] = 0.70
-        return color
+        if self._get_theme_style(opposite) == "Light":
+            return [0.0, 0.0, 0.0, 0.54]
+        return [1.0, 1.0, 1.0, 0.70]
 
     secondary_text_color = AliasProperty(
         _get_secondary_text_color, bind=["theme_style"]
@@ -1172,13 +1182,9 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_icon_color(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            color = get_color_from_hex("000000")
-            color[3] = 0.54
-        elif theme_style == "Dark":
-            color = get_color_from_hex("FFFFFF")
-        return color
+        if self._get_theme_style(opposite) == "Light":
+            return [0.0, 0.0, 0.0, 0.54]
+        return [1.0, 1.0, 1.0, 1.0]
 
     icon_color = AliasProperty(_get_icon_color, bind=["theme_style"])
     """
@@ -1204,14 +1210,9 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_disabled_hint_text_color(self, opposite: bool = False) -> list:
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            color = get_color_from_hex("000000")
-            color[3] = 0.38
-        elif theme_style == "Dark":
-            color = get_color_from_hex("FFFFFF")
-            color[3] = 0.50
-        return color
+        if self._get_theme_style(opposite) == "Light":
+            return [0.0, 0.0, 0.0, 0.38]
+        return [1.0, 1.0, 1.0, 0.50]
 
     disabled_hint_text_color = AliasProperty(
         _get_disabled_hint_text_color, bind=["theme_style"]
@@ -1242,7 +1243,7 @@ class ThemeManager(EventDispatcher):
 
     # Hardcoded because muh standard
     def _get_error_color(self) -> list:
-        return get_color_from_hex(self.colors["Red"]["A700"])
+        return self.get_rgba("Red", "A700")
 
     error_color = AliasProperty(_get_error_color, bind=["theme_style"])
     """
@@ -1333,17 +1334,11 @@ class ThemeManager(EventDispatcher):
 
     def set_clearcolor_by_theme_style(self, theme_style):
         if self.theme_style_switch_animation and self._set_clearcolor:
-            Animation(
-                clearcolor=get_color_from_hex(
-                    self.colors[theme_style]["Background"]
-                ),
-                d=self.theme_style_switch_animation_duration,
-                t="linear",
-            ).start(Window)
-        else:
-            Window.clearcolor = get_color_from_hex(
-                self.colors[theme_style]["Background"]
+            self.animate_colors(
+                Window, clearcolor=self.get_rgba(theme_style, "Background")
             )
+        else:
+            Window.clearcolor = self.get_rgba(theme_style, "Background")
             self._set_clearcolor = True
 
     # Font name, size (sp), always caps, letter spacing (sp).
@@ -1540,17 +1535,200 @@ class ThemeManager(EventDispatcher):
                     MainApp().run()
         """
 
-        self.primary_palette = primary_palette
-        self.primary_hue = primary_hue
-        self.primary_light_hue = primary_light_hue
-        self.primary_dark_hue = primary_dark_hue
-        self.accent_palette = accent_palette
-        self.accent_hue = accent_hue
-        self.accent_light_hue = accent_light_hue
-        self.accent_dark_hue = accent_dark_hue
+        with self.batch():
+            self.primary_palette = primary_palette
+            self.primary_hue = primary_hue
+            self.primary_light_hue = primary_light_hue
+            self.primary_dark_hue = primary_dark_hue
+            self.accent_palette = accent_palette
+            self.accent_hue = accent_hue
+            self.accent_light_hue = accent_light_hue
+            self.accent_dark_hue = accent_dark_hue
+
+    observer_calls = 0
+    """
+    Number of the observer calls caused by the changes of the
+    :attr:`theme_style`, :attr:`primary_palette`, :attr:`primary_hue`,
+    :attr:`primary_light_hue`, :attr:`primary_dark_hue`,
+    :attr:`accent_palette`, :attr:`accent_hue`, :attr:`accent_light_hue` and
+    :attr:`accent_dark_hue` properties and of the colors that depend on them.
+    Set it to `0` before a theme change to count the calls of the change.
+
+    .. versionadded:: 1.1.0
+    """
+
+    theme_version = 0
+    """
+    Number of the theme changes, it is incremented each time the changed
+    values of the properties listed in :attr:`observer_calls` are set (once
+    per :meth:`batch`).
+
+    .. versionadded:: 1.1.0
+    """
+
+    defer_detached_updates = BooleanProperty(False)
+    """
+    If `True`, :meth:`animate_colors` sets the final colors of the widgets
+    that are not in the window tree right away, e.g. of the screens of a
+    screen manager that are not displayed or of the closed dialogs. So the
+    theme switch animation interpolates the colors of the displayed widgets
+    only.
+
+    The theme changes are dispatched to all widgets in any case, the
+    detached widgets are never left with the colors of the previous theme.
+
+    .. versionadded:: 1.1.0
+
+    :attr:`defer_detached_updates` is an
+    :class:`~kivy.properties.BooleanProperty` and defaults to `False`.
+    """
+
+    # Properties whose assigned values are held by `batch`.
+    _batched_options = (
+        "theme_style",
+        "primary_palette",
+        "primary_hue",
+        "primary_light_hue",
+        "primary_dark_hue",
+        "accent_palette",
+        "accent_hue",
+        "accent_light_hue",
+        "accent_dark_hue",
+    )
+    _batch_depth = 0
+    _batch_values = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that groups the changes of the theme colors.
+
+        Inside the transaction, the values assigned to :attr:`theme_style`,
+        :attr:`primary_palette`, :attr:`primary_hue`, :attr:`primary_light_hue`,
+        :attr:`primary_dark_hue`, :attr:`accent_palette`, :attr:`accent_hue`,
+        :attr:`accent_light_hue` and :attr:`accent_dark_hue` are validated
+        and held, the properties keep their current values. When the
+        outermost transaction ends, the last value of each property is set,
+        in the order of the first assignments, and the changes are
+        dispatched as usual. So the observers are not called for the
+        intermediate values and for the values that are set back:
+
+        .. code-block:: python
+
+            with self.theme_cls.batch():
+                self.theme_cls.primary_palette = "Teal"
+                self.theme_cls.primary_hue = "700"
+
+        .. versionadded:: 1.1.0
+        """
+
+        if not self._batch_depth:
+            self._batch_values = {}
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                values, self._batch_values = self._batch_values, None
+                self._set_options(values)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in self._batched_options:
+            options = self.property(name).options
+            if value not in options:
+                raise ValueError(
+                    f"{self.__class__.__name__}.{name} is set to an invalid "
+                    f"option {value!r}. Must be one of: {list(options)}"
+                )
+            with self.batch():
+                self._batch_values[name] = value
+        else:
+            super().__setattr__(name, value)
+
+    def _set_options(self, values: dict) -> None:
+        changed = [
+            (name, value)
+            for name, value in values.items()
+            if getattr(self, name) != value
+        ]
+        if changed:
+            self.theme_version += 1
+            for name, value in changed:
+                super().__setattr__(name, value)
+
+    def _count_observers(self, name: str, instance, value) -> None:
+        # Observer of the theme options and of the colors, except for itself.
+        self.observer_calls += len(self.get_property_observers(name)) - 1
+
+    # Colors of `colors` and `text_colors` in `rgba` format.
+    _rgba_colors = None
+    _rgba_table = None
+    _text_rgba_table = None
+
+    def animate_colors(self, widget, **values) -> None:
+        """
+        Animates the `values` color properties of the `widget` widget for
+        :attr:`theme_style_switch_animation_duration` with
+        :attr:`theme_transition`, e.g.
+        ``animate_colors(label, color=self.text_color)``.
+
+        See :attr:`defer_detached_updates`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        duration = self.theme_style_switch_animation_duration
+        if (
+            self.defer_detached_updates
+            and isinstance(widget, Widget)
+            and widget.get_root_window() is None
+        ):
+            duration = 0
+        self.theme_transition.animate(widget, duration, **values)
+
+    def get_rgba(self, palette: str, hue: str) -> list:
+        """
+        Returns the color of the `hue` hue of the `palette` palette of
+        :attr:`colors` in ``rgba`` format, e.g. ``get_rgba("Red", "500")``
+        or ``get_rgba("Light", "Background")``.
+
+        The hex values are converted once; the table is rebuilt when
+        :attr:`colors` is replaced.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._rgba_colors is not self.colors:
+            self._rgba_table = _build_rgba_table(self.colors)
+            self._rgba_colors = self.colors
+        return list(self._rgba_table[palette][hue])
+
+    def get_text_rgba(self, palette: str, hue: str) -> list:
+        """
+        Returns the text color for the `hue` hue of the `palette` palette
+        (see :data:`~kivymd.color_definitions.text_colors`) in ``rgba``
+        format.
+
+        .. versionadded:: 1.1.0
+        """
+
+        table = ThemeManager._text_rgba_table
+        if table is None:
+            table = ThemeManager._text_rgba_table = _build_rgba_table(
+                text_colors
+            )
+        return list(table[palette][hue])
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        for name, prop in self.properties().items():
+            if name in self._batched_options or isinstance(
+                prop, AliasProperty
+            ):
+                self.fbind(name, self._count_observers, name)
+        if self.theme_transition is None:
+            self.theme_transition = ThemeTransition()
         Clock.schedule_once(lambda x: self.on_theme_style(0, self.theme_style))
         self._determine_device_orientation(None, Window.size)
         Window.bind(size=self._determine_device_orientation)
@@ -13,8 +13,38 @@ Preliminary testing suggests color brightness more closely matches the
 `Material Design spec` suggested text colors, but the alternative implementation
 is both newer and the current 'correct' recommendation, so is included here
 as an option.
+
+.. versionadded:: 1.1.0
+
+The contrast colors of all palette hues of
+:data:`~kivymd.color_definitions.colors` are computed once and the recent
+results are memoized. The colors are rounded to 8 bits per channel before
+the computation. :func:`get_contrast_text_colors` computes the contrast
+colors of many colors at once (with `NumPy <https://numpy.org>`_, if it is
+installed):
+
+.. code-block:: python
+
+    legend_colors = get_contrast_text_colors(series_colors)
 """
 
+__all__ = ("get_contrast_text_color", "get_contrast_text_colors")
+
+from functools import lru_cache
+from typing import Sequence
+
+from kivy.utils import get_color_from_hex
+
+from kivymd.color_definitions import colors as palette_colors
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_WHITE = (1, 1, 1, 1)
+_BLACK = (0, 0, 0, 1)
+
 
 def _color_brightness(color):
     # Implementation of color brightness method
@@ -54,15 +84,91 @@ def _black_or_white_by_contrast_ratio(color):
     return "white" if w_contrast >= b_contrast else "black"
 
 
-def get_contrast_text_color(color, use_color_brightness=True):
+def _get_color_key(color) -> tuple:
+    # Rounds the `rgb` channels to 8 bits, the alpha channel does not
+    # change the contrast color.
+    return round(color[0] * 255), round(color[1] * 255), round(color[2] * 255)
+
+
+def _compute_contrast_text_color(color, use_color_brightness: bool) -> tuple:
     if use_color_brightness:
         contrast_color = _black_or_white_by_color_brightness(color)
     else:
         contrast_color = _black_or_white_by_contrast_ratio(color)
-    if contrast_color == "white":
-        return 1, 1, 1, 1
+    return _WHITE if contrast_color == "white" else _BLACK
+
+
+# Contrast colors of the palette hues by the color key: the colors by the
+# color brightness and by the contrast ratio.
+_palette_table = None
+
+
+def _get_palette_table() -> dict:
+    global _palette_table
+
+    if _palette_table is None:
+        _palette_table = {}
+        for hues in palette_colors.values():
+            for hex_color in hues.values():
+                if not hex_color:
+                    continue
+                key = _get_color_key(get_color_from_hex(hex_color))
+                color = [channel / 255 for channel in key]
+                _palette_table[key] = (
+                    _compute_contrast_text_color(color, True),
+                    _compute_contrast_text_color(color, False),
+                )
+    return _palette_table
+
+
+# The memo is keyed by the channels as they are, the rounding costs as much
+# as the computation, so it is done on a miss only.
+@lru_cache(maxsize=1024)
+def _get_memoized_contrast_text_color(
+    red: float, green: float, blue: float, use_color_brightness: bool
+) -> tuple:
+    key = _get_color_key((red, green, blue))
+    contrast_colors = _get_palette_table().get(key)
+    if contrast_colors is not None:
+        return contrast_colors[0 if use_color_brightness else 1]
+    return _compute_contrast_text_color(
+        [channel / 255 for channel in key], use_color_brightness
+    )
+
+
+def get_contrast_text_color(color, use_color_brightness=True):
+    return _get_memoized_contrast_text_color(
+        color[0], color[1], color[2], use_color_brightness
+    )
+
+
+def get_contrast_text_colors(
+    colors: Sequence, use_color_brightness: bool = True
+) -> list:
+    """
+    Returns the list of the contrast text colors of the `colors` colors,
+    e.g. of the series of a chart.
+
+    .. versionadded:: 1.1.0
+    """
+
+    if numpy is None:
+        return [
+            get_contrast_text_color(color, use_color_brightness)
+            for color in colors
+        ]
+
+    rgb = numpy.asarray(colors, dtype=float)[..., :3].reshape(-1, 3)
+    rgb = numpy.round(rgb * 255) / 255
+    if use_color_brightness:
+        white = rgb @ numpy.array([299, 587, 114]) < 500
     else:
-        return 0, 0, 0, 1
+        rgb = numpy.where(
+            rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4
+        )
+        luminance = rgb @ numpy.array([0.2126, 0.7152, 0.0722])
+        white = 1.05 / (luminance + 0.05) >= (luminance + 0.05) / 0.05
+    return [_WHITE if is_white else _BLACK for is_white in white.tolist()]
 
 
 if __name__ == "__main__":
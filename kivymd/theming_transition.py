@@ -0,0 +1,209 @@
+"""
+Theming Transition
+==================
+
+.. versionadded:: 1.1.0
+
+Animation of the widget colors when the theme is switched with
+:attr:`~kivymd.theming.ThemeManager.theme_style_switch_animation` enabled.
+
+Instead of one :class:`~kivy.animation.Animation` per widget,
+:class:`ThemeTransition` records the `(widget, property, from, to)` targets
+in flat arrays and interpolates all of them in one clock callback (with
+`NumPy <https://numpy.org>`_, if it is installed). When all targets reach
+their values, the `on_complete` event is dispatched once:
+
+.. code-block:: python
+
+    self.theme_cls.theme_transition.bind(
+        on_complete=lambda *args: print("The theme is switched")
+    )
+    self.theme_cls.theme_style = "Dark"
+"""
+
+__all__ = ("ThemeTransition",)
+
+from array import array
+from functools import partial
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _is_rgba(value) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) == 4
+
+
+class ThemeTransition(EventDispatcher):
+    """
+    Linear color transition of many widgets driven by one clock callback.
+
+    :Events:
+        `on_complete`
+            Called when all targets reached their values.
+    """
+
+    def __init__(self, **kwargs):
+        self.register_event_type("on_complete")
+        super().__init__(**kwargs)
+        self._targets = []
+        # Position of each (widget uid, property name) in the arrays.
+        self._index = {}
+        # Per target: four start and four end color values.
+        self._values = array("d")
+        # Per target: start time and duration.
+        self._times = array("d")
+        self._pending = []
+        self._updating = False
+        self._event = None
+
+    @property
+    def active(self) -> bool:
+        """`True` while the transition is running."""
+
+        return self._event is not None
+
+    def animate(self, widget, duration: float, **values) -> None:
+        """
+        Animates the `values` color properties of the `widget` widget from
+        their current values, e.g. ``animate(label, 0.2, color=[1, 1, 1, 1])``.
+        A target that is animated again starts from its current value.
+        """
+
+        if self._updating:
+            # Called from a property callback during the update.
+            self._pending.append(
+                partial(self.animate, widget, duration, **values)
+            )
+            return
+
+        now = Clock.get_time()
+        for name, value in values.items():
+            start = getattr(widget, name)
+            if duration <= 0 or not _is_rgba(value) or not _is_rgba(start):
+                self.cancel(widget, name)
+                setattr(widget, name, value)
+                continue
+
+            key = (widget.uid, name)
+            index = self._index.get(key)
+            if index is None:
+                self._index[key] = len(self._targets)
+                self._targets.append((widget, name))
+                self._values.extend(start)
+                self._values.extend(value)
+                self._times.extend((now, duration))
+            else:
+                self._values[index * 8 : index * 8 + 8] = array(
+                    "d", [*start, *value]
+                )
+                self._times[index * 2 : index * 2 + 2] = array(
+                    "d", (now, duration)
+                )
+
+        if self._targets and self._event is None:
+            self._event = Clock.schedule_interval(self._update, 0)
+
+    def cancel(self, widget, *names) -> None:
+        """
+        Stops the transition of the `names` properties (all properties by
+        default) of the `widget` widget.
+        """
+
+        if self._updating:
+            self._pending.append(partial(self.cancel, widget, *names))
+            return
+
+        uid = widget.uid
+        self._remove(
+            [
+                index
+                for (target_uid, name), index in self._index.items()
+                if target_uid == uid and (not names or name in names)
+            ]
+        )
+
+    def on_complete(self, *args) -> None:
+        """Called when all targets reached their values."""
+
+    def _update(self, *args) -> None:
+        now = Clock.get_time()
+        count = len(self._targets)
+        if not count:
+            colors = finished = []
+        elif numpy is not None:
+            values = numpy.frombuffer(self._values).reshape(count, 2, 4)
+            times = numpy.frombuffer(self._times).reshape(count, 2)
+            progress = numpy.clip((now - times[:, 0]) / times[:, 1], 0, 1)
+            colors = values[:, 0] + (values[:, 1] - values[:, 0]) * (
+                progress[:, None]
+            )
+            finished = progress >= 1
+            colors[finished] = values[finished, 1]
+            colors = colors.tolist()
+            finished = numpy.flatnonzero(finished).tolist()
+            # Releases the buffers of the arrays.
+            del values, times
+        else:
+            colors = []
+            finished = []
+            all_values = self._values
+            times = self._times
+            for index in range(count):
+                offset = index * 8
+                progress = (now - times[index * 2]) / times[index * 2 + 1]
+                if progress >= 1:
+                    colors.append(all_values[offset + 4 : offset + 8].tolist())
+                    finished.append(index)
+                    continue
+                progress = max(progress, 0)
+                colors.append(
+                    [
+                        start + (end - start) * progress
+                        for start, end in zip(
+                            all_values[offset : offset + 4],
+                            all_values[offset + 4 : offset + 8],
+                        )
+                    ]
+                )
+
+        self._updating = True
+        try:
+            for (widget, name), color in zip(self._targets, colors):
+                setattr(widget, name, color)
+        finally:
+            self._updating = False
+        self._remove(finished)
+
+        pending, self._pending = self._pending, []
+        for callback in pending:
+            callback()
+
+        if not self._targets:
+            self._event.cancel()
+            self._event = None
+            self.dispatch("on_complete")
+
+    def _remove(self, indices: list) -> None:
+        # Removes the targets and compacts the arrays.
+        if not indices:
+            return
+        removed = set(indices)
+        kept = [i for i in range(len(self._targets)) if i not in removed]
+        values = self._values
+        times = self._times
+        self._targets = [self._targets[i] for i in kept]
+        self._values = array("d")
+        self._times = array("d")
+        for i in kept:
+            self._values.extend(values[i * 8 : i * 8 + 8])
+            self._times.extend(times[i * 2 : i * 2 + 2])
+        self._index = {
+            (widget.uid, name): position
+            for position, (widget, name) in enumerate(self._targets)
+        }
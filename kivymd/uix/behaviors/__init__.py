@@ -19,6 +19,7 @@ from .elevation import (
     FakeRectangularElevationBehavior,
     RectangularElevationBehavior,
     RoundedRectangularElevationBehavior,
+    ShadowBatchBehavior,
 )
 from .magic_behavior import MagicBehavior
 from .ripple_behavior import CircularRippleBehavior, RectangularRippleBehavior
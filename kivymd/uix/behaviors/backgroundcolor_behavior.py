@@ -9,7 +9,6 @@ __all__ = ("BackgroundColorBehavior", "SpecificBackgroundColorBehavior")
 
 from typing import List, Union
 
-from kivy.animation import Animation
 from kivy.lang import Builder
 from kivy.properties import (
     ColorProperty,
@@ -164,11 +163,7 @@ class BackgroundColorBehavior:
             hasattr(self, "theme_cls")
             and self.theme_cls.theme_style_switch_animation
         ):
-            Animation(
-                _md_bg_color=color,
-                d=self.theme_cls.theme_style_switch_animation_duration,
-                t="linear",
-            ).start(self)
+            self.theme_cls.animate_colors(self, _md_bg_color=color)
         else:
             self._md_bg_color = color
 
@@ -251,12 +246,11 @@ class SpecificBackgroundColorBehavior(BackgroundColorBehavior):
             hasattr(self, "theme_cls")
             and self.theme_cls.theme_style_switch_animation
         ):
-            Animation(
+            self.theme_cls.animate_colors(
+                self,
                 specific_text_color=color,
                 specific_secondary_text_color=secondary_color,
-                d=self.theme_cls.theme_style_switch_animation_duration,
-                t="linear",
-            ).start(self)
+            )
         else:
             self.specific_text_color = color
             self.specific_secondary_text_color = secondary_color
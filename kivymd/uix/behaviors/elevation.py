@@ -358,14 +358,33 @@ __all__ = (
     "RoundedRectangularElevationBehavior",
     "FakeRectangularElevationBehavior",
     "FakeCircularElevationBehavior",
+    "ElevationShaderCache",
+    "ElevationManager",
+    "ShadowTextureCache",
+    "ShadowBatchBehavior",
 )
 
+import math
 import os
+import time
+import weakref
+from collections import OrderedDict
 
 from kivy import Logger
+from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.graphics import RenderContext, RoundedRectangle
+from kivy.graphics import (
+    BorderImage,
+    Color,
+    InstructionGroup,
+    Mesh,
+    PopState,
+    PushState,
+    RenderContext,
+    RoundedRectangle,
+)
+from kivy.graphics.texture import Texture
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
@@ -374,12 +393,552 @@ from kivy.properties import (
     ListProperty,
     NumericProperty,
     ObjectProperty,
+    OptionProperty,
     VariableListProperty,
 )
 from kivy.uix.widget import Widget
 
 from kivymd import glsl_path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ElevationShaderCache:
+    """
+    Process-wide cache of the elevation shader.
+
+    The GLSL source of the shader is read from the
+    `kivymd/data/glsl/elevation` directory only once and is shared by all
+    widgets with the elevation effect. Kivy does not allow several
+    :class:`~kivy.graphics.RenderContext` objects to share one program
+    object, so every context still links the cached source, but only once
+    and without re-reading the files.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        from kivymd.uix.behaviors.elevation import ElevationShaderCache
+
+        print(ElevationShaderCache.get_stats())
+        # {'loads': 1, 'hits': 299, 'compiles': 300, 'compile_time': 0.152}
+    """
+
+    shader_files = ["header.frag", "elevation.frag", "main.frag"]
+    """Shader files from which the source of the fragment shader is built."""
+
+    loads = 0
+    """Number of times the shader source has been read from disk."""
+
+    hits = 0
+    """Number of requests for the shader source served from the cache."""
+
+    compiles = 0
+    """Number of shader compilations."""
+
+    compile_time = 0.0
+    """Total time in seconds spent on shader compilations."""
+
+    _source = ""
+    _batch_sources = ()
+
+    @classmethod
+    def get_source(cls) -> str:
+        """Returns the source of the elevation fragment shader."""
+
+        if cls._source:
+            cls.hits += 1
+            return cls._source
+
+        cls._source = cls._read(cls.shader_files)
+        return cls._source
+
+    @classmethod
+    def get_batch_sources(cls) -> tuple[str, str]:
+        """
+        Returns the sources of the vertex and fragment shaders of
+        the :class:`~ShadowBatchBehavior` class.
+        """
+
+        if cls._batch_sources:
+            cls.hits += 1
+            return cls._batch_sources
+
+        cls._batch_sources = (
+            cls._read(["batch.vert"]),
+            cls._read(["batch.frag"]),
+        )
+        return cls._batch_sources
+
+    @classmethod
+    def _read(cls, names: list) -> str:
+        shader_string = ""
+        for name_file in names:
+            with open(
+                os.path.join(glsl_path, "elevation", name_file),
+                encoding="utf-8",
+            ) as file:
+                shader_string += f"{file.read()}\n\n"
+
+        cls.loads += 1
+        return shader_string
+
+    @classmethod
+    def create_context(cls, **kwargs) -> RenderContext:
+        """
+        Creates a :class:`~kivy.graphics.RenderContext` with the elevation
+        shader already compiled.
+        """
+
+        source = cls.get_source()
+        start = time.perf_counter()
+        context = RenderContext(fs=source, **kwargs)
+        cls.compile_time += time.perf_counter() - start
+        cls.compiles += 1
+        return context
+
+    @classmethod
+    def apply(cls, context: RenderContext) -> None:
+        """
+        Sets the elevation shader to the context if it does not
+        already use it.
+        """
+
+        source = cls.get_source()
+        if context.shader.fs == source:
+            return
+
+        start = time.perf_counter()
+        context.shader.fs = source
+        cls.compile_time += time.perf_counter() - start
+        cls.compiles += 1
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """Returns the cache counters."""
+
+        return {
+            "loads": cls.loads,
+            "hits": cls.hits,
+            "compiles": cls.compiles,
+            "compile_time": cls.compile_time,
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Resets the cache counters."""
+
+        cls.loads = 0
+        cls.hits = 0
+        cls.compiles = 0
+        cls.compile_time = 0.0
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Clears the cached source. The shader files will be read again on the
+        next request.
+        """
+
+        cls._source = ""
+        cls._batch_sources = ()
+
+
+class ShadowTextureCache:
+    """
+    Bounded LRU cache of baked shadow textures used by the `'baked'` shadow
+    render mode (see :attr:`CommonElevationBehavior.shadow_render_mode`).
+
+    A shadow is rendered once on the CPU into a small nine-patch texture with
+    the same rounded box SDF as the elevation shader, and is then drawn with
+    a plain textured :class:`~kivy.graphics.BorderImage`. Textures are keyed
+    by the shadow radius, softness and color. The elevation only changes the
+    size of the stretched nine-patch, so it is not a part of the key.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        from kivymd.uix.behaviors.elevation import ShadowTextureCache
+
+        ShadowTextureCache.max_size = 128
+        print(ShadowTextureCache.get_stats())
+        # {'size': 3, 'hits': 297, 'misses': 3, 'evictions': 0}
+    """
+
+    max_size = 64
+    """Maximum number of textures kept in the cache."""
+
+    hits = 0
+    """Number of textures served from the cache."""
+
+    misses = 0
+    """Number of baked textures."""
+
+    evictions = 0
+    """Number of textures evicted from the cache."""
+
+    _textures = OrderedDict()
+
+    @classmethod
+    def get_key(cls, radius: list, softness: float, color: list) -> tuple:
+        """Returns the cache key for the shadow parameters."""
+
+        return (
+            tuple(round(float(value), 1) for value in radius),
+            round(float(softness), 1),
+            tuple(round(float(value), 3) for value in color[:3]),
+        )
+
+    @classmethod
+    def get_texture(
+        cls, radius: list, softness: float, color: list
+    ) -> tuple[Texture, int]:
+        """
+        Returns the baked shadow texture and the size of its nine-patch
+        border in pixels.
+
+        :param radius: ['top-right', 'bot-right', 'top-left', 'bot-left']
+        """
+
+        key = cls.get_key(radius, softness, color)
+        textures = cls._textures
+        if key in textures:
+            textures.move_to_end(key)
+            cls.hits += 1
+            return textures[key]
+
+        cls.misses += 1
+        textures[key] = cls.bake(*key)
+        while len(textures) > cls.max_size:
+            textures.popitem(last=False)
+            cls.evictions += 1
+        return textures[key]
+
+    @classmethod
+    def bake(
+        cls, radius: tuple, softness: float, color: tuple
+    ) -> tuple[Texture, int]:
+        """Renders the shadow into a new nine-patch texture."""
+
+        border = int(math.ceil(max(radius) + 2 * softness)) + 1
+        size = 2 * border + 1
+        red, green, blue = (int(value * 255) for value in color)
+
+        buf = bytearray(size * size * 4)
+        buf[0::4] = bytes((red,)) * (size * size)
+        buf[1::4] = bytes((green,)) * (size * size)
+        buf[2::4] = bytes((blue,)) * (size * size)
+        buf[3::4] = cls.get_alpha(radius, softness, border)
+
+        buf = bytes(buf)
+        texture = Texture.create(size=(size, size), colorfmt="rgba")
+        texture.blit_buffer(buf, colorfmt="rgba", bufferfmt="ubyte")
+        # The content of the texture must be restored after the loss of the
+        # OpenGL context (for example, on Android when resuming the app).
+        texture.add_reload_observer(
+            lambda texture: texture.blit_buffer(
+                buf, colorfmt="rgba", bufferfmt="ubyte"
+            )
+        )
+        return texture, border
+
+    @classmethod
+    def get_alpha(cls, radius: tuple, softness: float, border: int) -> bytes:
+        """
+        Returns the alpha channel of the shadow texture with the `border`
+        border, one byte per pixel. Computed with NumPy if it is installed,
+        otherwise one quadrant is computed per corner radius and mirrored.
+        """
+
+        half_size = border + 0.5
+        if numpy is not None:
+            # The pixel centers relative to the texture center.
+            coords = numpy.arange(2 * border + 1, dtype=float) - border
+            px, py = coords[None, :], coords[:, None]
+            # Same corner order as in the `roundedBoxSDF` shader function.
+            r = numpy.where(
+                px > 0,
+                numpy.where(py > 0, radius[0], radius[1]),
+                numpy.where(py > 0, radius[2], radius[3]),
+            )
+            qx = numpy.abs(px) - (half_size - softness) + r
+            qy = numpy.abs(py) - (half_size - softness) + r
+            distance = (
+                numpy.minimum(numpy.maximum(qx, qy), 0.0)
+                + numpy.hypot(numpy.maximum(qx, 0.0), numpy.maximum(qy, 0.0))
+                - r
+            )
+            if softness:
+                t = numpy.clip((distance + softness) / (2 * softness), 0, 1)
+                alpha = 1.0 - t * t * (3.0 - 2.0 * t)
+            else:
+                alpha = (distance <= 0).astype(float)
+            return (alpha * 255).astype(numpy.uint8).tobytes()
+
+        # The shadow is symmetric inside a quadrant: the rows of a quadrant
+        # are computed once per radius for the distances 0..border from the
+        # center and mirrored.
+        quadrants = {}
+
+        def get_quadrant(r: float) -> list:
+            if r not in quadrants:
+                rows = quadrants[r] = []
+                for ay in range(border + 1):
+                    qy = ay - (half_size - softness) + r
+                    row = bytearray(border + 1)
+                    for ax in range(border + 1):
+                        qx = ax - (half_size - softness) + r
+                        distance = (
+                            min(max(qx, qy), 0.0)
+                            + math.hypot(max(qx, 0.0), max(qy, 0.0))
+                            - r
+                        )
+                        if softness:
+                            t = min(
+                                max(
+                                    (distance + softness) / (2 * softness),
+                                    0.0,
+                                ),
+                                1.0,
+                            )
+                            row[ax] = int((1.0 - t * t * (3.0 - 2.0 * t)) * 255)
+                        else:
+                            row[ax] = 255 if distance <= 0 else 0
+                    rows.append(bytes(row))
+            return quadrants[r]
+
+        alpha = bytearray()
+        for y in range(2 * border + 1):
+            py = y - border
+            if py > 0:
+                right, left = get_quadrant(radius[0]), get_quadrant(radius[2])
+            else:
+                right, left = get_quadrant(radius[1]), get_quadrant(radius[3])
+            alpha += left[abs(py)][::-1]
+            alpha += right[abs(py)][1:]
+        return bytes(alpha)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """Returns the cache counters."""
+
+        return {
+            "size": len(cls._textures),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Removes all textures from the cache and resets the counters."""
+
+        cls._textures.clear()
+        cls.hits = 0
+        cls.misses = 0
+        cls.evictions = 0
+
+
+class ElevationManager:
+    """
+    Tracks the window position of widgets with the elevation effect that have
+    a relative position (for example, widgets inside a
+    :class:`~kivy.uix.screenmanager.Screen` or a
+    :class:`~kivymd.uix.tab.MDTabs` tab).
+
+    Instead of binding every such widget to `Window.on_draw`, the manager is
+    bound once and, once per frame, updates the shadow only of the widgets
+    whose position in the window coordinates has actually changed.
+    A widget is marked as moved by the `pos`, `size` and `parent` events of
+    the widget and of its ancestors (and by the `transform` of the ancestors
+    such as :class:`~kivy.uix.scatter.Scatter`), so the window position is
+    computed only for the moved widgets.
+    Widgets are kept in a weak registry, so the manager does not prevent them
+    from being garbage collected.
+
+    The manager also coalesces shader uniform updates: a change of
+    `elevation`, `shadow_color`, `opacity` and so on only marks the widget as
+    dirty (see :meth:`CommonElevationBehavior.mark_uniform_dirty`), and all
+    dirty widgets are flushed from a single :class:`~kivy.clock.Clock`
+    callback per frame.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        from kivymd.uix.behaviors.elevation import elevation_manager
+
+        print(elevation_manager.updates, elevation_manager.skips)
+        print(elevation_manager.coalesced_events)
+    """
+
+    def __init__(self):
+        self._widgets = weakref.WeakSet()
+        self._moved_widgets = weakref.WeakSet()
+        # Widget -> list of (weak reference to the ancestor, property name,
+        # binding uid).
+        self._ancestor_bindings = weakref.WeakKeyDictionary()
+        self._bound = False
+        self._dirty_widgets = {}
+        self._trigger_flush = Clock.create_trigger(self.flush)
+        self.updates = 0
+        """Number of shadow updates performed by the manager."""
+        self.skips = 0
+        """Number of shadow updates skipped because nothing has moved."""
+        self.dirty_marks = 0
+        """
+        Number of uniform changes. Each of them used to schedule its own
+        Clock event.
+        """
+        self.flushes = 0
+        """Number of Clock callbacks that flushed dirty uniforms."""
+
+    @property
+    def coalesced_events(self) -> int:
+        """Number of Clock events saved by coalescing uniform updates."""
+
+        return self.dirty_marks - self.flushes
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def register(self, widget: CommonElevationBehavior) -> None:
+        """Adds a widget to the registry."""
+
+        widget._last_window_state = None
+        self._widgets.add(widget)
+        self._bind_ancestors(widget)
+        self.mark_moved(widget)
+        if not self._bound:
+            Window.bind(on_draw=self.update)
+            self._bound = True
+
+    def unregister(self, widget: CommonElevationBehavior) -> None:
+        """Removes a widget from the registry."""
+
+        self._widgets.discard(widget)
+        self._moved_widgets.discard(widget)
+        self._unbind_ancestors(widget)
+        if not self._widgets and self._bound:
+            Window.unbind(on_draw=self.update)
+            self._bound = False
+
+    def mark_moved(self, widget: CommonElevationBehavior) -> None:
+        """
+        Marks the widget as moved: its window position is checked on the
+        next frame.
+        """
+
+        if widget in self._widgets:
+            self._moved_widgets.add(widget)
+
+    def update(self, *args) -> None:
+        """
+        Called once per frame. Updates the shadows of the widgets whose
+        window position has changed since the previous frame.
+        """
+
+        moved_widgets = self._moved_widgets
+        if not moved_widgets:
+            self.skips += len(self._widgets)
+            return
+
+        self._moved_widgets = weakref.WeakSet()
+        self.skips += len(self._widgets) - len(moved_widgets)
+        for widget in list(moved_widgets):
+            # Baked and batched shadows are drawn in the widget coordinates.
+            if (
+                not widget.parent
+                or widget._baked_shadow
+                or widget._shadow_batch
+            ):
+                continue
+
+            state = (
+                widget.to_window(*widget.pos),
+                widget.context.use_parent_modelview,
+            )
+            if state == widget._last_window_state:
+                self.skips += 1
+                continue
+
+            widget._last_window_state = state
+            widget.update_window_position()
+            self.updates += 1
+
+    def _bind_ancestors(self, widget: CommonElevationBehavior) -> None:
+        self._unbind_ancestors(widget)
+        widget_ref = weakref.ref(widget)
+        bindings = self._ancestor_bindings[widget] = []
+        ancestor = widget
+        while ancestor is not None and ancestor is not Window:
+            names = ["pos", "size", "parent"]
+            if ancestor.property("transform", quiet=True) is not None:
+                names.append("transform")
+            for name in names:
+                callback = (
+                    self._on_ancestor_parent
+                    if name == "parent"
+                    else self._on_ancestor_moved
+                )
+                uid = ancestor.fbind(name, callback, widget_ref)
+                bindings.append((weakref.ref(ancestor), name, uid))
+            ancestor = ancestor.parent
+
+    def _unbind_ancestors(self, widget: CommonElevationBehavior) -> None:
+        for ancestor_ref, name, uid in self._ancestor_bindings.pop(
+            widget, ()
+        ):
+            ancestor = ancestor_ref()
+            if ancestor is not None:
+                ancestor.unbind_uid(name, uid)
+
+    def _on_ancestor_moved(self, widget_ref, *args) -> None:
+        widget = widget_ref()
+        if widget is not None:
+            self.mark_moved(widget)
+
+    def _on_ancestor_parent(self, widget_ref, *args) -> None:
+        # The chain of the ancestors has changed.
+        widget = widget_ref()
+        if widget is not None and widget in self._widgets:
+            self._bind_ancestors(widget)
+            self.mark_moved(widget)
+
+    def mark_dirty(self, widget: CommonElevationBehavior) -> None:
+        """
+        Schedules a flush of the dirty uniforms of the widget for
+        the next frame.
+        """
+
+        self.dirty_marks += 1
+        self._dirty_widgets[widget] = None
+        self._trigger_flush()
+
+    def flush(self, *args) -> None:
+        """Writes the dirty uniforms of all widgets."""
+
+        dirty_widgets, self._dirty_widgets = self._dirty_widgets, {}
+        self.flushes += 1
+        for widget in dirty_widgets:
+            widget.flush_uniforms()
+
+    def reset_stats(self) -> None:
+        """Resets the update counters."""
+
+        self.updates = 0
+        self.skips = 0
+        self.dirty_marks = 0
+        self.flushes = 0
+
+
+elevation_manager = ElevationManager()
+"""The :class:`~ElevationManager` instance used by all elevated widgets."""
+
 
 # FIXME: Add shadow manipulation with canvas instructions such as
 #  PushMatrix and PopMatrix.
@@ -588,10 +1147,60 @@ class CommonElevationBehavior(Widget):
     and defaults to `[0.4, 0.4, 0.4, 0.8]`.
     """
 
+    shadow_render_mode = OptionProperty(
+        None, options=["shader", "baked"], allownone=True
+    )
+    """
+    The way the shadow is rendered. Available options are: `'shader'`,
+    `'baked'`.
+
+    - `'shader'` - the shadow is computed for every pixel by the elevation
+      shader;
+    - `'baked'` - the shadow is rendered once into a nine-patch texture,
+      which is cached in the :class:`~ShadowTextureCache` and drawn with
+      a :class:`~kivy.graphics.BorderImage`. This is much cheaper for
+      devices with software rendering.
+
+    If the value is `None`, the value of the
+    :attr:`~kivymd.theming.ThemeManager.shadow_render_mode` attribute of the
+    theme is used.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: kv
+
+        MDCard:
+            elevation: 4
+            shadow_render_mode: "baked"
+
+    :attr:`shadow_render_mode` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `None`.
+    """
+
+    batched_shadow = BooleanProperty(False)
+    """
+    If `True` and the parent of the widget is a container with the
+    :class:`~ShadowBatchBehavior` behavior, the shadow of the widget is
+    drawn by the container together with the shadows of the other children
+    in a single draw call, and the widget does not use its own
+    :class:`~kivy.graphics.RenderContext`.
+
+    .. versionadded:: 1.1.0
+
+    :attr:`batched_shadow` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _transition_ref = ObjectProperty()
     _has_relative_position = BooleanProperty(defaultvalue=False)
     _elevation = 0
     _shadow_color = [0.0, 0.0, 0.0, 0.0]
+    _last_window_state = None
+    _dirty_uniforms = None
+    _baked_shadow = None
+    _baked_shadow_image = None
+    _shadow_batch = None
+    _shadow_index = 0
 
     def _get_window_pos(self, *args):
         window_pos = self.to_window(*self.pos)
@@ -607,18 +1216,211 @@ class CommonElevationBehavior(Widget):
         super().__init__(**kwargs)
 
         with self.canvas.before:
-            self.context = RenderContext(use_parent_projection=True)
+            self.context = ElevationShaderCache.create_context(
+                use_parent_projection=True
+            )
         with self.context:
             self.rect = RoundedRectangle(pos=self.pos, size=self.size)
 
         Clock.schedule_once(self.after_init)
 
     def after_init(self, *args):
-        Clock.schedule_once(self.check_for_relative_behavior)
-        Clock.schedule_once(self.set_shader_string)
-        Clock.schedule_once(lambda x: self.on_elevation(self, self.elevation))
+        self.mark_uniform_dirty("relative_behavior")
+        self.mark_uniform_dirty("shader")
+        self.on_elevation(self, self.elevation)
         self.on_pos()
 
+        theme_cls = self._get_theme_cls()
+        if theme_cls:
+            theme_cls.bind(shadow_render_mode=self.on_shadow_render_mode)
+        if self.get_shadow_render_mode() == "baked":
+            self.mark_uniform_dirty("render_mode")
+
+    def get_shadow_render_mode(self) -> str:
+        """
+        Returns the shadow render mode of the widget - `'shader'` or `'baked'`.
+        See :attr:`shadow_render_mode`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self.shadow_render_mode:
+            return self.shadow_render_mode
+
+        theme_cls = self._get_theme_cls()
+        return theme_cls.shadow_render_mode if theme_cls else "shader"
+
+    def on_shadow_render_mode(self, instance, value) -> None:
+        self.mark_uniform_dirty("render_mode")
+
+    def on_batched_shadow(self, instance, value: bool) -> None:
+        if isinstance(self.parent, ShadowBatchBehavior):
+            if value:
+                self.parent.add_batched_shadow(self)
+            else:
+                self.parent.remove_batched_shadow(self)
+
+    def set_shadow_batch(self, batch: ShadowBatchBehavior | None) -> None:
+        """
+        Called by the :class:`~ShadowBatchBehavior` container when it starts
+        (`batch` is the container) or stops (`batch` is `None`) drawing
+        the shadow of the widget.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if batch is self._shadow_batch:
+            return
+
+        instruction = self._baked_shadow or self.context
+        if batch:
+            self._shadow_index = self.canvas.before.indexof(instruction)
+            self.canvas.before.remove(instruction)
+            self._shadow_batch = batch
+            batch.trigger_shadow_batch()
+        else:
+            self._shadow_batch = None
+            self.canvas.before.insert(self._shadow_index, instruction)
+            self.mark_uniform_dirty("render_mode")
+            self.on_size()
+            self.on_pos()
+
+    def update_baked_shadow(self, *args) -> None:
+        """
+        Updates the texture and the geometry of the shadow in the `'baked'`
+        render mode.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if not self._baked_shadow:
+            return
+
+        border_image = self._baked_shadow_image
+        texture, border = ShadowTextureCache.get_texture(
+            self.shadow_radius, self.shadow_softness, self.shadow_color
+        )
+        size = (
+            self.size[0] + (self._elevation * self.shadow_softness / 2),
+            self.size[1] + (self._elevation * self.shadow_softness / 2),
+        )
+        border_image.texture = texture
+        border_image.border = (border, border, border, border)
+        # The hidden shadow has no size: the color of the group is
+        # not changed.
+        border_image.size = (
+            size if self._elevation > 0 and not self.disabled else (0, 0)
+        )
+        border_image.pos = (
+            self.x - ((size[0] - self.width) / 2) - self.shadow_offset[0],
+            self.y - ((size[1] - self.height) / 2) - self.shadow_offset[1],
+        )
+
+    def mark_uniform_dirty(self, name: str, value=None) -> None:
+        """
+        Marks the shader uniform (or the initialization step) `name` as dirty.
+
+        The values are not written to the :class:`~kivy.graphics.RenderContext`
+        immediately: the :class:`~ElevationManager` calls
+        :meth:`flush_uniforms` of all dirty widgets from a single
+        :class:`~kivy.clock.Clock` callback once per frame, so several
+        property changes in the same frame cost one update.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._dirty_uniforms is None:
+            self._dirty_uniforms = {}
+        self._dirty_uniforms[name] = value
+        elevation_manager.mark_dirty(self)
+
+    def flush_uniforms(self, *args) -> None:
+        """
+        Writes all pending uniforms to the
+        :class:`~kivy.graphics.RenderContext`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        dirty_uniforms, self._dirty_uniforms = self._dirty_uniforms, None
+        if not dirty_uniforms:
+            return
+
+        for name, value in dirty_uniforms.items():
+            getattr(self, f"_update_{name}")(value)
+        if self._shadow_batch:
+            self._shadow_batch.trigger_shadow_batch()
+        else:
+            self.update_baked_shadow()
+
+    def _get_theme_cls(self):
+        theme_cls = getattr(self, "theme_cls", None)
+        if theme_cls is None:
+            theme_cls = getattr(App.get_running_app(), "theme_cls", None)
+        return theme_cls
+
+    def _update_render_mode(self, value) -> None:
+        if self._shadow_batch:
+            return
+
+        baked = self.get_shadow_render_mode() == "baked"
+        if baked == bool(self._baked_shadow):
+            return
+
+        if baked:
+            self._baked_shadow_image = BorderImage(auto_scale="both_lower")
+            # The color of the shadow must not change the color of the
+            # instructions drawn after it.
+            self._baked_shadow = InstructionGroup()
+            self._baked_shadow.add(PushState("color"))
+            self._baked_shadow.add(Color(1, 1, 1, 1))
+            self._baked_shadow.add(self._baked_shadow_image)
+            self._baked_shadow.add(PopState("color"))
+            index = self.canvas.before.indexof(self.context)
+            self.canvas.before.remove(self.context)
+            self.canvas.before.insert(index, self._baked_shadow)
+        else:
+            index = self.canvas.before.indexof(self._baked_shadow)
+            self.canvas.before.remove(self._baked_shadow)
+            self.canvas.before.insert(index, self.context)
+            self._baked_shadow = None
+            self._baked_shadow_image = None
+            self.on_size()
+            self.on_pos()
+
+    def _update_relative_behavior(self, value) -> None:
+        self.check_for_relative_behavior()
+
+    def _update_shader(self, value) -> None:
+        self.set_shader_string()
+
+    def _update_shadow_color(self, value) -> None:
+        self._shadow_color = list(map(float, value))[:-1] + [
+            float(self.opacity) if not self.disabled else 0
+        ]
+        self.context["shadow_color"] = self._shadow_color
+
+    def _update_shadow_radius(self, value) -> None:
+        if hasattr(self, "context"):
+            self.context["shadow_radius"] = list(map(float, value))
+
+    def _update_shadow_softness(self, value) -> None:
+        if hasattr(self, "context"):
+            self.context["shadow_softness"] = float(value)
+
+    def _update_elevation(self, value) -> None:
+        if hasattr(self, "context"):
+            self._elevation = value
+            self.hide_elevation(
+                True if (value <= 0 or self.disabled) else False
+            )
+
+    def _update_opacity(self, value) -> None:
+        self._shadow_color = list(map(float, self._shadow_color))[:-1] + [
+            float(value)
+        ]
+        self.context["shadow_color"] = self._shadow_color
+
     def check_for_relative_behavior(self, *args) -> None:
         """
         Checks if the widget has relative properties and if necessary
@@ -654,7 +1456,7 @@ class CommonElevationBehavior(Widget):
                 break
 
         if self._has_relative_position:
-            Window.bind(on_draw=self.update_window_position)
+            elevation_manager.register(self)
 
     def apply_correction(self, *args):
         if self._transition_ref:
@@ -668,21 +1470,19 @@ class CommonElevationBehavior(Widget):
                 self.context.use_parent_modelview = False
             else:
                 self.context.use_parent_modelview = True
+            elevation_manager.mark_moved(self)
 
     def reset_correction(self, *args):
         self.context.use_parent_modelview = False
         self.update_window_position()
 
     def get_shader_string(self) -> str:
-        shader_string = ""
-        for name_file in ["header.frag", "elevation.frag", "main.frag"]:
-            with open(
-                os.path.join(glsl_path, "elevation", name_file),
-                encoding="utf-8",
-            ) as file:
-                shader_string += f"{file.read()}\n\n"
+        """
+        Returns the source of the elevation shader.
+        See :class:`~ElevationShaderCache` class.
+        """
 
-        return shader_string
+        return ElevationShaderCache.get_source()
 
     def set_shader_string(self, *args) -> None:
         self.context["shadow_radius"] = list(map(float, self.shadow_radius))
@@ -691,43 +1491,22 @@ class CommonElevationBehavior(Widget):
             :-1
         ] + [float(self.opacity)]
         self.context["pos"] = list(map(float, self.rect.pos))
-        self.context.shader.fs = self.get_shader_string()
+        ElevationShaderCache.apply(self.context)
 
     def update_resolution(self) -> None:
         self.context["resolution"] = (*self.rect.size, *self.rect.pos)
 
     def on_shadow_color(self, instance, value) -> None:
-        def on_shadow_color(*args):
-            self._shadow_color = list(map(float, value))[:-1] + [
-                float(self.opacity) if not self.disabled else 0
-            ]
-            self.context["shadow_color"] = self._shadow_color
-
-        Clock.schedule_once(on_shadow_color)
+        self.mark_uniform_dirty("shadow_color", value)
 
     def on_shadow_radius(self, instance, value) -> None:
-        def on_shadow_radius(*args):
-            if hasattr(self, "context"):
-                self.context["shadow_radius"] = list(map(float, value))
-
-        Clock.schedule_once(on_shadow_radius)
+        self.mark_uniform_dirty("shadow_radius", value)
 
     def on_shadow_softness(self, instance, value) -> None:
-        def on_shadow_softness(*args):
-            if hasattr(self, "context"):
-                self.context["shadow_softness"] = float(value)
-
-        Clock.schedule_once(on_shadow_softness)
+        self.mark_uniform_dirty("shadow_softness", value)
 
     def on_elevation(self, instance, value) -> None:
-        def on_elevation(*args):
-            if hasattr(self, "context"):
-                self._elevation = value
-                self.hide_elevation(
-                    True if (value <= 0 or self.disabled) else False
-                )
-
-        Clock.schedule_once(on_elevation)
+        self.mark_uniform_dirty("elevation", value)
 
     def on_shadow_offset(self, instance, value) -> None:
         self.on_size()
@@ -736,7 +1515,8 @@ class CommonElevationBehavior(Widget):
     def update_window_position(self, *args) -> None:
         """
         This function is used only when the widget has relative position
-        properties.
+        properties. Called by the :class:`~ElevationManager` when the position
+        of the widget in the window coordinates has changed.
         """
 
         self.on_pos()
@@ -744,6 +1524,12 @@ class CommonElevationBehavior(Widget):
     def on_pos(self, *args) -> None:
         if not hasattr(self, "rect"):
             return
+        if self._shadow_batch:
+            self._shadow_batch.trigger_shadow_batch()
+            return
+        if self._baked_shadow:
+            self.update_baked_shadow()
+            return
 
         if (
             self._has_relative_position
@@ -769,6 +1555,12 @@ class CommonElevationBehavior(Widget):
     def on_size(self, *args) -> None:
         if not hasattr(self, "rect"):
             return
+        if self._shadow_batch:
+            self._shadow_batch.trigger_shadow_batch()
+            return
+        if self._baked_shadow:
+            self.update_baked_shadow()
+            return
 
         self.rect.size = (
             self.size[0] + (self._elevation * self.shadow_softness / 2),
@@ -784,14 +1576,8 @@ class CommonElevationBehavior(Widget):
         of the widget.
         """
 
-        def on_opacity(*args):
-            self._shadow_color = list(map(float, self._shadow_color))[:-1] + [
-                float(value)
-            ]
-            self.context["shadow_color"] = self._shadow_color
-
         super().on_opacity(instance, value)
-        Clock.schedule_once(on_opacity)
+        self.mark_uniform_dirty("opacity", value)
 
     def on_radius(self, instance, value) -> None:
         self.shadow_radius = [value[1], value[2], value[0], value[3]]
@@ -816,6 +1602,154 @@ class CommonElevationBehavior(Widget):
         self.on_pos()
 
 
+class ShadowBatchBehavior:
+    """
+    Container behavior that draws the shadows of its children with a single
+    mesh in one draw call.
+
+    Children with the :class:`~CommonElevationBehavior` behavior opt in with
+    the :attr:`~CommonElevationBehavior.batched_shadow` attribute. Their
+    shadows are collected into one :class:`~kivy.graphics.Mesh` with
+    per-vertex shadow attributes (size, radius, softness and color) and
+    drawn by a single shader below all the children of the container.
+    The mesh is rebuilt at most once per frame when one of the children
+    changes.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        from kivymd.uix.behaviors import ShadowBatchBehavior
+        from kivymd.uix.card import MDCard
+        from kivymd.uix.gridlayout import MDGridLayout
+
+
+        class CardGrid(ShadowBatchBehavior, MDGridLayout):
+            pass
+
+
+        grid = CardGrid(cols=4, spacing="12dp", padding="12dp")
+        for i in range(100):
+            grid.add_widget(MDCard(elevation=2, batched_shadow=True))
+
+    .. note:: A mesh can hold at most 16383 shadows.
+    """
+
+    shadow_batch_fmt = [
+        (b"vPosition", 2, "float"),
+        (b"vLocal", 2, "float"),
+        (b"vHalfSize", 2, "float"),
+        (b"vRadius", 4, "float"),
+        (b"vSoftness", 1, "float"),
+        (b"vColor", 4, "float"),
+    ]
+    """Vertex format of the shadow mesh."""
+
+    def __init__(self, *args, **kwargs):
+        self._batched_children = []
+        self.trigger_shadow_batch = Clock.create_trigger(
+            self.update_shadow_batch
+        )
+        vs, fs = ElevationShaderCache.get_batch_sources()
+        self._shadow_batch_context = RenderContext(
+            use_parent_projection=True,
+            use_parent_modelview=True,
+            vs=vs,
+            fs=fs,
+        )
+        self._shadow_batch_mesh = Mesh(
+            fmt=self.shadow_batch_fmt, mode="triangles"
+        )
+        self._shadow_batch_context.add(self._shadow_batch_mesh)
+        super().__init__(*args, **kwargs)
+
+        # The shadows are drawn after the background of the container and
+        # before the canvases of all the children.
+        index = len(self.canvas.children)
+        for child in self.children:
+            if child.canvas in self.canvas.children:
+                index = min(index, self.canvas.indexof(child.canvas))
+        self.canvas.insert(index, self._shadow_batch_context)
+
+    def add_widget(self, widget, *args, **kwargs):
+        super().add_widget(widget, *args, **kwargs)
+        if (
+            isinstance(widget, CommonElevationBehavior)
+            and widget.batched_shadow
+        ):
+            self.add_batched_shadow(widget)
+
+    def remove_widget(self, widget, *args, **kwargs):
+        if widget in self._batched_children:
+            self.remove_batched_shadow(widget)
+        super().remove_widget(widget, *args, **kwargs)
+
+    def add_batched_shadow(self, widget: CommonElevationBehavior) -> None:
+        """Starts drawing the shadow of the child widget."""
+
+        if widget not in self._batched_children:
+            self._batched_children.append(widget)
+            widget.set_shadow_batch(self)
+
+    def remove_batched_shadow(self, widget: CommonElevationBehavior) -> None:
+        """Stops drawing the shadow of the child widget."""
+
+        if widget in self._batched_children:
+            self._batched_children.remove(widget)
+            widget.set_shadow_batch(None)
+            self.trigger_shadow_batch()
+
+    def update_shadow_batch(self, *args) -> None:
+        """Rebuilds the shadow mesh."""
+
+        vertices = []
+        indices = []
+        count = 0
+        for widget in self._batched_children:
+            elevation = widget._elevation
+            if elevation <= 0 or widget.disabled:
+                continue
+            if count == 16383:
+                break
+
+            softness = float(widget.shadow_softness)
+            width = widget.width + elevation * softness / 2
+            height = widget.height + elevation * softness / 2
+            x = widget.x - (width - widget.width) / 2 - widget.shadow_offset[0]
+            y = (
+                widget.y
+                - (height - widget.height) / 2
+                - widget.shadow_offset[1]
+            )
+            half_width = width / 2
+            half_height = height / 2
+            attributes = (
+                half_width,
+                half_height,
+                *widget.shadow_radius,
+                softness,
+                *widget.shadow_color[:3],
+                widget.opacity,
+            )
+            for vertex in (
+                (x, y, -half_width, -half_height),
+                (x + width, y, half_width, -half_height),
+                (x + width, y + height, half_width, half_height),
+                (x, y + height, -half_width, half_height),
+            ):
+                vertices.extend(vertex)
+                vertices.extend(attributes)
+
+            base = count * 4
+            indices.extend(
+                (base, base + 1, base + 2, base + 2, base + 3, base)
+            )
+            count += 1
+
+        self._shadow_batch_mesh.vertices = vertices
+        self._shadow_batch_mesh.indices = indices
+
+
 class RectangularElevationBehavior(CommonElevationBehavior):
     """
     .. deprecated:: 1.1.0
@@ -82,13 +82,388 @@ the widget.
    :align: center
 """
 
-__all__ = ("HoverBehavior",)
+__all__ = ("HoverBehavior", "HoverManager")
 
+import weakref
+
+from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.properties import BooleanProperty, ObjectProperty
 from kivy.uix.widget import Widget
 
 
+class HoverManager:
+    """
+    Dispatches the mouse position to the :class:`~HoverBehavior` widgets.
+
+    Instead of binding every hover widget to `Window.mouse_pos`, the manager
+    is bound once and keeps a spatial index (a uniform grid with cells of
+    :attr:`cell_size` pixels) of the window rectangles of all registered
+    widgets. For each pointer position only the widgets from the grid cell
+    under the pointer and the widgets that are currently hovered are
+    checked, so the `on_enter`/`on_leave` events are dispatched only to the
+    widgets whose state has changed.
+
+    The rectangles are updated incrementally: when the position, the size or
+    the parent of a widget changes, or when one of its ancestors that
+    transforms coordinates (:class:`~kivy.uix.scrollview.ScrollView`,
+    :class:`~kivy.uix.relativelayout.RelativeLayout`,
+    :class:`~kivy.uix.scatter.Scatter` and so on) is moved or scrolled.
+
+    .. versionadded:: 1.1.0
+
+    .. code-block:: python
+
+        from kivymd.uix.behaviors.hover_behavior import hover_manager
+
+        # Re-index all widgets, for example, after changing the transformation
+        # of widgets manually.
+        hover_manager.invalidate()
+
+    Some mice and touchpads report the pointer position several hundred
+    times per second. In the coalescing mode only the latest position is
+    kept and is processed at most once per frame (or at most
+    :attr:`max_event_rate` times per second). Hover processing can also be
+    suspended while a :class:`~kivy.uix.scrollview.ScrollView` is being
+    scrolled:
+
+    .. code-block:: python
+
+        hover_manager.coalesce_events = True
+        hover_manager.max_event_rate = 30
+        hover_manager.suspend_on_scroll = True
+
+        # Number of pointer events that were merged into a newer one and
+        # that were dropped while scrolling.
+        print(hover_manager.coalesced, hover_manager.dropped)
+    """
+
+    cell_size = 128
+    """Size of a cell of the spatial index in pixels."""
+
+    transform_properties = ("pos", "size", "scroll_x", "scroll_y", "transform")
+    """
+    Properties of the ancestors that transform coordinates, the changes of
+    which move the registered widgets in the window.
+    """
+
+    coalesce_events = False
+    """
+    If `True`, only the latest pointer position is kept and is processed
+    once per frame.
+    """
+
+    max_event_rate = 0
+    """
+    Maximum number of pointer positions processed per second in the
+    coalescing mode. `0` means once per frame.
+    """
+
+    suspend_on_scroll = False
+    """
+    If `True`, hover processing is suspended while a
+    :class:`~kivy.uix.scrollview.ScrollView` that contains hover widgets is
+    being scrolled. The latest pointer position is processed when the
+    scrolling stops.
+    """
+
+    scroll_suspend_time = 0.15
+    """
+    Time in seconds after the last scroll change during which the scrolling
+    is considered to be in progress.
+    """
+
+    def __init__(self):
+        self.received = 0
+        """Number of received pointer events."""
+        self.processed = 0
+        """Number of processed pointer positions."""
+        self.coalesced = 0
+        """Number of pointer events replaced by a newer one."""
+        self.dropped = 0
+        """Number of pointer events dropped while scrolling."""
+        self._pending_pos = None
+        self._pending_event = None
+        self._last_processed_time = 0
+        self._last_scroll_time = -1
+        self._widgets = weakref.WeakSet()
+        self._dirty = weakref.WeakSet()
+        self._cells = {}
+        self._hovered = []
+        # Ancestors (and roots of detached trees) that the manager is bound
+        # to: the widgets that depend on them and the uids of the bindings
+        # by property name.
+        self._ancestors = weakref.WeakKeyDictionary()
+        self._bound = False
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def register(self, widget) -> None:
+        """Adds a widget to the index."""
+
+        self._widgets.add(widget)
+        self._dirty.add(widget)
+        widget.fbind("pos", self.mark_dirty)
+        widget.fbind("size", self.mark_dirty)
+        widget.fbind("parent", self.mark_dirty)
+        if not self._bound:
+            Window.bind(mouse_pos=self.on_mouse_pos, size=self.invalidate)
+            self._bound = True
+
+    def unregister(self, widget) -> None:
+        """Removes a widget from the index."""
+
+        widget.funbind("pos", self.mark_dirty)
+        widget.funbind("size", self.mark_dirty)
+        widget.funbind("parent", self.mark_dirty)
+        for ancestor in list(widget._hover_ancestors):
+            self._remove_ancestor(ancestor, widget)
+        widget._hover_ancestors = ()
+        self._remove_from_cells(widget)
+        self._widgets.discard(widget)
+        self._dirty.discard(widget)
+        if widget in self._hovered:
+            self._hovered.remove(widget)
+
+    def mark_dirty(self, widget, *args) -> None:
+        """Schedules an update of the window rectangle of the widget."""
+
+        self._dirty.add(widget)
+
+    def invalidate(self, *args) -> None:
+        """Schedules an update of the rectangles of all widgets."""
+
+        for widget in self._widgets:
+            self._dirty.add(widget)
+
+    def get_widgets_at(self, x: float, y: float) -> list:
+        """
+        Returns the registered widgets whose window rectangle contains
+        the point.
+        """
+
+        self._update_index()
+        cell_size = self.cell_size
+        return [
+            widget
+            for widget in self._cells.get(
+                (int(x // cell_size), int(y // cell_size)), ()
+            )
+            if widget._hover_rect[0] <= x <= widget._hover_rect[2]
+            and widget._hover_rect[1] <= y <= widget._hover_rect[3]
+        ]
+
+    def on_mouse_pos(self, window, pos) -> None:
+        """Called when the mouse position changes."""
+
+        self.received += 1
+        if self.suspend_on_scroll and self.is_scrolling():
+            if self._pending_pos is not None:
+                self.dropped += 1
+            self._pending_pos = pos
+            self._schedule_pending()
+            return
+
+        if not self.coalesce_events:
+            self.dispatch_mouse_pos(window, pos)
+            return
+
+        if self._pending_pos is not None:
+            self.coalesced += 1
+        self._pending_pos = pos
+        self._schedule_pending()
+
+    def is_scrolling(self) -> bool:
+        """
+        Returns `True` if a scroll view with hover widgets has been scrolled
+        in the last :attr:`scroll_suspend_time` seconds.
+        """
+
+        return (
+            self._last_scroll_time >= 0
+            and Clock.get_time() - self._last_scroll_time
+            < self.scroll_suspend_time
+        )
+
+    def reset_stats(self) -> None:
+        """Resets the event counters."""
+
+        self.received = 0
+        self.processed = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def dispatch_mouse_pos(self, window, pos) -> None:
+        """
+        Dispatches the pointer position to the widgets whose hover state can
+        change.
+        """
+
+        self.processed += 1
+        self._last_processed_time = Clock.get_time()
+
+        # Widgets that are hovered now may have to dispatch `on_leave`,
+        # the widgets under the pointer may have to dispatch `on_enter`.
+        targets = list(self._hovered)
+        for widget in self.get_widgets_at(*pos):
+            if widget not in targets:
+                targets.append(widget)
+
+        hovered = []
+        for widget in targets:
+            widget.on_mouse_update(window, pos)
+            if widget.hovering:
+                hovered.append(widget)
+        self._hovered = hovered
+
+    def _schedule_pending(self) -> None:
+        if self._pending_event:
+            return
+
+        now = Clock.get_time()
+        delay = 0
+        if self.coalesce_events and self.max_event_rate:
+            delay = max(
+                delay,
+                self._last_processed_time + 1 / self.max_event_rate - now,
+            )
+        if self.suspend_on_scroll and self.is_scrolling():
+            delay = max(
+                delay, self._last_scroll_time + self.scroll_suspend_time - now
+            )
+        self._pending_event = Clock.schedule_once(
+            self._process_pending, delay
+        )
+
+    def _process_pending(self, *args) -> None:
+        self._pending_event = None
+        if self._pending_pos is None:
+            return
+        if self.suspend_on_scroll and self.is_scrolling():
+            self._schedule_pending()
+            return
+
+        pos, self._pending_pos = self._pending_pos, None
+        self.dispatch_mouse_pos(Window, pos)
+
+    def _update_index(self) -> None:
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, weakref.WeakSet()
+        for widget in dirty:
+            if widget in self._widgets:
+                self._remove_from_cells(widget)
+                self._add_to_cells(widget)
+
+    def _add_to_cells(self, widget) -> None:
+        corners = (
+            widget.to_window(widget.x, widget.y),
+            widget.to_window(widget.right, widget.top),
+        )
+        x1 = min(corners[0][0], corners[1][0])
+        y1 = min(corners[0][1], corners[1][1])
+        x2 = max(corners[0][0], corners[1][0])
+        y2 = max(corners[0][1], corners[1][1])
+        widget._hover_rect = (x1, y1, x2, y2)
+
+        cell_size = self.cell_size
+        cells = []
+        for cx in range(int(x1 // cell_size), int(x2 // cell_size) + 1):
+            for cy in range(int(y1 // cell_size), int(y2 // cell_size) + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    cell = self._cells[(cx, cy)] = weakref.WeakSet()
+                cell.add(widget)
+                cells.append((cx, cy))
+        widget._hover_cells = cells
+        self._bind_ancestors(widget)
+
+    def _remove_from_cells(self, widget) -> None:
+        for key in widget._hover_cells:
+            cell = self._cells.get(key)
+            if cell is not None:
+                cell.discard(widget)
+                if not cell:
+                    del self._cells[key]
+        widget._hover_cells = ()
+
+    def _bind_ancestors(self, widget) -> None:
+        ancestors = {}
+        node = widget
+        while isinstance(node.parent, Widget):
+            node = node.parent
+            if (
+                type(node).to_parent is not Widget.to_parent
+                or type(node).to_local is not Widget.to_local
+            ):
+                ancestors[node] = self.transform_properties
+
+        # The root of a tree that is not attached to the window yet. When it
+        # gets a parent, the rectangles of its widgets must be recomputed.
+        if node is not widget and node.parent is None:
+            ancestors[node] = ancestors.get(node, ()) + ("parent",)
+
+        # The ancestors of the previous position of the widget in the tree.
+        for ancestor in list(widget._hover_ancestors):
+            if ancestor not in ancestors:
+                self._remove_ancestor(ancestor, widget)
+        for ancestor, properties in ancestors.items():
+            self._add_ancestor(ancestor, widget, properties)
+        widget._hover_ancestors = weakref.WeakSet(ancestors)
+
+    def _add_ancestor(self, ancestor, widget, properties) -> None:
+        entry = self._ancestors.get(ancestor)
+        if entry is None:
+            entry = self._ancestors[ancestor] = (weakref.WeakSet(), {})
+        widgets, uids = entry
+        for name in properties:
+            if name in uids or ancestor.property(name, True) is None:
+                continue
+            callback = weakref.WeakMethod(
+                self._on_ancestor_scrolled
+                if name in ("scroll_x", "scroll_y")
+                else self._on_ancestor_changed
+            )
+            uids[name] = ancestor.fbind(
+                name, lambda *args, c=callback: c()(ancestor)
+            )
+        widgets.add(widget)
+
+    def _remove_ancestor(self, ancestor, widget) -> None:
+        entry = self._ancestors.get(ancestor)
+        if entry is None:
+            return
+        widgets, uids = entry
+        widgets.discard(widget)
+        if not widgets:
+            self._unbind_ancestor(ancestor)
+
+    def _unbind_ancestor(self, ancestor) -> None:
+        for name, uid in self._ancestors.pop(ancestor)[1].items():
+            ancestor.unbind_uid(name, uid)
+
+    def _on_ancestor_changed(self, ancestor) -> None:
+        entry = self._ancestors.get(ancestor)
+        if entry is None:
+            return
+        if not entry[0]:
+            # The widgets that depended on the ancestor were collected.
+            self._unbind_ancestor(ancestor)
+            return
+        for widget in entry[0]:
+            self._dirty.add(widget)
+
+    def _on_ancestor_scrolled(self, ancestor) -> None:
+        self._last_scroll_time = Clock.get_time()
+        self._on_ancestor_changed(ancestor)
+
+
+hover_manager = HoverManager()
+"""The :class:`~HoverManager` instance used by all hover widgets."""
+
+
 class HoverBehavior(object):
     """
     :Events:
@@ -133,13 +508,22 @@ class HoverBehavior(object):
     and defaults to  `True`.
     """
 
+    _hover_rect = (0, 0, 0, 0)
+    _hover_cells = ()
+    _hover_ancestors = ()
+
     def __init__(self, **kwargs):
         self.register_event_type("on_enter")
         self.register_event_type("on_leave")
-        Window.bind(mouse_pos=self.on_mouse_update)
         super(HoverBehavior, self).__init__(**kwargs)
+        hover_manager.register(self)
 
     def on_mouse_update(self, *args):
+        """
+        Called by the :class:`~HoverManager` when the mouse pointer is over
+        the widget or leaves it.
+        """
+
         #  If the Widget currently has no parent, do nothing
         if not self.get_root_window():
             return
@@ -563,7 +563,6 @@ from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.floatlayout import FloatLayout
 
 from kivymd import uix_path
-from kivymd.color_definitions import text_colors
 from kivymd.font_definitions import theme_font_styles
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import (
@@ -969,14 +968,13 @@ class BaseButton(
         )
 
         if self.theme_cls.theme_style_switch_animation:
-            Animation(
+            self.theme_cls.animate_colors(
+                self,
                 _md_bg_color=_md_bg_color,
                 _md_bg_color_disabled=_md_bg_color_disabled,
                 _line_color=_line_color,
                 _line_color_disabled=_line_color_disabled,
-                d=self.theme_cls.theme_style_switch_animation_duration,
-                t="linear",
-            ).start(self)
+            )
         else:
             self._md_bg_color = _md_bg_color
             self._md_bg_color_disabled = _md_bg_color_disabled
@@ -992,9 +990,9 @@ class BaseButton(
             self.theme_text_color or self._default_theme_text_color
         )
         if self._default_text_color == "PrimaryHue":
-            default_text_color = text_colors[self.theme_cls.primary_palette][
-                self.theme_cls.primary_hue
-            ]
+            default_text_color = self.theme_cls.get_text_rgba(
+                self.theme_cls.primary_palette, self.theme_cls.primary_hue
+            )
         elif self._default_text_color == "Primary":
             default_text_color = self.theme_cls.primary_color
         else:
@@ -1012,9 +1010,9 @@ class BaseButton(
             else "Custom"
         )
         if self._default_icon_color == "PrimaryHue":
-            default_icon_color = text_colors[self.theme_cls.primary_palette][
-                self.theme_cls.primary_hue
-            ]
+            default_icon_color = self.theme_cls.get_text_rgba(
+                self.theme_cls.primary_palette, self.theme_cls.primary_hue
+            )
         elif self._default_icon_color == "Primary":
             default_icon_color = self.theme_cls.primary_color
         else:
@@ -29,13 +29,17 @@ Components/DataTables
 __all__ = ("MDDataTable",)
 
 import os
+import warnings
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from typing import Union
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Union
 
 from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
+    AliasProperty,
     BooleanProperty,
     ColorProperty,
     DictProperty,
@@ -53,6 +57,7 @@ from kivy.uix.recycleview import RecycleView
 from kivy.uix.recycleview.layout import LayoutSelectionBehavior
 from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
 
 from kivymd import uix_path
 from kivymd.effects.stiffscroll import StiffScrollEffect
@@ -60,6 +65,24 @@ from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import HoverBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDIconButton
+from kivymd.uix.datatables.files import (
+    read_arrow_rows,
+    read_csv_rows,
+    write_arrow_rows,
+    write_csv_rows,
+)
+from kivymd.uix.datatables.loader import TableRowLoader
+from kivymd.uix.datatables.search import TableSearchIndex
+from kivymd.uix.datatables.sort import TableSorter
+from kivymd.uix.datatables.sources import PagedRowStore
+from kivymd.uix.datatables.store import (
+    TableCellData,
+    TableDataModel,
+    TablePages,
+    TableRowStore,
+    TableRowView,
+    _shift_rows,
+)
 from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.selectioncontrol import MDCheckbox
 from kivymd.uix.tooltip import MDTooltip
@@ -100,6 +123,34 @@ class TableRecycleGridLayout(
         self.clear_selection()
         return last, nodes
 
+    def compute_sizes_from_data(self, data, flags):
+        if (
+            not isinstance(data, TableCellData)
+            or data.items is not None
+            or not len(data)
+        ):
+            return super().compute_sizes_from_data(data, flags)
+
+        # All table cells have the same size and selection parameters,
+        # so the options are computed for one cell only and copied.
+        opts = self.view_opts
+        if not opts or not all(flags):
+            super().compute_sizes_from_data([data.get_layout_item()], [{}])
+            opts = self.view_opts
+        else:
+            self.clear_layout()
+
+        old_len, new_len = len(opts), len(data)
+        if new_len < old_len:
+            del opts[new_len:]
+        else:
+            opt = opts[0]
+            opts.extend(opt.copy() for _ in range(new_len - old_len))
+
+        if self.key_selection is not None:
+            self._selectable_nodes = list(range(new_len))
+            self._nodes_map = dict(enumerate(range(new_len)))
+
     def select_next(self, instance):
         """Select next row."""
 
@@ -127,7 +178,7 @@ class TableRecycleGridLayout(
         self.select_row(nodes)
 
     def select_row(self, nodes):
-        col = self.table_data.recycle_data[self.selected_row]["range"]
+        col = self.table_data.recycle_data.get_row_range(self.selected_row)
         for x in range(col[0], col[1] + 1):
             self.select_node(nodes[x])
 
@@ -186,19 +237,15 @@ class CellHeader(MDTooltip, BoxLayout):
             box.add_widget(ib, index=1)
 
     def restore_checks(self, indices: dict) -> None:
-        curr_checks = self.table_data.current_selection_check
-        rows_num = self.table_data.rows_num
-        columns = self.table_data.total_col_headings
-
-        new_checks = defaultdict(list)
-        for i, x in enumerate(curr_checks):
-            for j, y in enumerate(curr_checks[x]):
-                new_page = (indices[y // columns + x * rows_num]) // rows_num
-                new_indice = (
-                    (indices[y // columns + x * rows_num]) % rows_num
-                ) * columns
-                new_checks[new_page].append(new_indice)
-        self.table_data.current_selection_check = dict(new_checks)
+        """
+        Moves the checks to the new positions of the rows.
+
+        :param indices: the old row numbers mapped to the new ones;
+        """
+
+        self.table_data.set_selected_rows(
+            indices[row] for row in self.table_data.get_selected_rows()
+        )
 
     def set_sort_btn(self, instance_cell_header) -> None:
         btn = instance_cell_header.ids.box.children[-1]
@@ -212,18 +259,15 @@ class CellHeader(MDTooltip, BoxLayout):
     def _sort_release(self, inst):
         inst.icon = "arrow-down" if inst.icon == "arrow-up" else "arrow-up"
 
-        if not self.parent.parent._col_with_sort:
-            c = self.parent.children
-            col_with_sort = [
-                each
-                for each in c
-                if each.ids.get("box", None) and len(each.ids.box.children) == 2
-            ]
-            self.parent.parent._col_with_sort = col_with_sort
-        else:
-            col_with_sort = self.parent.parent._col_with_sort
+        table_header = self.parent.parent
+        # The header cells that are not created yet are created with this
+        # sort state.
+        table_header.sorted_on = self.text
+        table_header.sorted_order = (
+            "ASC" if inst.icon == "arrow-down" else "DSC"
+        )
 
-        for each in col_with_sort:
+        for each in table_header.get_sort_cells():
             if each == self:
                 self.unbind(on_enter=self.set_sort_btn)
                 self.unbind(on_leave=self.set_sort_btn)
@@ -236,8 +280,24 @@ class CellHeader(MDTooltip, BoxLayout):
 
         if self.sort_action:
             if not self.table_data:
-                th = self.parent.parent
-                self.table_data = th.table_data
+                self.table_data = table_header.table_data
+
+            column = self.table_data.table_header._col_headings.index(
+                self.text
+            )
+            order = "DSC" if inst.icon == "arrow-down" else "ASC"
+            if self.table_data.sort_data_source(column, order):
+                self.table_data.table_header.ids.check.state = "normal"
+                return
+            if not callable(self.sort_action):
+                self.table_data.sort_column(
+                    column,
+                    order,
+                    self.sort_action
+                    if isinstance(self.sort_action, str)
+                    else "natural",
+                )
+                return
 
             indices, sorted_data = self.sort_action(self.table_data.row_data)
 
@@ -312,40 +372,120 @@ class TableHeader(ThemableBehavior, ScrollView):
     and defaults to `None`.
     """
 
-    _col_with_sort = []  # store cols which contain sort functions
     _col_headings = ListProperty()  # column names list
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # Create cells.
+        # Cells of the displayed columns by column number.
+        self._header_cells = {}
+        # Cells of the columns with a sort button; they keep the sort state.
+        self._sort_cells = {}
+        # Cells of the columns without a sort button ready for reuse.
+        self._free_cells = []
+        self._visible_columns = None
+        # Positions of the column edges.
+        self._col_positions = [0]
+        self._left_spacer = Widget()
+        self._right_spacer = Widget()
+
         for i, col_heading in enumerate(self.column_data):
             self.cols_minimum[i] = col_heading[1] * 5
             self._col_headings.append(col_heading[0])
-            if i:
-                self.ids.header.add_widget(
-                    (
-                        CellHeader(
-                            text=col_heading[0],
-                            sort_action=col_heading[2],
-                            width=self.cols_minimum[i],
-                            table_data=self.table_data,
-                            is_sorted=(col_heading[0] == self.sorted_on),
-                            sorted_order=self.sorted_order,
-                        )
-                        if len(col_heading) == 3
-                        else CellHeader(
-                            text=col_heading[0],
-                            width=self.cols_minimum[i],
-                            table_data=self.table_data,
-                        )
-                    )
-                )
-            else:
+            self._col_positions.append(
+                self._col_positions[-1] + self.cols_minimum[i]
+            )
+            if not i:
                 # Sets the text in the first cell.
                 self.ids.first_cell.text = col_heading[0]
                 self.ids.first_cell.ids.separator.height = 0
                 self.ids.first_cell.width = self.cols_minimum[i]
 
+        self.fbind("scroll_x", self.update_visible_cells)
+        self.fbind("width", self.update_visible_cells)
+        self.update_visible_cells()
+
+    def update_visible_cells(self, *args) -> None:
+        """
+        Creates the header cells of the columns that are displayed in the
+        header viewport and removes the cells of the other columns.
+        The removed cells of the columns without a sort button are reused
+        for other columns.
+
+        Called when :attr:`~kivy.uix.scrollview.ScrollView.scroll_x`
+        changes, see :meth:`MDDataTable._scroll_with_header`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        positions = self._col_positions
+        n_cols = len(positions) - 1
+        if not n_cols:
+            return
+        left = self.scroll_x * max(0, positions[-1] - self.width)
+        # One more column on each side, so the cells are ready before
+        # they are scrolled into view.
+        first = max(1, bisect_right(positions, left) - 2)
+        last = min(n_cols, bisect_left(positions, left + self.width) + 1)
+        if self._visible_columns == (first, last):
+            return
+        self._visible_columns = (first, last)
+
+        for col in list(self._header_cells):
+            if not first <= col < last:
+                cell = self._header_cells.pop(col)
+                if col not in self._sort_cells:
+                    self._free_cells.append(cell)
+
+        header = self.ids.header
+        # The first child is the cell of the first column.
+        for widget in header.children[:-1]:
+            header.remove_widget(widget)
+        cols_minimum = {
+            0: self.cols_minimum[0],
+            1: positions[first] - positions[1],
+        }
+        header.add_widget(self._left_spacer)
+        for col in range(first, last):
+            cell = self._header_cells.get(col) or self._get_cell(col)
+            self._header_cells[col] = cell
+            cols_minimum[len(cols_minimum)] = self.cols_minimum[col]
+            header.add_widget(cell)
+        cols_minimum[len(cols_minimum)] = positions[-1] - positions[last]
+        header.add_widget(self._right_spacer)
+        header.cols_minimum = cols_minimum
+
+    def get_sort_cells(self) -> list:
+        """
+        Returns the created header cells of the columns with a sort button.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return list(self._sort_cells.values())
+
+    def _get_cell(self, col: int) -> CellHeader:
+        col_heading = self.column_data[col]
+        if len(col_heading) == 3:
+            cell = self._sort_cells[col] = CellHeader(
+                text=col_heading[0],
+                sort_action=col_heading[2],
+                width=self.cols_minimum[col],
+                table_data=self.table_data,
+                is_sorted=(col_heading[0] == self.sorted_on),
+                sorted_order=self.sorted_order,
+            )
+        elif self._free_cells:
+            cell = self._free_cells.pop()
+            cell.text = col_heading[0]
+            cell.width = self.cols_minimum[col]
+        else:
+            cell = CellHeader(
+                text=col_heading[0],
+                width=self.cols_minimum[col],
+                table_data=self.table_data,
+            )
+        return cell
+
     def on_table_data(self, instance_table_header, instance_table_data) -> None:
         """Sets the checkbox in the first cell."""
 
@@ -358,14 +498,35 @@ class TableHeader(ThemableBehavior, ScrollView):
 
 
 class TableData(RecycleView):
-    """Implements a list of table data."""
+    """
+    Implements a list of table data.
+
+    .. versionchanged:: 1.1.0
+
+        :attr:`recycle_data` is a
+        :class:`~kivymd.uix.datatables.store.TableCellData` sequence
+        instead of a list of dictionaries. Reading the cells works as
+        before; changing them in place with the `list` methods or
+        assigning a list of dictionaries is deprecated and issues a
+        :class:`DeprecationWarning`.
+    """
 
-    recycle_data = ListProperty()
+    recycle_data = ObjectProperty(TableCellData(), rebind=False)
     """
     See :attr:`~kivy.uix.recycleview.RecycleView.data`.
 
-    :attr:`recycle_data` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[]`.
+    The cells of the current page are a
+    :class:`~kivymd.uix.datatables.store.TableCellData` sequence: the cell
+    dictionaries are created only for the views that are displayed.
+
+    .. versionchanged:: 1.1.0
+
+        A :class:`~kivymd.uix.datatables.store.TableCellData` sequence
+        instead of a list of dictionaries.
+
+    :attr:`recycle_data` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to an empty
+    :class:`~kivymd.uix.datatables.store.TableCellData`.
     """
 
     data_first_cells = ListProperty()
@@ -376,12 +537,34 @@ class TableData(RecycleView):
     and defaults to `[]`.
     """
 
-    row_data = ListProperty()
+    def _get_row_data(self) -> list:
+        return self._parent.row_data if self._parent else []
+
+    def _set_row_data(self, value: list) -> None:
+        self._parent.row_data = value
+
+    row_data = AliasProperty(_get_row_data, _set_row_data, bind=("_parent",))
     """
     See :attr:`~MDDataTable.row_data`.
 
-    :attr:`row_data` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[]`.
+    .. versionchanged:: 1.1.0
+
+        The :attr:`~MDDataTable.row_data` list of the table itself, not
+        a copy: the rows are kept once in this list and once in the
+        :class:`~kivymd.uix.datatables.store.TableRowStore` columns.
+
+    :attr:`row_data` is an :class:`~kivy.properties.AliasProperty`.
+    """
+
+    row_count = NumericProperty(0)
+    """
+    Number of table rows in the :attr:`row_data` list or in the
+    :attr:`~MDDataTable.data_source` data source.
+
+    .. versionadded:: 1.1.0
+
+    :attr:`row_count` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
     """
 
     total_col_headings = NumericProperty(0)  # TableHeader._col_headings
@@ -449,11 +632,49 @@ class TableData(RecycleView):
     and defaults to `False`.
     """
 
-    current_selection_check = DictProperty()
+    def _get_current_selection_check(self) -> dict:
+        # The pages and offsets of the displayed positions of the rows;
+        # the hidden rows are skipped.
+        if self._view_indices is None:
+            positions = sorted(self._selected_rows)
+        else:
+            positions = [
+                position
+                for position, row in enumerate(self._view_indices)
+                if row in self._selected_rows
+            ]
+        checks = defaultdict(list)
+        for position in positions:
+            page, row = divmod(position, self.rows_num)
+            checks[page].append(row * self.total_col_headings)
+        return dict(checks)
+
+    def _set_current_selection_check(self, checks: dict) -> None:
+        view = self.get_row_view()
+        positions = (
+            page * self.rows_num + index // self.total_col_headings
+            for page in checks
+            for index in checks[page]
+        )
+        self.set_selected_rows(
+            view.get_row_id(position)
+            for position in positions
+            if 0 <= position < len(view)
+        )
+
+    current_selection_check = AliasProperty(
+        _get_current_selection_check, _set_current_selection_check
+    )
     """
-    List of indexes of marked checkboxes.
+    Indexes of the first cells of the marked rows by page number.
+
+    The checks are stored as a set of row numbers from the :attr:`row_data`
+    list, see :meth:`get_selected_rows`. The pages and indexes are those of
+    the displayed (sorted and filtered) rows.
 
-    :attr:`current_selection_check` is an :class:`~kivy.properties.DictProperty`
+    .. versionchanged:: 1.1.0
+
+    :attr:`current_selection_check` is an :class:`~kivy.properties.AliasProperty`
     and defaults to `{}`.
     """
 
@@ -464,9 +685,27 @@ class TableData(RecycleView):
     _rows_num = NumericProperty()
     _current_value = NumericProperty(1)
     _to_value = NumericProperty()
-    _row_data_parts = ListProperty()
+
+    def _get_row_data_parts(self) -> TablePages:
+        return TablePages(self.row_data, self.rows_num)
+
+    # Pages of the row_data list; the rows are not copied.
+    _row_data_parts = AliasProperty(
+        _get_row_data_parts, None, bind=("row_data", "rows_num")
+    )
+    _row_store = None
+    _sorter = None
+    _search_index = None
+    _filter = None
+    _filter_rows = None
+    _view_indices = None
+    _row_data_lock = False
+    _batch_depth = 0
+    _batch_changed = False
 
     def __init__(self, table_header, **kwargs):
+        self._selected_rows = set()
+        kwargs.setdefault("data_model", TableDataModel())
         super().__init__(**kwargs)
         self.table_header = table_header
         self.total_col_headings = len(table_header._col_headings)
@@ -478,165 +717,435 @@ class TableData(RecycleView):
     def get_select_row(self, index: int) -> None:
         """Returns the current row with all elements."""
 
-        row = []
-        for data in self.recycle_data:
-            if index in data["range"]:
-                row.append(data["text"])
-        self._parent.dispatch("on_check_press", row)
-        self._get_row_checks()  # update the dict
+        row_id = self.recycle_data.get_row_id(index)
+        self._parent.dispatch(
+            "on_check_press", self.get_row_store().get_row_texts(row_id)
+        )
+
+    def get_selected_rows(self) -> set:
+        """
+        Returns the numbers of the checked rows from the :attr:`row_data`
+        list.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return self._selected_rows
+
+    def set_selected_rows(self, rows) -> None:
+        """
+        Sets the numbers of the checked rows from the :attr:`row_data`
+        list and updates the checkboxes of the displayed rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self._selected_rows = set(rows)
+        self._refresh_checks()
+
+    def select_row_id(self, row_id: int, state: str) -> None:
+        """
+        Checks/unchecks the row with the `row_id` number from
+        the :attr:`row_data` list.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if state == "down":
+            self._selected_rows.add(row_id)
+        else:
+            self._selected_rows.discard(row_id)
 
     def set_default_first_row(self, interval: Union[int, float]) -> None:
         """Set default first row as selected."""
 
         self.ids.row_controller.select_next(self)
 
+    def get_row_store(self) -> TableRowStore:
+        """
+        Returns the :class:`~kivymd.uix.datatables.store.TableRowStore`
+        object with the columns of the :attr:`row_data` list.
+        """
+
+        if self._row_store is None:
+            source = self._get_data_source()
+            if source is not None:
+                self._row_store = PagedRowStore(
+                    source,
+                    self.total_col_headings,
+                    self.rows_num,
+                )
+            else:
+                self._row_store = TableRowStore(
+                    self.row_data, self.total_col_headings
+                )
+                self._refresh_row_view()
+            self.row_count = len(self._row_store)
+        return self._row_store
+
+    def get_row_view(self) -> Union[TableRowStore, TableRowView]:
+        """
+        Returns the rows in the displayed order: the row store or
+        a :class:`~kivymd.uix.datatables.store.TableRowView` of the sorted
+        and filtered rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        store = self.get_row_store()
+        if self._view_indices is not None:
+            return TableRowView(store, self._view_indices)
+        return store
+
+    def get_row_count(self) -> int:
+        """
+        Returns the number of table rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return len(self.get_row_view())
+
+    def iter_row_texts(self) -> Iterator[list]:
+        """
+        Yields the texts of the table rows in the displayed order.
+
+        .. versionadded:: 1.1.0
+        """
+
+        view = self.get_row_view()
+        for row in range(len(view)):
+            yield view.get_row_texts(row)
+
+    def get_sorter(self) -> TableSorter:
+        """
+        Returns the :class:`~kivymd.uix.datatables.sort.TableSorter` object
+        of the :attr:`row_data` rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._sorter is None:
+            self._sorter = TableSorter(self.get_row_store())
+        return self._sorter
+
+    def get_search_index(self) -> TableSearchIndex:
+        """
+        Returns the :class:`~kivymd.uix.datatables.search.TableSearchIndex`
+        object of the :attr:`row_data` rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._search_index is None:
+            self._search_index = TableSearchIndex(self.get_row_store())
+        return self._search_index
+
+    def filter_rows(self, filters: Union[dict, None]) -> None:
+        """
+        Displays only the rows that contain the texts of all columns of the
+        `filters` dictionary, see
+        :meth:`~kivymd.uix.datatables.search.TableSearchIndex.filter`.
+        `None` or an empty dictionary displays all rows.
+
+        The filter is pushed down to the :attr:`~MDDataTable.data_source`
+        data source if it is set.
+
+        .. versionadded:: 1.1.0
+        """
+
+        filters = dict(filters or {})
+        source = self._get_data_source()
+        if source is not None:
+            if source.set_filter(filters):
+                self._reset_data_source()
+            return
+
+        self._filter = ("filter", filters) if filters else None
+        self._apply_filter()
+
+    def search_rows(
+        self, text: str, columns: Union[list, None] = None
+    ) -> None:
+        """
+        Displays only the rows that contain the `text` text in any of the
+        `columns` columns, see
+        :meth:`~kivymd.uix.datatables.search.TableSearchIndex.search`.
+        An empty text displays all rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._get_data_source() is not None:
+            raise ValueError(
+                "The rows of the table with a data source can only be "
+                "filtered by columns, see MDDataTable.filter"
+            )
+
+        self._filter = ("search", text, columns) if text else None
+        self._apply_filter()
+
+    def sort_rows(self, spec: list) -> None:
+        """
+        Sorts the rows by several columns, see
+        :meth:`~kivymd.uix.datatables.sort.TableSorter.sort`.
+        The checked rows stay checked.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._get_data_source() is not None:
+            # Only the primary column is pushed down to the data source.
+            column, order = spec[0][:2] if spec else (None, "ASC")
+            self.sort_data_source(column, order)
+            return
+
+        self.get_sorter().sort(spec)
+        self._update_row_view()
+        self._rows_number = 0
+        self.refresh_page()
+
+    def sort_column(
+        self, column: int, order: str = "ASC", key: str = "natural"
+    ) -> None:
+        """
+        Sorts the rows by the `column` column, see
+        :meth:`~kivymd.uix.datatables.sort.TableSorter.sort_column`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self.get_sorter().sort_column(column, order, key)
+        self._update_row_view()
+        self._rows_number = 0
+        self.refresh_page()
+
+    def update_data_source(self) -> None:
+        """
+        Called when the :attr:`~MDDataTable.data_source` data source
+        or its rows were changed. Displays the first page of the table.
+
+        .. versionadded:: 1.1.0
+        """
+
+        source = self._get_data_source()
+        if source is not None:
+            source.refresh()
+        self._reset_data_source()
+
+    def sort_data_source(self, column: int, order: str) -> bool:
+        """
+        Sorts the rows of the :attr:`~MDDataTable.data_source` data source.
+        Returns `False` if the table has no data source or the data source
+        does not support sorting.
+
+        .. versionadded:: 1.1.0
+        """
+
+        source = self._get_data_source()
+        if source is None or not source.set_sort(column, order):
+            return False
+        self._reset_data_source()
+        return True
+
+    def get_page_bounds(self, page: int) -> tuple:
+        """
+        Returns the numbers of the first row of the `page` page and of the
+        row after its last row.
+
+        .. versionadded:: 1.1.0
+        """
+
+        pages = TablePages(self.get_row_view(), self.rows_num)
+        return pages.get_page_bounds(page)
+
+    def get_page_count(self) -> int:
+        """
+        Returns the number of table pages.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return len(TablePages(self.get_row_view(), self.rows_num))
+
     def set_row_data(self) -> None:
-        data = []
-        low = 0
-        high = self.total_col_headings - 1
-        self.recycle_data = []
         self.data_first_cells = []
-
-        if self._row_data_parts:
-            # for row in self.row_data:
-            for row in self._row_data_parts[self._rows_number]:
-                for i in range(len(row)):
-                    data.append([row[i], row[0], [low, high]])
-                low += self.total_col_headings
-                high += self.total_col_headings
-
-            for j, x in enumerate(data):
-                if x[0] == x[1]:
-                    self.data_first_cells.append(x[2][0])
-                    self.recycle_data.append(
-                        {
-                            "text": str(x[0]),
-                            "Index": str(j),
-                            "range": x[2],
-                            "selectable": True,
-                            "viewclass": "CellRow",
-                            "table": self,
-                            "background_color_cell": self._parent.background_color_cell,
-                            "background_color_selected_cell": self._parent.background_color_selected_cell,
-                        }
-                    )
-                else:
-                    r_data = {
-                        "Index": str(j),
-                        "range": x[2],
-                        "selectable": True,
-                        "viewclass": "CellRow",
-                        "table": self,
-                        "background_color_cell": self._parent.background_color_cell,
-                        "background_color_selected_cell": self._parent.background_color_selected_cell,
-                    }
-
-                    if (
-                        isinstance(x[0], tuple) or isinstance(x[0], list)
-                    ) and len(x[0]) == 3:
-                        r_data["icon"] = x[0][0]
-                        r_data["icon_color"] = x[0][1]
-                        r_data["text"] = str(x[0][2])
-                        self.recycle_data.append(r_data)
-
-                    elif (
-                        isinstance(x[0], tuple) or isinstance(x[0], list)
-                    ) and len(x[0]) == 2:
-                        r_data["icon"] = x[0][0]
-                        r_data["text"] = str(x[0][1])
-
-                        self.recycle_data.append(r_data)
-
-                    else:
-                        r_data["text"] = str(x[0])
-                        self.recycle_data.append(r_data)
+        start, stop = self.get_page_bounds(self._rows_number)
+
+        if start < stop:
+            if isinstance(self.get_row_store(), PagedRowStore):
+                self.get_row_store().prefetch(start, stop)
+            self.recycle_data = TableCellData(
+                self.get_row_view(),
+                start,
+                stop,
+                {
+                    "selectable": True,
+                    "viewclass": "CellRow",
+                    "table": self,
+                    "background_color_cell": self._parent.background_color_cell,
+                    "background_color_selected_cell": self._parent.background_color_selected_cell,
+                },
+            )
+            self.data_first_cells = list(
+                range(0, len(self.recycle_data), self.total_col_headings)
+            )
 
             if not self.table_header.column_data:
                 raise ValueError("Set value for column_data in class TableData")
             self.data_first_cells.append(self.table_header.column_data[0][0])
+        else:
+            self.recycle_data = TableCellData()
+
+    def insert_rows(self, row_id: int, rows: list) -> None:
+        """
+        Inserts the `rows` rows before the `row_id` row of the
+        :attr:`row_data` list.
+
+        Only the cells of the displayed page that are shifted by the new
+        rows are updated.
+
+        .. versionadded:: 1.1.0
+        """
+
+        rows = list(rows)
+        if not rows:
+            return
+
+        store = self.get_row_store()
+        self._change_row_data(slice(row_id, row_id), rows)
+        store.insert_rows(row_id, rows)
+        self.row_count = len(store)
+        self._selected_rows = {
+            row + len(rows) if row >= row_id else row
+            for row in self._selected_rows
+        }
+        self._change_view_rows(row_id, 0, len(rows))
+        self._update_page_cells(row_id)
+
+    def remove_rows(self, row_id: int, count: int = 1) -> None:
+        """
+        Removes `count` rows starting from the `row_id` row of the
+        :attr:`row_data` list.
+
+        .. versionadded:: 1.1.0
+        """
+
+        store = self.get_row_store()
+        count = min(count, len(store) - row_id)
+        if count <= 0:
+            return
+
+        self._change_row_data(slice(row_id, row_id + count), [])
+        store.remove_rows(row_id, count)
+        self.row_count = len(store)
+        self._selected_rows = {
+            row - count if row >= row_id else row
+            for row in self._selected_rows
+            if not row_id <= row < row_id + count
+        }
+        self._change_view_rows(row_id, count, 0)
+        self._update_page_cells(row_id)
+
+    def update_rows(self, row_id: int, rows: list) -> None:
+        """
+        Replaces the rows of the :attr:`row_data` list starting from the
+        `row_id` row.
+
+        .. versionadded:: 1.1.0
+        """
+
+        store = self.get_row_store()
+        rows = list(rows)[: len(store) - row_id]
+        if not rows:
+            return
+
+        self._change_row_data(slice(row_id, row_id + len(rows)), rows)
+        store.set_rows(row_id, rows)
+        self._change_view_rows(row_id, len(rows), len(rows))
+        self._update_page_cells(row_id, len(rows))
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that postpones the updates of the displayed page
+        until all row changes are applied.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self._update_page_cells(0)
+
+    def refresh_page(self) -> None:
+        """
+        Updates the cells of the displayed page and the pagination
+        counters.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self._rows_number = min(
+            self._rows_number, max(0, self.get_page_count() - 1)
+        )
+        self.set_row_data()
+        self._update_pagination()
 
     def set_text_from_of(self, direction: str) -> None:
         """Sets the text of the numbers of displayed pages in table."""
 
         if self.pagination:
-            if direction == "reset":
-                self._current_value = 1
-                self._to_value = len(self._row_data_parts[self._rows_number])
-            elif direction == "forward":
-                if (
-                    len(self._row_data_parts[self._rows_number])
-                    < self._to_value
-                ):
-                    self._current_value = self._current_value + self.rows_num
-                else:
-                    self._current_value = self._current_value + len(
-                        self._row_data_parts[self._rows_number]
-                    )
-                self._to_value = self._to_value + len(
-                    self._row_data_parts[self._rows_number]
-                )
-            if direction == "back":
-                self._current_value = self._current_value - len(
-                    self._row_data_parts[self._rows_number]
-                )
-                self._to_value = self._to_value - len(
-                    self._row_data_parts[self._rows_number + 1]
-                )
-            if direction == "increment":
-                self._current_value = 1
-                self._to_value = self.rows_num + self._current_value - 1
+            start, stop = self.get_page_bounds(self._rows_number)
+            self._current_value = start + 1
+            self._to_value = stop
 
             self.pagination.ids.label_rows_per_page.text = (
                 f"{self._current_value}-{self._to_value} "
-                f"of {len(self.row_data)}"
+                f"of {self.get_row_count()}"
             )
 
     def select_all(self, state: str) -> None:
-        """Sets the checkboxes of all rows to the active/inactive position."""
-
-        for i in range(0, len(self.recycle_data), self.total_col_headings):
-            cell_row_obj = self.view_adapter.get_visible_view(i)
-            if cell_row_obj:
-                self.cell_row_obj_dict[i] = cell_row_obj
-                self.on_mouse_select(cell_row_obj)
-                cell_row_obj.ids.check.state = state
+        """
+        Sets the checkboxes of all rows to the active/inactive position.
+        While the rows are filtered, only the displayed rows are changed,
+        the selection of the hidden rows is kept.
+        """
 
-        if state == "down":
-            # select all checks on all pages
-            rows_num = self.rows_num
-            columns = self.total_col_headings
-            full_pages = len(self.row_data) // self.rows_num
-            left_over_rows = len(self.row_data) % self.rows_num
-
-            new_checks = {}
-            for page in range(full_pages):
-                new_checks[page] = list(range(0, rows_num * columns, columns))
-
-            if left_over_rows:
-                new_checks[full_pages] = list(
-                    range(0, left_over_rows * columns, columns)
+        if self._view_indices is not None:
+            if state == "down":
+                self.set_selected_rows(
+                    self._selected_rows.union(self._view_indices)
                 )
-
-            self.current_selection_check = new_checks
-            return
-
-        # resets all checks on all pages
-        self.current_selection_check = {}
+            else:
+                self.set_selected_rows(
+                    self._selected_rows.difference(self._view_indices)
+                )
+        elif state == "down":
+            # select all checks on all pages
+            self.set_selected_rows(range(self.get_row_count()))
+        else:
+            # resets all checks on all pages
+            self.set_selected_rows(())
 
     def check_all(self, state: str) -> bool:
-        """Checks if checkboxes of all rows are in the same state."""
+        """
+        Checks if checkboxes of all (displayed, while the rows are filtered)
+        rows are in the same state.
+        """
 
-        tmp = []
-        for i in range(0, len(self.recycle_data), self.total_col_headings):
-            if self.cell_row_obj_dict.get(i, None):
-                cell_row_obj = self.cell_row_obj_dict[i]
-            else:
-                cell_row_obj = self.view_adapter.get_visible_view(i)
-                if cell_row_obj:
-                    self.cell_row_obj_dict[i] = cell_row_obj
-            if cell_row_obj:
-                tmp.append(cell_row_obj.ids.check.state == state)
-        return all(tmp)
+        if self._view_indices is not None:
+            if state == "down":
+                return self._selected_rows.issuperset(self._view_indices)
+            return self._selected_rows.isdisjoint(self._view_indices)
+        if state == "down":
+            return len(self._selected_rows) == self.get_row_count()
+        return not self._selected_rows
 
     def close_pagination_menu(self, *args) -> None:
         """Called when the pagination menu window is closed."""
@@ -679,7 +1188,7 @@ class TableData(RecycleView):
         self.set_row_data()
         self.set_text_from_of(direction)
 
-        if self._to_value == len(self.row_data):
+        if self._to_value == self.get_row_count():
             self.pagination.ids.button_forward.disabled = True
         if self._current_value == 1:
             self.pagination.ids.button_back.disabled = True
@@ -692,46 +1201,217 @@ class TableData(RecycleView):
                 self.ids.row_controller.selected_row = instance_cell_row.index
                 self.ids.row_controller.select_current(self)
 
+    def on_recycle_data(self, instance_table_data, cells) -> None:
+        if isinstance(cells, list):
+            warnings.warn(
+                "Assigning a list to TableData.recycle_data is deprecated, "
+                "set MDDataTable.row_data instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self.recycle_data = TableCellData.from_list(
+                cells, self.total_col_headings
+            )
+        else:
+            cells.on_change = self._on_recycle_data_change
+
+    def on_row_data(self, instance_table_data, row_data: list) -> None:
+        if not self._row_data_lock and self._get_data_source() is None:
+            self._row_store = None
+            self.row_count = len(row_data)
+
+    def _on_recycle_data_change(self, cells: TableCellData) -> None:
+        # The cells of the page were changed in place with the deprecated
+        # list methods.
+        if cells is not self.recycle_data:
+            return
+        self.data_first_cells = list(
+            range(0, len(cells), self.total_col_headings or 1)
+        )
+        if self.table_header.column_data:
+            self.data_first_cells.append(self.table_header.column_data[0][0])
+        self.data_model.refresh_cells()
+
     def on_rows_num(self, instance_table_date, value_rows_num: int) -> None:
         if not self._to_value:
             self._to_value = value_rows_num
 
         self._rows_number = 0
-        self._row_data_parts = list(
-            self._split_list_into_equal_parts(self.row_data, value_rows_num)
-        )
 
     def on_pagination(
         self, instance_table_date, instance_table_pagination
     ) -> None:
-        if self._to_value < len(self.row_data):
+        if self._to_value < self.get_row_count():
             self.pagination.ids.button_forward.disabled = False
 
-    def _split_list_into_equal_parts(self, lst, parts):
-        for i in range(0, len(lst), parts):
-            yield lst[i : i + parts]
-
     def _get_row_checks(self):
         """Returns all rows that are checked."""
 
-        tmp = []
-        for i in range(0, len(self.recycle_data), self.total_col_headings):
-            if self.cell_row_obj_dict.get(i, None):
-                cell_row_obj = self.cell_row_obj_dict[i]
-            else:
-                cell_row_obj = self.view_adapter.get_visible_view(i)
-                if cell_row_obj:
-                    self.cell_row_obj_dict[i] = cell_row_obj
+        store = self.get_row_store()
+        return [
+            store.get_row_texts(row)
+            for row in sorted(self._selected_rows)
+            if row < len(store)
+        ]
+
+    def _get_data_source(self):
+        return self._parent.data_source if self._parent else None
+
+    def _reset_data_source(self) -> None:
+        # Drops the fetched rows and displays the first page.
+        self._row_store = None
+        self._selected_rows = set()
+        self._rows_number = 0
+        self.refresh_page()
+
+    def _change_row_data(self, index: slice, rows: list) -> None:
+        # Changes the row list of the table without rebuilding the row
+        # store.
+        if self._get_data_source() is not None:
+            raise ValueError(
+                "The rows of the table with a data source must be changed "
+                "in the data source, see MDDataTable.update_data_source"
+            )
+        self._row_data_lock = True
+        try:
+            self._parent.row_data[index] = rows
+        finally:
+            self._row_data_lock = False
+
+    def _update_page_cells(self, row_id: int, count: int = 0) -> None:
+        # Updates the cells of the displayed page after the rows starting
+        # from the `row_id` row have been changed. The `count` argument is
+        # the number of the replaced rows; if it is zero, the rows were
+        # inserted or removed, so all following rows are shifted.
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        if self._view_indices is not None:
+            self.refresh_page()
+            return
+
+        data = self.recycle_data
+        start, stop = self.get_page_bounds(self._rows_number)
+        if start >= stop or data.store is None or data.start != start:
+            self.refresh_page()
+            return
+
+        cols = self.total_col_headings
+        old_rows = data.stop - data.start
+        new_rows = stop - start
+        first = max(row_id, start) - start
+        last = min(row_id + count, stop) - start if count else new_rows
+        data.stop = stop
+
+        if first < min(last, old_rows):
+            self.data_model.refresh_cells(
+                modified=slice(first * cols, min(last, old_rows) * cols)
+            )
+        if new_rows > old_rows:
+            self.data_model.refresh_cells(
+                appended=slice(old_rows * cols, new_rows * cols)
+            )
+        elif new_rows < old_rows:
+            self.data_model.refresh_cells(
+                removed=slice(new_rows * cols, old_rows * cols)
+            )
+        if new_rows != old_rows:
+            self.data_first_cells = list(range(0, len(data), cols)) + [
+                self.table_header.column_data[0][0]
+            ]
+        self._update_pagination()
+
+    def _apply_filter(self) -> None:
+        # Finds the rows of the current filter and displays the first page.
+        self._filter_rows = self._get_filter_rows()
+        self._update_row_view()
+        self._rows_number = 0
+        self.refresh_page()
+
+    def _refresh_row_view(self) -> None:
+        # Sorts and filters the rows again after the row store was changed.
+        store = self._row_store
+        if self._sorter is not None:
+            self._sorter.refresh(store)
+        if self._search_index is not None:
+            self._search_index.refresh(store)
+        self._filter_rows = self._get_filter_rows()
+        self._update_row_view()
+
+    def _change_view_rows(self, row_id: int, removed: int, added: int) -> None:
+        # Updates the sort keys, the search texts, the sort order and the
+        # filtered rows after `removed` rows starting from the `row_id` row
+        # were replaced with `added` rows. Only the new rows are sorted and
+        # filtered, the other rows keep their keys and positions.
+        old_count = len(self._row_store) - added + removed
+        if self._sorter is not None:
+            self._sorter.change_rows(row_id, removed, added)
+        if self._search_index is not None:
+            self._search_index.change_rows(row_id, removed, added)
+        if self._view_indices is None:
+            return
+
+        matched = range(row_id, row_id + added)
+        rows = self._filter_rows
+        if rows is not None:
+            matched = self._get_filter_rows(matched)
+            # The filtered rows are ascending.
+            start = bisect_left(rows, row_id)
+            stop = bisect_left(rows, row_id + removed, start)
+            rows[start:] = matched + [
+                row + added - removed for row in rows[stop:]
+            ]
 
-            if cell_row_obj and cell_row_obj.ids.check.state == "down":
-                idx = cell_row_obj.index
-                row = []
-                for data in self.recycle_data:
-                    if idx in data["range"]:
-                        row.append(data["text"])
+        order = self._sorter.order if self._sorter is not None else None
+        if rows is None or order is None:
+            self._view_indices = order if rows is None else rows
+            return
+        view = self._view_indices
+        if removed or row_id < old_count:
+            _shift_rows(view, row_id, removed, added)
+        for row in matched:
+            view.insert(self._sorter.bisect(view, row), row)
+
+    def _get_filter_rows(self, rows=None) -> Union[list, None]:
+        # The filtered rows of the current filter; only the `rows` rows
+        # are checked if they are passed.
+        if self._filter is None:
+            return None
+        if self._filter[0] == "filter":
+            return self.get_search_index().filter(self._filter[1], rows)
+        return self.get_search_index().search(*self._filter[1:], rows)
+
+    def _update_row_view(self) -> None:
+        # Combines the sort order and the filtered rows into the numbers
+        # of the displayed rows.
+        order = self._sorter.order if self._sorter is not None else None
+        rows = self._filter_rows
+        if rows is None or order is None:
+            self._view_indices = order if rows is None else rows
+        else:
+            matched = bytearray(len(order))
+            for row in rows:
+                matched[row] = 1
+            self._view_indices = [row for row in order if matched[row]]
 
-                tmp.append(row)
-        return tmp
+    def _update_pagination(self) -> None:
+        self.set_text_from_of("")
+        if self.pagination:
+            self.pagination.ids.button_forward.disabled = (
+                self._to_value >= self.get_row_count()
+            )
+            self.pagination.ids.button_back.disabled = self._current_value <= 1
+
+    def _refresh_checks(self) -> None:
+        # Updates the checkboxes of the displayed rows only.
+        for index, cell_row_obj in self.view_adapter.views.items():
+            if not index % self.total_col_headings:
+                cell_row_obj.change_check_state_no_notify(
+                    "down"
+                    if self.recycle_data.get_row_id(index)
+                    in self._selected_rows
+                    else "normal"
+                )
 
     # def on_pagination(self, instance_table, instance_pagination):
     #    if len(self._row_data_parts) <= self._to_value:
@@ -760,6 +1440,15 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
             Called when a table row is clicked.
         :attr:`on_check_press`
             Called when the check box in the table row is checked.
+        :attr:`on_load_progress`
+            Called when rows loaded by :meth:`load_rows` were added to
+            the table.
+        :attr:`on_load_complete`
+            Called when all rows loaded by :meth:`load_rows` were added to
+            the table.
+        :attr:`on_load_error`
+            Called when reading or formatting the rows loaded by
+            :meth:`load_rows` failed.
 
     .. rubric:: Use events as follows
 
@@ -1199,6 +1888,36 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
     and defaults to `[]`.
     """
 
+    data_source = ObjectProperty(None, allownone=True)
+    """
+    Data source of the table rows, see
+    :class:`~kivymd.uix.datatables.sources.TableDataSource`.
+    If set, the table rows are fetched from the data source page by page
+    and :attr:`row_data` is not used.
+
+    To enable sorting of a column that is pushed down to the data source,
+    pass `True` as the third element of the column in :attr:`column_data`:
+
+    .. code-block:: python
+
+        import sqlite3
+
+        from kivymd.uix.datatables.sources import SQLiteDataSource
+
+        MDDataTable(
+            use_pagination=True,
+            column_data=[("Id", dp(30), True), ("Name", dp(60), True)],
+            data_source=SQLiteDataSource(
+                sqlite3.connect("people.db"), "SELECT id, name FROM people"
+            ),
+        )
+
+    .. versionadded:: 1.1.0
+
+    :attr:`data_source` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
     sorted_on = StringProperty()
     """
     Column name upon which the data is already sorted.
@@ -1465,6 +2184,8 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
     and defaults to :class:`~kivymd.effects.stiffscroll.StiffScrollEffect`.
     """
 
+    _loader = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.header = TableHeader(
@@ -1475,13 +2196,15 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         )
         self.table_data = TableData(
             self.header,
-            row_data=self.row_data,
             check=self.check,
             rows_num=self.rows_num,
             _parent=self,
         )
         self.register_event_type("on_row_press")
         self.register_event_type("on_check_press")
+        self.register_event_type("on_load_progress")
+        self.register_event_type("on_load_complete")
+        self.register_event_type("on_load_error")
         self.pagination = TablePagination(table_data=self.table_data)
         self.table_data.pagination = self.pagination
         self.header.table_data = self.table_data
@@ -1492,18 +2215,22 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
             self.ids.container.add_widget(self.pagination)
             Clock.schedule_once(self.create_pagination_menu, 0.5)
         self.bind(row_data=self.update_row_data)
+        self.bind(data_source=self.update_data_source)
 
     def update_row_data(self, instance_data_table, data: list) -> None:
         """
         Called when a the widget data must be updated.
 
         Remember that this is a heavy function. since the whole data set must
-        be updated. you can get better results calling this metod with in a
-        coroutine.
+        be updated. Use :meth:`load_rows` to load large data sets in
+        the background.
         """
 
-        self.table_data.row_data = data
-        self.row_data = data
+        if self.table_data._row_data_lock:
+            return
+
+        # The rows of the table data are the rows of this list.
+        self.table_data.property("row_data").dispatch(self.table_data)
         self.table_data.on_rows_num(self, self.table_data.rows_num)
         # Set cursors to 0.
         self.table_data._rows_number = 0
@@ -1521,6 +2248,101 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         if self.use_pagination:
             Clock.schedule_once(self.create_pagination_menu, 0.5)
 
+    def sort_by(self, columns: list) -> None:
+        """
+        Sorts the table rows by several columns. `columns` is a list of
+        `(column, order)` or `(column, order, key)` tuples, where `column`
+        is the column name or number, `order` is `'ASC'` or `'DSC'`
+        and `key` is the name of the key extractor, see
+        :class:`~kivymd.uix.datatables.sort.TableSorter`. The first column
+        is the primary one. An empty list restores the original order.
+
+        .. code-block:: python
+
+            self.data_tables.sort_by(
+                [("Status", "ASC"), ("No.", "DSC", "numeric")]
+            )
+
+        .. versionadded:: 1.1.0
+        """
+
+        headings = self.header._col_headings
+        self.table_data.sort_rows(
+            [
+                (
+                    column[0]
+                    if isinstance(column[0], int)
+                    else headings.index(column[0]),
+                    column[1],
+                    column[2] if len(column) > 2 else "natural",
+                )
+                for column in columns
+            ]
+        )
+
+    def filter(self, filters: Union[dict, None]) -> None:
+        """
+        Displays only the rows that contain the given texts
+        (case-insensitive). `filters` is a dictionary of texts by the column
+        names or numbers; `None` displays all rows.
+
+        Call this method on each change of a search field: when the text is
+        extended, only the rows found by the previous call are checked
+        again. See :mod:`~kivymd.uix.datatables.search`.
+
+        .. code-block:: python
+
+            self.data_tables.filter({"Name": "tom", 3: "2022"})
+
+        .. versionadded:: 1.1.0
+        """
+
+        headings = self.header._col_headings
+        self.table_data.filter_rows(
+            {
+                column
+                if isinstance(column, int)
+                else headings.index(column): text
+                for column, text in (filters or {}).items()
+            }
+        )
+
+    def search(self, text: str, columns: Union[list, None] = None) -> None:
+        """
+        Displays only the rows that contain the `text` text
+        (case-insensitive) in any of the `columns` columns, given by their
+        names or numbers (all columns by default). An empty text displays
+        all rows.
+
+        .. code-block:: python
+
+            search_field.bind(
+                text=lambda instance, text: self.data_tables.search(text)
+            )
+
+        .. versionadded:: 1.1.0
+        """
+
+        headings = self.header._col_headings
+        if columns is not None:
+            columns = [
+                column if isinstance(column, int) else headings.index(column)
+                for column in columns
+            ]
+        self.table_data.search_rows(text, columns)
+
+    def update_data_source(self, *args) -> None:
+        """
+        Called when the :attr:`data_source` data source is set. Call this
+        method after the rows of the data source have been changed.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self.table_data.update_data_source()
+        if self.use_pagination:
+            Clock.schedule_once(self.create_pagination_menu, 0.5)
+
     def add_row(self, data: Union[list, tuple]) -> None:
         """
         Added new row to common table.
@@ -1607,9 +2429,13 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
             :align: center
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 1.1.0
+
+            Only the cells of the displayed page are updated.
         """
 
-        self.row_data.append(data)
+        self.table_data.insert_rows(len(self.row_data), [data])
 
     def remove_row(self, data: Union[list, tuple]) -> None:
         """
@@ -1622,7 +2448,7 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         .. versionadded:: 1.0.0
         """
 
-        self.row_data.remove(data)
+        self.table_data.remove_rows(self.row_data.index(data))
 
     def update_row(
         self, old_data: Union[list, tuple], new_data: Union[list, tuple]
@@ -1690,11 +2516,130 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         .. versionadded:: 1.0.0
         """
 
-        for data in self.row_data:
-            if data == old_data:
-                index_data = self.row_data.index(data)
-                self.row_data[index_data] = new_data
-                break
+        if old_data in self.row_data:
+            self.table_data.update_rows(
+                self.row_data.index(old_data), [new_data]
+            )
+
+    def load_rows(
+        self,
+        rows: Iterable,
+        formatter: Union[Callable, None] = None,
+        chunk_size: int = 1000,
+    ) -> TableRowLoader:
+        """
+        Replaces the table rows with the `rows` rows that are read and
+        formatted by the `formatter` function in a worker thread and added
+        to the table by chunks of `chunk_size` rows. The table stays
+        responsive while the rows are loaded. See
+        :mod:`~kivymd.uix.datatables.loader`.
+
+        Returns the :class:`~kivymd.uix.datatables.loader.TableRowLoader`
+        object that cancels the loading with its
+        :meth:`~kivymd.uix.datatables.loader.TableRowLoader.cancel` method.
+        A new call cancels the previous loading.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self._loader is not None:
+            self._loader.cancel()
+        self.row_data = []
+        self._loader = TableRowLoader(self, rows, formatter, chunk_size)
+        self._loader.start()
+        return self._loader
+
+    def load_csv(
+        self,
+        path: str,
+        formatter: Union[Callable, None] = None,
+        encoding: str = "utf-8",
+        **fmtparams,
+    ) -> TableRowLoader:
+        """
+        Replaces the table rows with the rows of the CSV file, see
+        :meth:`load_rows` and
+        :func:`~kivymd.uix.datatables.files.read_csv_rows`. The file columns
+        are matched with the :attr:`column_data` columns by the header
+        names.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return self.load_rows(
+            read_csv_rows(
+                path, self.header._col_headings, True, encoding, **fmtparams
+            ),
+            formatter,
+        )
+
+    def load_arrow(
+        self,
+        path: str,
+        formatter: Union[Callable, None] = None,
+        memory_map: bool = False,
+    ) -> TableRowLoader:
+        """
+        Replaces the table rows with the rows of the Arrow IPC file, see
+        :meth:`load_rows` and
+        :func:`~kivymd.uix.datatables.files.read_arrow_rows`. The file
+        columns are matched with the :attr:`column_data` columns by name.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return self.load_rows(
+            read_arrow_rows(path, self.header._col_headings, memory_map),
+            formatter,
+        )
+
+    def export_csv(
+        self, path: str, encoding: str = "utf-8", **fmtparams
+    ) -> int:
+        """
+        Writes the displayed texts of the table rows in the displayed
+        (sorted and filtered) order to the CSV file. Returns the number of
+        written rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return write_csv_rows(
+            path,
+            self.table_data.iter_row_texts(),
+            self.header._col_headings,
+            encoding,
+            **fmtparams,
+        )
+
+    def export_arrow(self, path: str) -> int:
+        """
+        Writes the displayed texts of the table rows in the displayed
+        (sorted and filtered) order to the Arrow IPC file. Returns the
+        number of written rows.
+
+        .. versionadded:: 1.1.0
+        """
+
+        return write_arrow_rows(
+            path, self.table_data.iter_row_texts(), self.header._col_headings
+        )
+
+    def batch(self):
+        """
+        Context manager that applies all row changes made inside it with
+        one update of the displayed table page.
+
+        .. code-block:: python
+
+            with self.data_tables.batch():
+                for i in range(100):
+                    self.data_tables.add_row((str(i), "1", "2", "3"))
+
+        .. versionadded:: 1.1.0
+        """
+
+        return self.table_data.batch()
 
     def on_row_press(self, instance_cell_row) -> None:
         """Called when a table row is clicked."""
@@ -1706,6 +2651,38 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         :param row_data: One of the elements from the :attr:`MDDataTable.row_data` list.
         """
 
+    def on_load_progress(self, loaded: int, total: Union[int, None]) -> None:
+        """
+        Called when rows loaded by :meth:`load_rows` were added to the table.
+
+        :param loaded: number of added rows;
+        :param total: number of loaded rows or `None` if it is unknown;
+
+        .. versionadded:: 1.1.0
+        """
+
+    def on_load_complete(self) -> None:
+        """
+        Called when all rows loaded by :meth:`load_rows` were added to the
+        table.
+
+        .. versionadded:: 1.1.0
+        """
+
+        if self.use_pagination:
+            Clock.schedule_once(self.create_pagination_menu, 0)
+
+    def on_load_error(self, error: Exception) -> None:
+        """
+        Called when reading or formatting the rows loaded by
+        :meth:`load_rows` failed. The rows that were already added stay in
+        the table.
+
+        :param error: exception raised in the worker thread;
+
+        .. versionadded:: 1.1.0
+        """
+
     def get_row_checks(self) -> list:
         """Returns all rows that are checked."""
 
@@ -1721,7 +2698,7 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
                     x
                 ),
             }
-            for i in range(self.rows_num, len(self.row_data), self.rows_num)
+            for i in self._get_rows_per_page_options()
         ]
         pagination_menu = MDDropdownMenu(
             caller=self.pagination.ids.drop_item,
@@ -1735,6 +2712,21 @@ class MDDataTable(ThemableBehavior, AnchorLayout):
         )
         self.table_data.pagination_menu = pagination_menu
 
+    def _get_rows_per_page_options(self) -> list:
+        # The multiples of rows_num that are less than the number of rows:
+        # 1-5 times, then 10, 20, 50, 100, 200, 500... times.
+        options = []
+        row_count = self.table_data.get_row_count()
+        scale = 1
+        while self.rows_num > 0:
+            for factor in (1, 2, 3, 4, 5) if scale == 1 else (1, 2, 5):
+                rows = factor * scale * self.rows_num
+                if rows >= row_count:
+                    return options
+                options.append(rows)
+            scale *= 10
+        return options
+
     def _scroll_with_header(self, instance, value):
         self.header.scroll_x = value
 
@@ -1856,7 +2848,7 @@ class CellRow(
 
         # Set checkboxes.
         if instance_table_data.check:
-            if self.index in instance_table_data.data_first_cells:
+            if not self.index % instance_table_data.total_col_headings:
                 self.ids.check.size = (dp(32), dp(32))
                 self.ids.check.opacity = 1
                 self.ids.box.spacing = dp(16)
@@ -1869,21 +2861,10 @@ class CellRow(
 
         # Set checkboxes state.
         if (
-            instance_table_data._rows_number
-            in instance_table_data.current_selection_check
+            instance_table_data.recycle_data.get_row_id(self.index)
+            in instance_table_data.get_selected_rows()
         ):
-            for index in instance_table_data.current_selection_check[
-                instance_table_data._rows_number
-            ]:
-                if (
-                    self.index
-                    in instance_table_data.current_selection_check[
-                        instance_table_data._rows_number
-                    ]
-                ):
-                    self.change_check_state_no_notify("down")
-                else:
-                    self.change_check_state_no_notify("normal")
+            self.change_check_state_no_notify("down")
         else:
             self.change_check_state_no_notify("normal")
 
@@ -1898,33 +2879,10 @@ class CellRow(
     ) -> None:
         """Called upon activation/deactivation of the checkbox."""
 
-        if active:
-            if (
-                self.table._rows_number
-                not in self.table.current_selection_check
-            ):
-                self.table.current_selection_check[self.table._rows_number] = []
-            if (
-                self.index
-                not in self.table.current_selection_check[
-                    self.table._rows_number
-                ]
-            ):
-                self.table.current_selection_check[
-                    self.table._rows_number
-                ].append(self.index)
-        else:
-            if self.table._rows_number in self.table.current_selection_check:
-                if (
-                    self.index
-                    in self.table.current_selection_check[
-                        self.table._rows_number
-                    ]
-                    and not active
-                ):
-                    self.table.current_selection_check[
-                        self.table._rows_number
-                    ].remove(self.index)
+        self.table.select_row_id(
+            self.table.recycle_data.get_row_id(self.index),
+            "down" if active else "normal",
+        )
 
     def on_touch_down(self, touch):
         if super().on_touch_down(touch):
@@ -0,0 +1,211 @@
+"""
+Components/DataTables/Files
+===========================
+
+.. versionadded:: 1.1.0
+
+Streaming import and export of the
+:class:`~kivymd.uix.datatables.MDDataTable` rows in the CSV and Arrow IPC
+formats.
+
+The files are read row by row (CSV) or record batch by record batch
+(Arrow) in the worker thread of
+:meth:`~kivymd.uix.datatables.MDDataTable.load_rows`, so the file is never
+loaded into memory as a whole. The columns of the file are matched with
+the table columns by the names from
+:attr:`~kivymd.uix.datatables.MDDataTable.column_data`.
+
+.. code-block:: python
+
+    self.data_tables.load_csv("telemetry.csv")
+    self.data_tables.load_arrow("telemetry.arrow", memory_map=True)
+
+The export writes the rows in the displayed order, i.e. sorted and
+filtered, one row at a time:
+
+.. code-block:: python
+
+    self.data_tables.export_csv("selection.csv")
+    self.data_tables.export_arrow("selection.arrow")
+
+.. note:: The Arrow format requires the
+    `pyarrow <https://arrow.apache.org/docs/python/>`_ package:
+
+    .. code-block:: bash
+
+        pip install kivymd[arrow]
+"""
+
+__all__ = (
+    "read_csv_rows",
+    "read_arrow_rows",
+    "write_csv_rows",
+    "write_arrow_rows",
+)
+
+import csv
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+
+def read_csv_rows(
+    path: str,
+    column_names: Union[list, None] = None,
+    has_header: bool = True,
+    encoding: str = "utf-8",
+    **fmtparams,
+) -> Iterator[tuple]:
+    """
+    Yields the rows of the CSV file.
+
+    If the file has a header and `column_names` are given, the values are
+    reordered to match `column_names`; the missing columns are empty.
+    The `fmtparams` arguments are passed to :func:`csv.reader`.
+    """
+
+    with open(path, newline="", encoding=encoding) as file:
+        reader = csv.reader(file, **fmtparams)
+        header = next(reader, None) if has_header else None
+        indices = _get_column_indices(header, column_names)
+        if indices is None:
+            yield from map(tuple, reader)
+            return
+
+        for row in reader:
+            yield tuple(
+                row[index] if index is not None and index < len(row) else ""
+                for index in indices
+            )
+
+
+def read_arrow_rows(
+    path: str,
+    column_names: Union[list, None] = None,
+    memory_map: bool = False,
+) -> Iterator[tuple]:
+    """
+    Yields the rows of the Arrow IPC file (file or stream format).
+
+    The record batches are converted one by one. With `memory_map`, the
+    file is memory-mapped instead of read.
+    """
+
+    _check_pyarrow()
+    source = pyarrow.memory_map(path) if memory_map else pyarrow.OSFile(path)
+    with source:
+        try:
+            reader = pyarrow.ipc.open_file(source)
+            batches = (
+                reader.get_batch(i) for i in range(reader.num_record_batches)
+            )
+        except pyarrow.ArrowInvalid:
+            source.seek(0)
+            batches = pyarrow.ipc.open_stream(source)
+
+        for batch in batches:
+            indices = _get_column_indices(batch.schema.names, column_names)
+            if indices is None:
+                indices = range(batch.num_columns)
+            yield from zip(
+                *(
+                    batch.column(index).to_pylist()
+                    if index is not None
+                    else [""] * batch.num_rows
+                    for index in indices
+                )
+            )
+
+
+def write_csv_rows(
+    path: str,
+    rows: Iterable,
+    column_names: Union[list, None] = None,
+    encoding: str = "utf-8",
+    **fmtparams,
+) -> int:
+    """
+    Writes the rows and the `column_names` header to the CSV file.
+    The `fmtparams` arguments are passed to :func:`csv.writer`.
+
+    Returns the number of written rows.
+    """
+
+    count = 0
+    with open(path, "w", newline="", encoding=encoding) as file:
+        writer = csv.writer(file, **fmtparams)
+        if column_names:
+            writer.writerow(column_names)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_arrow_rows(
+    path: str,
+    rows: Iterable,
+    column_names: list,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Writes the rows to the Arrow IPC file as string columns, by record
+    batches of `batch_size` rows.
+
+    Returns the number of written rows.
+    """
+
+    _check_pyarrow()
+    schema = pyarrow.schema(
+        [pyarrow.field(str(name), pyarrow.string()) for name in column_names]
+    )
+    count = 0
+    rows = iter(rows)
+    with pyarrow.ipc.new_file(path, schema) as writer:
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                break
+            columns = list(zip(*chunk))
+            writer.write_batch(
+                pyarrow.record_batch(
+                    [
+                        pyarrow.array(
+                            [str(value) for value in column],
+                            type=pyarrow.string(),
+                        )
+                        for column in columns
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(chunk)
+    return count
+
+
+def _get_column_indices(header, column_names) -> Union[list, None]:
+    # Returns the positions of the `column_names` columns in the header or
+    # `None` if the columns are taken in the file order.
+    if not header or not column_names:
+        return None
+    header = list(header)
+    indices = [
+        header.index(name) if name in header else None
+        for name in column_names
+    ]
+    if all(index is None for index in indices):
+        return None
+    return indices
+
+
+def _check_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError(
+            "The Arrow format requires the pyarrow package: "
+            "pip install pyarrow"
+        )
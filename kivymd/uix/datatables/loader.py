@@ -0,0 +1,190 @@
+"""
+Components/DataTables/Loader
+============================
+
+.. versionadded:: 1.1.0
+
+Loading of the :class:`~kivymd.uix.datatables.MDDataTable` rows in the
+background.
+
+:meth:`~kivymd.uix.datatables.MDDataTable.load_rows` reads and formats the
+rows in a worker thread and adds them to the table by chunks, a few chunks
+per frame, so the table stays scrollable while the rows arrive. It returns
+a :class:`TableRowLoader` object that can cancel the loading. The worker
+thread reads ahead at most :attr:`TableRowLoader.max_queued_chunks` chunks.
+If reading or formatting the rows fails, the loading stops and the
+`on_load_error` event of the table is dispatched:
+
+.. code-block:: python
+
+    def read_rows():
+        with open("telemetry.csv", encoding="utf-8") as file:
+            yield from csv.reader(file)
+
+
+    loader = self.data_tables.load_rows(
+        read_rows(),
+        formatter=lambda row: (row[0], row[1], f"{float(row[2]):.2f}"),
+    )
+    self.data_tables.bind(
+        on_load_progress=lambda instance, loaded, total: print(loaded, total)
+    )
+    ...
+    loader.cancel()
+"""
+
+__all__ = ("TableRowLoader",)
+
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Union
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+class TableRowLoader:
+    """
+    Loads rows into the :class:`~kivymd.uix.datatables.MDDataTable` table.
+
+    :param table: :class:`~kivymd.uix.datatables.MDDataTable` object;
+    :param rows: iterable of rows, it is read in the worker thread;
+    :param formatter: function that takes a row and returns the row added
+        to the table; it is called in the worker thread;
+    :param chunk_size: number of rows added to the table at once;
+    :param frame_budget: time in seconds the table may spend adding rows
+        per frame;
+    """
+
+    max_queued_chunks = 4
+    """
+    Number of the formatted chunks that the worker thread reads ahead of
+    the table.
+    """
+
+    def __init__(
+        self,
+        table,
+        rows: Iterable,
+        formatter: Union[Callable, None] = None,
+        chunk_size: int = 1000,
+        frame_budget: float = 0.004,
+    ):
+        self.table = table
+        self.rows = rows
+        self.formatter = formatter or tuple
+        self.chunk_size = max(1, chunk_size)
+        self.frame_budget = frame_budget
+        self.total = len(rows) if hasattr(rows, "__len__") else None
+        """Number of rows or `None` if the rows have no length."""
+        self.loaded = 0
+        """Number of rows added to the table."""
+        self.done = False
+        """
+        `True` when all rows were added or the loading was cancelled or
+        failed.
+        """
+        self.error = None
+        """Exception that stopped the loading or `None`."""
+        self._cancelled = threading.Event()
+        self._chunks = queue.Queue(maxsize=self.max_queued_chunks)
+        self._thread = threading.Thread(target=self._read_rows, daemon=True)
+        self._event = None
+
+    @property
+    def cancelled(self) -> bool:
+        """`True` if the loading was cancelled."""
+
+        return self._cancelled.is_set()
+
+    def start(self) -> None:
+        """Starts the worker thread and the adding of the rows."""
+
+        self._thread.start()
+        self._event = Clock.schedule_interval(self._add_chunks, 0)
+
+    def cancel(self) -> None:
+        """
+        Stops the loading. The rows that were already added stay in the
+        table.
+        """
+
+        self._cancelled.set()
+        self._finish()
+
+    def _read_rows(self) -> None:
+        # Worker thread: formats the rows and passes them by chunks.
+        try:
+            chunk = []
+            for row in self.rows:
+                if self._cancelled.is_set():
+                    return
+                chunk.append(self.formatter(row))
+                if len(chunk) >= self.chunk_size:
+                    if not self._put(chunk):
+                        return
+                    chunk = []
+            if chunk and not self._put(chunk):
+                return
+        except Exception as error:
+            self._put(error)
+            return
+        self._put(None)
+
+    def _put(self, item) -> bool:
+        # Waits for a free place in the queue. Returns `False` if the
+        # loading was cancelled in the meantime.
+        while not self._cancelled.is_set():
+            try:
+                self._chunks.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _add_chunks(self, *args) -> None:
+        # Main thread: adds the formatted chunks while the frame budget
+        # allows it.
+        table_data = self.table.table_data
+        deadline = time.perf_counter() + self.frame_budget
+        loaded = self.loaded
+        try:
+            with table_data.batch():
+                while not self.done and (
+                    loaded == self.loaded or time.perf_counter() < deadline
+                ):
+                    try:
+                        chunk = self._chunks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(chunk, Exception):
+                        self.error = chunk
+                        self._finish()
+                        break
+                    if chunk is None:
+                        self._finish()
+                        break
+                    table_data.insert_rows(
+                        len(table_data.get_row_store()), chunk
+                    )
+                    self.loaded += len(chunk)
+        finally:
+            if self.loaded != loaded:
+                self.table.dispatch(
+                    "on_load_progress", self.loaded, self.total
+                )
+        if self.error is not None:
+            Logger.error(
+                f"KivyMD: MDDataTable: loading of the rows failed: "
+                f"{self.error!r}"
+            )
+            self.table.dispatch("on_load_error", self.error)
+        elif self.done and not self.cancelled:
+            self.table.dispatch("on_load_complete")
+
+    def _finish(self) -> None:
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self.done = True
@@ -0,0 +1,261 @@
+"""
+Components/DataTables/Search
+============================
+
+.. versionadded:: 1.1.0
+
+Filtering of the :class:`~kivymd.uix.datatables.MDDataTable` rows.
+
+:class:`TableSearchIndex` finds the rows whose cell text contains the
+searched text (case-insensitive). The lower-case texts of each column are
+built on first use. When the searched text is extended, e.g. while the user
+types, only the rows found by the previous search are checked again. For
+large tables, a trigram index of the searched columns is built in the
+background, a few thousand rows per frame, and is used for the new texts.
+When rows are inserted, removed or changed, only the texts of these rows
+are computed again.
+
+.. code-block:: python
+
+    # Rows with "tom" in the "Name" column and "2022" in the "Date" column.
+    self.data_tables.filter({"Name": "tom", "Date": "2022"})
+    # Rows with "tom" in any column.
+    self.data_tables.search("tom")
+    # All rows.
+    self.data_tables.filter(None)
+"""
+
+__all__ = ("TableSearchIndex",)
+
+from collections import defaultdict
+from typing import Union
+
+from kivy.clock import Clock
+
+from kivymd.uix.datatables.store import _split_value
+
+
+class TableSearchIndex:
+    """
+    Search index of the rows of a
+    :class:`~kivymd.uix.datatables.store.TableRowStore`.
+
+    :param store: :class:`~kivymd.uix.datatables.store.TableRowStore`
+        object;
+    """
+
+    index_min_rows = 10000
+    """Minimum number of rows for which the trigram index is built."""
+
+    index_chunk_size = 1000
+    """Number of rows added to the trigram index per frame."""
+
+    def __init__(self, store):
+        self.store = store
+        self._texts = {}
+        self._trigrams = {}
+        self._builders = {}
+        self._last = {}
+        self._trigger_build = Clock.create_trigger(self._build_step)
+
+    def get_texts(self, col: Union[int, tuple]) -> list:
+        """
+        Returns the lower-case texts of the `col` column. If `col` is
+        a tuple of column numbers, the texts of these columns are joined.
+        """
+
+        texts = self._texts.get(col)
+        if texts is None:
+            texts = self._texts[col] = self._get_texts(
+                col, 0, len(self.store)
+            )
+        return texts
+
+    def get_trigrams(self, col: Union[int, tuple]) -> dict:
+        """
+        Returns the trigram index of the `col` column: the ascending lists
+        of the row numbers by the three-character substrings of the texts.
+        """
+
+        if col not in self._trigrams:
+            builder = self._builders.pop(col, None) or self._build(col)
+            for _ in builder:
+                pass
+        return self._trigrams[col]
+
+    def schedule_index(self, col: Union[int, tuple]) -> None:
+        """
+        Schedules the building of the trigram index of the `col` column
+        in the background.
+        """
+
+        if col not in self._trigrams and col not in self._builders:
+            self._builders[col] = self._build(col)
+            self._trigger_build()
+
+    def match(self, col: Union[int, tuple], text: str) -> list:
+        """
+        Returns the ascending list of the numbers of the rows whose `col`
+        column contains the `text` text.
+        """
+
+        text = str(text).casefold()
+        texts = self.get_texts(col)
+        if not text:
+            return list(range(len(texts)))
+
+        candidates = None
+        last_text, last_rows = self._last.get(col, ("", None))
+        if last_rows is not None and last_text and last_text in text:
+            # The text was extended, so only the previous rows can match.
+            candidates = last_rows
+        trigrams = self._trigrams.get(col)
+        if trigrams is not None and len(text) >= 3:
+            rows = min(
+                (
+                    trigrams.get(text[i : i + 3], ())
+                    for i in range(len(text) - 2)
+                ),
+                key=len,
+            )
+            if candidates is None or len(rows) < len(candidates):
+                candidates = rows
+
+        if candidates is None:
+            rows = [row for row, value in enumerate(texts) if text in value]
+            if len(texts) >= self.index_min_rows:
+                self.schedule_index(col)
+        else:
+            rows = [row for row in candidates if text in texts[row]]
+        self._last[col] = (text, rows)
+        return rows
+
+    def match_rows(self, col: Union[int, tuple], text: str, rows) -> list:
+        """
+        Returns the numbers of the rows of the `rows` rows whose `col`
+        column contains the `text` text. Only these rows are checked.
+        """
+
+        text = str(text).casefold()
+        texts = self.get_texts(col)
+        return [row for row in rows if text in texts[row]]
+
+    def filter(self, filters: dict, rows=None) -> list:
+        """
+        Returns the ascending list of the numbers of the rows that contain
+        the texts of all columns of the `filters` dictionary,
+        e.g. `{1: "tom", 3: "2022"}`.
+
+        If the ascending `rows` rows are passed, only these rows are
+        checked.
+        """
+
+        if rows is not None:
+            for col, text in filters.items():
+                rows = self.match_rows(col, text, rows)
+            return list(rows)
+
+        for col, text in filters.items():
+            matched = self.match(col, text)
+            if rows is None:
+                rows = matched
+            else:
+                matched = set(matched)
+                rows = [row for row in rows if row in matched]
+        return rows if rows is not None else list(range(len(self.store)))
+
+    def search(
+        self, text: str, columns: Union[list, None] = None, rows=None
+    ) -> list:
+        """
+        Returns the ascending list of the numbers of the rows that contain
+        the `text` text in any of the `columns` columns (all columns by
+        default).
+
+        If the ascending `rows` rows are passed, only these rows are
+        checked.
+        """
+
+        if columns is None:
+            columns = range(self.store.cols)
+        if rows is not None:
+            return self.match_rows(tuple(columns), text, rows)
+        return self.match(tuple(columns), text)
+
+    def change_rows(self, row: int, removed: int, added: int) -> None:
+        """
+        Updates the texts after `removed` rows starting from the `row` row
+        of the store were replaced with `added` rows. Only the texts of the
+        new rows are computed.
+        """
+
+        old_count = len(self.store) - added + removed
+        # The joined texts are made of the texts of the single columns.
+        for col in sorted(self._texts, key=lambda col: isinstance(col, tuple)):
+            self._texts[col][row : row + removed] = self._get_texts(
+                col, row, row + added
+            )
+
+        if not removed and row == old_count:
+            # Appended rows are added to the trigram indices.
+            for col, trigrams in self._trigrams.items():
+                texts = self._texts[col]
+                for new_row in range(row, row + added):
+                    text = texts[new_row]
+                    for gram in {
+                        text[i : i + 3] for i in range(len(text) - 2)
+                    }:
+                        trigrams.setdefault(gram, []).append(new_row)
+        else:
+            self._trigrams.clear()
+        self._builders.clear()
+        self._last.clear()
+
+    def refresh(self, store=None) -> None:
+        """
+        Clears the texts and the indices, e.g. after the rows were changed.
+        """
+
+        if store is not None:
+            self.store = store
+        self._texts.clear()
+        self._trigrams.clear()
+        self._builders.clear()
+        self._last.clear()
+
+    def _get_texts(self, col: Union[int, tuple], start: int, stop: int):
+        # The lower-case texts of the rows `[start, stop)`.
+        if isinstance(col, tuple):
+            # The separator prevents matches across the columns.
+            return list(
+                map(
+                    "\x00".join,
+                    zip(*(self.get_texts(c)[start:stop] for c in col)),
+                )
+            )
+        return [
+            _split_value(value, col)[2].casefold()
+            for value in self.store.columns[col][start:stop]
+        ]
+
+    def _build(self, col: Union[int, tuple]):
+        # Builds the trigram index by chunks of rows.
+        trigrams = defaultdict(list)
+        texts = self.get_texts(col)
+        for start in range(0, len(texts), self.index_chunk_size):
+            stop = min(start + self.index_chunk_size, len(texts))
+            for row in range(start, stop):
+                text = texts[row]
+                for gram in {text[i : i + 3] for i in range(len(text) - 2)}:
+                    trigrams[gram].append(row)
+            yield
+        self._trigrams[col] = dict(trigrams)
+
+    def _build_step(self, *args) -> None:
+        # One chunk per frame, so the indexing does not block the UI.
+        if self._builders:
+            col, builder = next(iter(self._builders.items()))
+            if next(builder, StopIteration) is StopIteration:
+                del self._builders[col]
+        if self._builders:
+            self._trigger_build()
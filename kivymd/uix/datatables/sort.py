@@ -0,0 +1,259 @@
+"""
+Components/DataTables/Sort
+==========================
+
+.. versionadded:: 1.1.0
+
+Sorting of the :class:`~kivymd.uix.datatables.MDDataTable` rows.
+
+The rows are not moved: :class:`TableSorter` keeps a permutation of the
+row numbers, so the checked rows stay checked after sorting. The sort keys
+of each column are computed once and cached, and switching between the
+ascending and descending order reverses the permutation. When rows are
+inserted, removed or changed, only the keys of these rows are computed and
+the rows are inserted into the permutation with a binary search.
+
+To sort a column by clicking its header, pass the name of the key
+extractor as the third element of the column in
+:attr:`~kivymd.uix.datatables.MDDataTable.column_data`:
+
+.. code-block:: python
+
+    column_data=[
+        ("No.", dp(30), "numeric"),
+        ("Name", dp(60), "natural"),
+        ("Date", dp(30), "date"),
+    ]
+
+The available extractors are `'text'`, `'natural'`, `'numeric'` and
+`'date'`. Other extractors can be added with
+:meth:`TableSorter.register_key`.
+"""
+
+__all__ = ("TableSorter",)
+
+import re
+from datetime import date, datetime
+from typing import Callable, Union
+
+from kivymd.uix.datatables.store import _shift_rows
+
+_natural_split = re.compile(r"(\d+)").split
+
+
+def _get_text(value) -> str:
+    if isinstance(value, (tuple, list)) and value:
+        value = value[-1]
+    return str(value)
+
+
+def text_key(value) -> str:
+    """Case-insensitive text key."""
+
+    return _get_text(value).casefold()
+
+
+def natural_key(value) -> tuple:
+    """Key that orders the numbers in the text by value: `'a2' < 'a10'`."""
+
+    parts = _natural_split(_get_text(value).casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+def numeric_key(value) -> tuple:
+    """Numeric key; the values that are not numbers are placed last."""
+
+    if isinstance(value, (int, float)):
+        return 0, value, ""
+    text = _get_text(value)
+    try:
+        return 0, float(text.replace(",", "")), ""
+    except ValueError:
+        return 1, 0, text.casefold()
+
+
+def date_key(value) -> tuple:
+    """
+    Date key for :class:`~datetime.date` values and ISO 8601 strings;
+    the values that are not dates are placed last.
+    """
+
+    if isinstance(value, datetime):
+        return 0, value.isoformat(), ""
+    if isinstance(value, date):
+        return 0, datetime(value.year, value.month, value.day).isoformat(), ""
+    text = _get_text(value)
+    try:
+        return 0, datetime.fromisoformat(text).isoformat(), ""
+    except ValueError:
+        return 1, "", text.casefold()
+
+
+class TableSorter:
+    """
+    Keeps the sort order of the rows of a
+    :class:`~kivymd.uix.datatables.store.TableRowStore`.
+
+    :param store: :class:`~kivymd.uix.datatables.store.TableRowStore`
+        object;
+    """
+
+    key_extractors = {
+        "text": text_key,
+        "natural": natural_key,
+        "numeric": numeric_key,
+        "date": date_key,
+    }
+
+    def __init__(self, store):
+        self.store = store
+        self.spec = []
+        self.order = None
+        self._keys = {}
+
+    @classmethod
+    def register_key(cls, name: str, extractor: Callable) -> None:
+        """
+        Adds the `extractor` key extractor. The extractor takes a raw cell
+        value and returns its sort key.
+        """
+
+        cls.key_extractors[name] = extractor
+
+    def get_keys(self, col: int, key: str = "natural") -> list:
+        """Returns the cached sort keys of the `col` column."""
+
+        keys = self._keys.get((col, key))
+        if keys is None:
+            keys = self._keys[(col, key)] = list(
+                map(self.key_extractors[key], self.store.columns[col])
+            )
+        return keys
+
+    def sort(self, spec: list) -> Union[list, None]:
+        """
+        Sorts the rows by several columns. `spec` is a list of
+        `(column, order, key)` tuples, the first column is the primary
+        one; `order` is `'ASC'` or `'DSC'`. An empty list restores the
+        original order.
+
+        Returns the permutation of the row numbers.
+        """
+
+        self.spec = [tuple(item) for item in spec]
+        if not self.spec:
+            self.order = None
+            return None
+
+        order = list(range(len(self.store)))
+        # Python sort is stable, so sorting by the secondary keys first
+        # gives the multi-key order.
+        for col, direction, key in reversed(self.spec):
+            order.sort(
+                key=self.get_keys(col, key).__getitem__,
+                reverse=direction == "DSC",
+            )
+        self.order = order
+        return order
+
+    def sort_column(
+        self, col: int, order: str = "ASC", key: str = "natural"
+    ) -> list:
+        """
+        Sorts the rows by the `col` column keeping the previous sort order
+        for the rows with equal keys.
+
+        If the rows are already sorted by this column, switching the order
+        reverses the permutation in O(N).
+        """
+
+        if self.spec and (self.spec[0][0], self.spec[0][2]) == (col, key):
+            if self.spec[0][1] != order:
+                self.order.reverse()
+                self.spec = [
+                    (c, "ASC" if o == "DSC" else "DSC", k)
+                    for c, o, k in self.spec
+                ]
+            return self.order
+
+        spec = [(col, order, key)] + [
+            item for item in self.spec if item[0] != col
+        ]
+        if spec[1:] != self.spec:
+            return self.sort(spec)
+
+        # The rows are sorted by the other columns, so one stable sort by
+        # the new primary column is enough.
+        if self.order is None:
+            self.order = list(range(len(self.store)))
+        self.order.sort(
+            key=self.get_keys(col, key).__getitem__, reverse=order == "DSC"
+        )
+        self.spec = spec
+        return self.order
+
+    def change_rows(
+        self, row: int, removed: int, added: int
+    ) -> Union[list, None]:
+        """
+        Updates the cached keys and the sort order after `removed` rows
+        starting from the `row` row of the store were replaced with `added`
+        rows. The keys of the other rows are kept and the new rows are
+        inserted into the sort order with a binary search.
+        """
+
+        old_count = len(self.store) - added + removed
+        for (col, key), keys in self._keys.items():
+            keys[row : row + removed] = map(
+                self.key_extractors[key],
+                self.store.columns[col][row : row + added],
+            )
+        if self.order is None:
+            return None
+
+        # Appended rows do not shift the other rows.
+        if removed or row < old_count:
+            _shift_rows(self.order, row, removed, added)
+        for new_row in range(row, row + added):
+            self.order.insert(self.bisect(self.order, new_row), new_row)
+        return self.order
+
+    def bisect(self, rows: list, row: int) -> int:
+        """
+        Returns the position of the `row` row in the `rows` list of rows
+        sorted in the current order. The row is placed after the rows
+        with equal keys.
+        """
+
+        keys = [
+            (self.get_keys(col, key), direction == "DSC")
+            for col, direction, key in self.spec
+        ]
+
+        def is_before(other: int) -> bool:
+            for column_keys, reverse in keys:
+                key, other_key = column_keys[row], column_keys[other]
+                if key != other_key:
+                    return other_key < key if reverse else key < other_key
+            return False
+
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            if is_before(rows[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def refresh(self, store=None) -> Union[list, None]:
+        """
+        Clears the cached keys and sorts the rows of the `store` store
+        (or of the current one) again, e.g. after the rows were changed.
+        """
+
+        if store is not None:
+            self.store = store
+        self._keys.clear()
+        return self.sort(self.spec)
@@ -0,0 +1,403 @@
+"""
+Components/DataTables/Sources
+=============================
+
+.. versionadded:: 1.1.0
+
+Data sources let :class:`~kivymd.uix.datatables.MDDataTable` display rows
+that are not loaded into the :attr:`~kivymd.uix.datatables.MDDataTable.row_data`
+list. The table requests only the rows of the displayed page (and of a few
+neighbouring pages) and keeps a bounded number of fetched pages in memory.
+
+.. code-block:: python
+
+    import sqlite3
+
+    from kivymd.uix.datatables import MDDataTable
+    from kivymd.uix.datatables.sources import SQLiteDataSource
+
+    connection = sqlite3.connect("telemetry.db")
+    data_tables = MDDataTable(
+        use_pagination=True,
+        column_data=[("Id", dp(30)), ("Name", dp(60)), ("Value", dp(30))],
+        data_source=SQLiteDataSource(
+            connection,
+            "SELECT id, name, value FROM measurements",
+            # The `INTEGER PRIMARY KEY` column of the table.
+            key="id",
+        ),
+    )
+
+A custom source must implement the :meth:`TableDataSource.get_row_count`
+and :meth:`TableDataSource.fetch_rows` methods. Sorting and filtering are
+pushed down to the source if it implements
+:meth:`TableDataSource.set_sort` and :meth:`TableDataSource.set_filter`.
+"""
+
+__all__ = (
+    "TableDataSource",
+    "SequenceDataSource",
+    "SQLiteDataSource",
+    "PagedRowStore",
+)
+
+import abc
+from collections import OrderedDict
+from typing import Sequence, Union
+
+from kivy.clock import Clock
+
+from kivymd.uix.datatables.store import _split_value
+
+
+class TableDataSource(abc.ABC):
+    """Base class of the table data sources."""
+
+    @abc.abstractmethod
+    def get_row_count(self) -> int:
+        """Returns the number of rows."""
+
+    @abc.abstractmethod
+    def fetch_rows(self, start: int, stop: int) -> list:
+        """Returns the rows `[start, stop)`."""
+
+    def set_sort(self, column: Union[int, None], order: str = "ASC") -> bool:
+        """
+        Sorts the rows by the `column` column in the `order` order
+        (`'ASC'` or `'DSC'`). `None` restores the original order.
+
+        Returns `False` if the source does not support sorting.
+        """
+
+        return False
+
+    def set_filter(self, filters: dict) -> bool:
+        """
+        Keeps only the rows whose text in each column from the `filters`
+        dictionary contains the corresponding text,
+        e.g. `{1: "Tom"}`. An empty dictionary removes the filter.
+
+        Returns `False` if the source does not support filtering.
+        """
+
+        return False
+
+    def refresh(self) -> None:
+        """
+        Called by :meth:`~kivymd.uix.datatables.MDDataTable.update_data_source`
+        after the rows of the source have been changed. Clears the values
+        computed from the rows.
+        """
+
+
+class SequenceDataSource(TableDataSource):
+    """
+    Data source of a sequence of rows that is not copied, such as a list
+    or a memory-mapped array.
+    """
+
+    def __init__(self, rows: Sequence):
+        self.rows = rows
+        self._sort = None
+        self._filters = {}
+        self._indices = None
+
+    def get_row_count(self) -> int:
+        if self._indices is None:
+            return len(self.rows)
+        return len(self._indices)
+
+    def fetch_rows(self, start: int, stop: int) -> list:
+        if self._indices is None:
+            return list(self.rows[start:stop])
+        rows = self.rows
+        return [rows[index] for index in self._indices[start:stop]]
+
+    def set_sort(self, column: Union[int, None], order: str = "ASC") -> bool:
+        self._sort = None if column is None else (column, order)
+        self._update_indices()
+        return True
+
+    def set_filter(self, filters: dict) -> bool:
+        self._filters = dict(filters)
+        self._update_indices()
+        return True
+
+    def refresh(self) -> None:
+        self._update_indices()
+
+    def _update_indices(self) -> None:
+        if not self._sort and not self._filters:
+            self._indices = None
+            return
+
+        rows = self.rows
+        indices = range(len(rows))
+        for column, text in self._filters.items():
+            text = str(text).lower()
+            indices = [
+                index
+                for index in indices
+                if text in _split_value(rows[index][column], column)[2].lower()
+            ]
+        if self._sort:
+            column, order = self._sort
+            indices = sorted(
+                indices,
+                key=lambda index: _split_value(rows[index][column], column)[2],
+                reverse=order == "DSC",
+            )
+        self._indices = list(indices)
+
+
+class SQLiteDataSource(TableDataSource):
+    """
+    Data source of the rows of an SQLite query.
+
+    The rows are ordered by the `key` column of the query. The next page
+    is fetched with `WHERE key > ?` after the last key of the previous
+    page, so paging through a large table does not skip `OFFSET` rows.
+    The rows of a subquery have no `rowid`, so the query must select the
+    `key` column, e.g. `SELECT rowid, name FROM people`. If it does not,
+    the rows are fetched in the order of the query with `LIMIT` and
+    `OFFSET`.
+
+    :param connection: :class:`sqlite3.Connection` object;
+    :param query: `SELECT` query of the table rows;
+    :param parameters: parameters of the query;
+    :param key: column with unique values that are not `NULL`,
+        e.g. the `INTEGER PRIMARY KEY` column of the table;
+    """
+
+    max_page_keys = 256
+    """Number of the last keys of the fetched pages kept in memory."""
+
+    def __init__(
+        self,
+        connection,
+        query: str,
+        parameters: Sequence = (),
+        key: str = "rowid",
+    ):
+        self.connection = connection
+        self.query = query
+        self.parameters = tuple(parameters)
+        cursor = connection.execute(
+            f"SELECT * FROM ({query}) LIMIT 0", self.parameters
+        )
+        self.columns = [column[0] for column in cursor.description]
+        cursor.close()
+        names = [column.casefold() for column in self.columns]
+        self._key_index = (
+            names.index(key.casefold()) if key.casefold() in names else None
+        )
+        self._key = (
+            self._quote(self.columns[self._key_index])
+            if self._key_index is not None
+            else None
+        )
+        self._order = f" ORDER BY {self._key}" if self._key else ""
+        self._conditions = []
+        self._where_parameters = ()
+        self._row_count = None
+        # The row number after a fetched page -> the key of its last row.
+        self._page_keys = OrderedDict()
+
+    def get_row_count(self) -> int:
+        if self._row_count is None:
+            self._row_count = self._execute(
+                "SELECT COUNT(*) FROM ({query}){where}"
+            ).fetchone()[0]
+        return self._row_count
+
+    def fetch_rows(self, start: int, stop: int) -> list:
+        count = max(0, stop - start)
+        last_key = self._page_keys.get(start)
+        if last_key is not None:
+            # The page after a fetched one.
+            self._page_keys.move_to_end(start)
+            rows = self._execute(
+                "SELECT * FROM ({query}){where}{order} LIMIT ?",
+                (last_key, count),
+                [f"{self._key} > ?"],
+            ).fetchall()
+        else:
+            rows = self._execute(
+                "SELECT * FROM ({query}){where}{order} LIMIT ? OFFSET ?",
+                (count, start),
+            ).fetchall()
+
+        if rows and self._is_keyset():
+            self._page_keys[start + len(rows)] = rows[-1][self._key_index]
+            while len(self._page_keys) > self.max_page_keys:
+                self._page_keys.popitem(last=False)
+        return rows
+
+    def set_sort(self, column: Union[int, None], order: str = "ASC") -> bool:
+        if column is None:
+            self._order = f" ORDER BY {self._key}" if self._key else ""
+        else:
+            self._order = " ORDER BY {} {}".format(
+                self._quote(self.columns[column]),
+                "DESC" if order == "DSC" else "ASC",
+            )
+            if self._key:
+                # The rows with equal values keep the order of the keys.
+                self._order += f", {self._key}"
+        self._page_keys.clear()
+        return True
+
+    def set_filter(self, filters: dict) -> bool:
+        conditions = []
+        parameters = []
+        for column, text in filters.items():
+            conditions.append(
+                f"CAST({self._quote(self.columns[column])} AS TEXT) "
+                "LIKE ? ESCAPE '\\'"
+            )
+            text = (
+                str(text)
+                .replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            parameters.append(f"%{text}%")
+        self._conditions = conditions
+        self._where_parameters = tuple(parameters)
+        self._row_count = None
+        self._page_keys.clear()
+        return True
+
+    def refresh(self) -> None:
+        self._row_count = None
+        self._page_keys.clear()
+
+    def _is_keyset(self) -> bool:
+        # The unsorted rows are ordered by the key only.
+        return bool(self._key) and self._order == f" ORDER BY {self._key}"
+
+    def _execute(
+        self, sql: str, parameters: tuple = (), conditions: list = ()
+    ):
+        conditions = self._conditions + list(conditions)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return self.connection.execute(
+            sql.format(query=self.query, where=where, order=self._order),
+            self.parameters + self._where_parameters + parameters,
+        )
+
+    def _quote(self, name: str) -> str:
+        return '"{}"'.format(name.replace('"', '""'))
+
+
+class PagedRowStore:
+    """
+    Row store of a :class:`TableDataSource` with the same interface as
+    :class:`~kivymd.uix.datatables.store.TableRowStore`.
+
+    The rows are fetched by blocks of `block_size` rows and the last
+    `cache_size` blocks are kept in memory.
+
+    :param source: :class:`TableDataSource` object;
+    :param cols: number of table columns;
+    :param block_size: number of rows fetched at once;
+    :param cache_size: maximum number of blocks kept in memory;
+    :param prefetch: number of blocks fetched in advance on each side of
+        the displayed rows;
+    """
+
+    def __init__(
+        self,
+        source: TableDataSource,
+        cols: int,
+        block_size: int,
+        cache_size: int = 8,
+        prefetch: int = 1,
+    ):
+        self.source = source
+        self.cols = cols
+        self.block_size = max(1, block_size)
+        self.cache_size = max(1, cache_size, 2 * prefetch + 1)
+        self.prefetch_blocks = prefetch
+        self.fetches = 0
+        self._blocks = OrderedDict()
+        self._pending = []
+        self._rows = None
+        self._trigger_prefetch = Clock.create_trigger(self._fetch_pending)
+
+    def __len__(self):
+        if self._rows is None:
+            self._rows = self.source.get_row_count()
+        return self._rows
+
+    def get_value(self, row: int, col: int):
+        """Returns the raw value of the cell."""
+
+        values = self.get_row(row)
+        return values[col] if col < len(values) else ""
+
+    def get_row(self, row: int) -> list:
+        """Returns the raw values of the row."""
+
+        block, offset = divmod(row, self.block_size)
+        return self._get_block(block)[offset]
+
+    def get_row_texts(self, row: int) -> list:
+        """Returns the texts displayed in the cells of the row."""
+
+        values = self.get_row(row)
+        return [
+            _split_value(values[col], col)[2] if col < len(values) else ""
+            for col in range(self.cols)
+        ]
+
+    def get_row_id(self, row: int) -> int:
+        """Returns the number of the row in the data source."""
+
+        return row
+
+    def prefetch(self, start: int, stop: int) -> None:
+        """
+        Schedules the fetching of the blocks around the `[start, stop)`
+        rows.
+        """
+
+        first = start // self.block_size - self.prefetch_blocks
+        last = (max(start, stop - 1)) // self.block_size + self.prefetch_blocks
+        last_block = (len(self) - 1) // self.block_size
+        self._pending = [
+            block
+            for block in range(max(0, first), min(last, last_block) + 1)
+            if block not in self._blocks
+        ]
+        if self._pending:
+            self._trigger_prefetch()
+
+    def clear(self) -> None:
+        """Removes the fetched rows and the cached row count."""
+
+        self._blocks.clear()
+        self._pending = []
+        self._rows = None
+
+    def _get_block(self, block: int) -> list:
+        blocks = self._blocks
+        rows = blocks.get(block)
+        if rows is None:
+            start = block * self.block_size
+            rows = blocks[block] = list(
+                self.source.fetch_rows(start, start + self.block_size)
+            )
+            self.fetches += 1
+            while len(blocks) > self.cache_size:
+                blocks.popitem(last=False)
+        else:
+            blocks.move_to_end(block)
+        return rows
+
+    def _fetch_pending(self, *args) -> None:
+        # One block per frame, so the prefetching does not block the UI.
+        if self._pending:
+            self._get_block(self._pending.pop(0))
+        if self._pending:
+            self._trigger_prefetch()
@@ -0,0 +1,460 @@
+"""
+Components/DataTables/Store
+===========================
+
+.. versionadded:: 1.1.0
+
+Columnar storage for the :class:`~kivymd.uix.datatables.MDDataTable` rows.
+
+Instead of building one dictionary per table cell, the rows are kept as
+one array per column, and the dictionaries required by the
+:class:`~kivy.uix.recycleview.RecycleView` views are created only when a
+view actually requests them:
+
+.. code-block:: python
+
+    from kivymd.uix.datatables.store import TableCellData, TableRowStore
+
+    store = TableRowStore([("1", "Tom"), ("2", "Ann")], 2)
+    cells = TableCellData(store, 0, 2, {"viewclass": "CellRow"})
+
+    len(cells)  # 4
+    cells[3]["text"]  # 'Ann'
+"""
+
+__all__ = (
+    "TableRowStore",
+    "TableRowView",
+    "TableRowSlice",
+    "TablePages",
+    "TableCellData",
+    "TableDataModel",
+)
+
+import warnings
+from itertools import zip_longest
+from typing import Callable, Union
+
+from kivy.properties import ObjectProperty
+from kivy.uix.recycleview.datamodel import RecycleDataModel
+
+
+class TableRowStore:
+    """
+    Keeps the :attr:`~kivymd.uix.datatables.MDDataTable.row_data` rows as
+    one list per column.
+
+    :param rows: list of table rows;
+    :param cols: number of table columns;
+    """
+
+    def __init__(self, rows: list, cols: int):
+        self.cols = cols
+        self.rows = len(rows)
+        self.columns = self._get_columns(rows)
+
+    def __len__(self):
+        return self.rows
+
+    def get_value(self, row: int, col: int):
+        """Returns the raw value of the cell."""
+
+        return self.columns[col][row]
+
+    def get_row(self, row: int) -> list:
+        """Returns the raw values of the row."""
+
+        return [column[row] for column in self.columns]
+
+    def insert_rows(self, row: int, rows: list) -> None:
+        """Inserts the `rows` rows before the `row` row."""
+
+        for column, values in zip(self.columns, self._get_columns(rows)):
+            column[row:row] = values
+        self.rows += len(rows)
+
+    def remove_rows(self, row: int, count: int = 1) -> None:
+        """Removes `count` rows starting from the `row` row."""
+
+        for column in self.columns:
+            del column[row : row + count]
+        self.rows = len(self.columns[0]) if self.columns else 0
+
+    def set_rows(self, row: int, rows: list) -> None:
+        """Replaces the rows starting from the `row` row."""
+
+        for column, values in zip(self.columns, self._get_columns(rows)):
+            column[row : row + len(values)] = values
+
+    def get_row_texts(self, row: int) -> list:
+        """Returns the texts displayed in the cells of the row."""
+
+        return [
+            _split_value(column[row], col)[2]
+            for col, column in enumerate(self.columns)
+        ]
+
+    def get_row_id(self, row: int) -> int:
+        """Returns the number of the row; the rows are not reordered."""
+
+        return row
+
+    def _get_columns(self, rows: list) -> list:
+        columns = [
+            list(column) for column in zip_longest(*rows, fillvalue="")
+        ][: self.cols]
+        # Columns that are missing in all rows.
+        for i in range(len(columns), self.cols):
+            columns.append([""] * len(rows))
+        return columns
+
+
+class TableRowView:
+    """
+    Rows of a :class:`TableRowStore` in the order of the `indices` list
+    of row numbers, e.g. sorted or filtered rows. The rows are not copied.
+
+    :param store: :class:`TableRowStore` object;
+    :param indices: numbers of the displayed rows;
+    """
+
+    def __init__(self, store: TableRowStore, indices: list):
+        self.store = store
+        self.indices = indices
+        self.cols = store.cols
+
+    def __len__(self):
+        return len(self.indices)
+
+    def get_value(self, row: int, col: int):
+        """Returns the raw value of the cell of the `row` displayed row."""
+
+        return self.store.get_value(self.indices[row], col)
+
+    def get_row(self, row: int) -> list:
+        """Returns the raw values of the `row` displayed row."""
+
+        return self.store.get_row(self.indices[row])
+
+    def get_row_texts(self, row: int) -> list:
+        """Returns the texts of the `row` displayed row."""
+
+        return self.store.get_row_texts(self.indices[row])
+
+    def get_row_id(self, row: int) -> int:
+        """
+        Returns the number of the :class:`TableRowStore` row of the `row`
+        displayed row.
+        """
+
+        return self.indices[row]
+
+
+class TableRowSlice:
+    """
+    The rows `[start, stop)` of the `rows` sequence. The rows are not
+    copied.
+
+    :param rows: sequence of rows, e.g. the
+        :attr:`~kivymd.uix.datatables.MDDataTable.row_data` list;
+    :param start: first row of the slice;
+    :param stop: row after the last row of the slice;
+    """
+
+    def __init__(self, rows, start: int, stop: int):
+        self.rows = rows
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TableRowSlice index out of range")
+        return self.rows[self.start + index]
+
+    def __iter__(self):
+        for index in range(self.start, self.stop):
+            yield self.rows[index]
+
+
+class TablePages:
+    """
+    A sequence of the pages of `rows_per_page` rows of the `rows`
+    sequence. The number of pages is computed from the number of rows and
+    each page is a :class:`TableRowSlice` created on request.
+
+    :param rows: sequence of rows;
+    :param rows_per_page: number of rows of a page;
+    """
+
+    def __init__(self, rows, rows_per_page: int):
+        self.rows = rows
+        self.rows_per_page = rows_per_page
+
+    def __len__(self):
+        if self.rows_per_page <= 0:
+            return 0
+        return -(-len(self.rows) // self.rows_per_page)
+
+    def __getitem__(self, page: int) -> TableRowSlice:
+        if page < 0:
+            page += len(self)
+        if not 0 <= page < len(self):
+            raise IndexError("TablePages index out of range")
+        return TableRowSlice(self.rows, *self.get_page_bounds(page))
+
+    def __iter__(self):
+        for page in range(len(self)):
+            yield self[page]
+
+    def get_page_bounds(self, page: int) -> tuple:
+        """
+        Returns the numbers of the first row of the `page` page and of the
+        row after its last row.
+        """
+
+        row_count = len(self.rows)
+        start = min(page * self.rows_per_page, row_count)
+        return start, min(start + self.rows_per_page, row_count)
+
+
+class TableCellData:
+    """
+    A sequence of the cell dictionaries of the rows `[start, stop)` of
+    the :class:`TableRowStore`.
+
+    The sequence is used as the :attr:`~kivy.uix.recycleview.RecycleView.data`
+    of the table: each dictionary is created when the item is requested
+    and is not stored.
+
+    .. deprecated:: 1.1.0
+
+        The `list` methods that change the cells in place (`append`,
+        `extend`, `insert`, `pop`, `remove`, `clear`, item assignment and
+        deletion) are kept for the code written for the former list of
+        dictionaries. They issue a :class:`DeprecationWarning` and copy
+        the cells into a :attr:`items` list once. Change the table rows
+        instead, e.g. with
+        :meth:`~kivymd.uix.datatables.MDDataTable.add_row`.
+
+    :param store: :class:`TableRowStore` or :class:`TableRowView` object;
+    :param start: first row of the page;
+    :param stop: row after the last row of the page;
+    :param constants: values shared by all table cells;
+    """
+
+    items: Union[list, None] = None
+    """
+    The cell dictionaries once the cells were changed in place, otherwise
+    `None`.
+    """
+
+    on_change: Union[Callable, None] = None
+    """
+    Function called with the sequence after the cells were changed in
+    place.
+    """
+
+    def __init__(
+        self,
+        store: Union[TableRowStore, None] = None,
+        start: int = 0,
+        stop: int = 0,
+        constants: Union[dict, None] = None,
+    ):
+        self.store = store
+        self.start = start
+        self.stop = stop if store is not None else 0
+        self.cols = store.cols if store is not None else 0
+        self.constants = constants or {}
+        self._layout_item = {
+            key: self.constants[key]
+            for key in ("viewclass", "selectable")
+            if key in self.constants
+        }
+
+    @classmethod
+    def from_list(cls, items: list, cols: int = 1) -> "TableCellData":
+        """
+        Returns the sequence of the `items` cell dictionaries of a table
+        of `cols` columns.
+        """
+
+        data = cls()
+        data.cols = cols
+        data.items = list(items)
+        return data
+
+    def __len__(self):
+        if self.items is not None:
+            return len(self.items)
+        return (self.stop - self.start) * self.cols
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[dict, list]:
+        if self.items is not None:
+            return self.items[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("TableCellData index out of range")
+
+        row, col = divmod(index, self.cols)
+        item = {"Index": str(index), "range": self.get_row_range(index)}
+        item.update(self.constants)
+
+        icon, icon_color, item["text"] = _split_value(
+            self.store.get_value(self.start + row, col), col
+        )
+        if icon is not None:
+            item["icon"] = icon
+        if icon_color is not None:
+            item["icon_color"] = icon_color
+        return item
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __setitem__(self, index: Union[int, slice], value) -> None:
+        self._get_items("item assignment")[index] = value
+        self._dispatch_change()
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._get_items("item deletion")[index]
+        self._dispatch_change()
+
+    def append(self, item: dict) -> None:
+        self._get_items("append").append(item)
+        self._dispatch_change()
+
+    def extend(self, items) -> None:
+        self._get_items("extend").extend(items)
+        self._dispatch_change()
+
+    def insert(self, index: int, item: dict) -> None:
+        self._get_items("insert").insert(index, item)
+        self._dispatch_change()
+
+    def pop(self, index: int = -1) -> dict:
+        item = self._get_items("pop").pop(index)
+        self._dispatch_change()
+        return item
+
+    def remove(self, item: dict) -> None:
+        self._get_items("remove").remove(item)
+        self._dispatch_change()
+
+    def clear(self) -> None:
+        self._get_items("clear").clear()
+        self._dispatch_change()
+
+    def get_row_id(self, index: int) -> int:
+        """
+        Returns the number of the :class:`TableRowStore` row of the cell
+        with the `index` index.
+        """
+
+        row = index // (self.cols or 1)
+        if self.store is None or not 0 <= row < self.stop - self.start:
+            # Cells that were added in place.
+            return row
+        return self.store.get_row_id(self.start + row)
+
+    def get_row_range(self, index: int) -> list:
+        """
+        Returns the indices of the first and the last cells of the row
+        that contains the cell with the `index` index.
+        """
+
+        if self.items is not None and "range" in self.items[index]:
+            return self.items[index]["range"]
+        cols = self.cols or 1
+        low = index - index % cols
+        return [low, low + cols - 1]
+
+    def get_layout_item(self) -> dict:
+        """
+        Returns the dictionary used by the layout to compute the size of
+        the views. All table cells share the same size parameters.
+        """
+
+        return self._layout_item
+
+    def _get_items(self, operation: str) -> list:
+        warnings.warn(
+            f"Changing the table cells in place ({operation}) is "
+            f"deprecated, change the table rows instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        if self.items is None:
+            self.items = list(self)
+        return self.items
+
+    def _dispatch_change(self) -> None:
+        if self.on_change is not None:
+            self.on_change(self)
+
+
+class TableDataModel(RecycleDataModel):
+    """
+    The :class:`~kivy.uix.recycleview.datamodel.RecycleDataModel` that
+    takes a :class:`TableCellData` object as :attr:`data`.
+    """
+
+    data = ObjectProperty(TableCellData(), rebind=False)
+    """
+    Cells of the current table page.
+
+    :attr:`data` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to an empty :class:`TableCellData`.
+    """
+
+    def refresh_cells(self, **kwargs) -> None:
+        """
+        Dispatches `on_data_changed` after the cells of :attr:`data` were
+        changed in place. The keyword arguments are the same as for
+        :class:`~kivy.uix.recycleview.datamodel.RecycleDataModel`:
+        `modified`, `appended` or `removed` slices.
+        """
+
+        self._last_len = len(self.data)
+        self.dispatch("on_data_changed", **kwargs)
+
+    def _on_data_callback(self, instance, value):
+        self._last_len = len(value)
+        self.dispatch("on_data_changed")
+
+
+def _shift_rows(rows: list, row: int, removed: int, added: int) -> None:
+    # Removes the numbers of the rows `[row, row + removed)` from the `rows`
+    # list in place and shifts the numbers of the following rows after
+    # `removed` rows were replaced with `added` rows.
+    stop = row + removed
+    delta = added - removed
+    rows[:] = [
+        value + delta if value >= stop else value
+        for value in rows
+        if not row <= value < stop
+    ]
+
+
+def _split_value(value, col: int) -> tuple:
+    # Returns the icon, icon color and text of the cell value.
+    # The cells of the first column have no icons.
+    if col and isinstance(value, (tuple, list)):
+        if len(value) == 3:
+            return value[0], value[1], str(value[2])
+        if len(value) == 2:
+            return value[0], None, str(value[1])
+    return None, None, str(value)
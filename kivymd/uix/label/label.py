@@ -222,7 +222,6 @@ __all__ = ("MDLabel", "MDIcon")
 import os
 from typing import Union
 
-from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from kivy.lang import Builder
@@ -390,22 +389,14 @@ class MDLabel(DeclarativeBehavior, ThemableBehavior, Label, MDAdaptiveWidget):
                 color = [0, 0, 0, 1]
 
             if self.theme_cls.theme_style_switch_animation:
-                Animation(
-                    color=color,
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
-                ).start(self)
+                self.theme_cls.animate_colors(self, color=color)
             else:
                 self.color = color
 
     def on_text_color(self, instance_label, color: Union[list, str]) -> None:
         if self.theme_text_color == "Custom":
             if self.theme_cls.theme_style_switch_animation:
-                Animation(
-                    color=self.text_color,
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
-                ).start(self)
+                self.theme_cls.animate_colors(self, color=self.text_color)
             else:
                 self.color = self.text_color
 
@@ -435,11 +426,7 @@ class MDLabel(DeclarativeBehavior, ThemableBehavior, Label, MDAdaptiveWidget):
                 color = getattr(self.theme_cls, "disabled_hint_text_color")
 
             if self.theme_cls.theme_style_switch_animation:
-                Animation(
-                    color=color,
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
-                ).start(self)
+                self.theme_cls.animate_colors(self, color=color)
             else:
                 self.color = color
 
@@ -15,11 +15,29 @@ from .list import (
     IRightBody,
     IRightBodyTouch,
     MDList,
+    MDRecycleList,
+    MDRecycleListLayout,
     OneLineAvatarIconListItem,
     OneLineAvatarListItem,
     OneLineIconListItem,
     OneLineListItem,
     OneLineRightIconListItem,
+    RecycleListItemBehavior,
+    RecycleOneLineListItem,
+    RecycleOneLineAvatarListItem,
+    RecycleOneLineAvatarIconListItem,
+    RecycleOneLineIconListItem,
+    RecycleOneLineRightIconListItem,
+    RecycleThreeLineListItem,
+    RecycleThreeLineAvatarListItem,
+    RecycleThreeLineAvatarIconListItem,
+    RecycleThreeLineIconListItem,
+    RecycleThreeLineRightIconListItem,
+    RecycleTwoLineListItem,
+    RecycleTwoLineAvatarListItem,
+    RecycleTwoLineAvatarIconListItem,
+    RecycleTwoLineIconListItem,
+    RecycleTwoLineRightIconListItem,
     ThreeLineAvatarIconListItem,
     ThreeLineAvatarListItem,
     ThreeLineIconListItem,
@@ -909,6 +909,37 @@ You can disable the icon event using the `WithoutTouch` classes:
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/list-icon-without-trigger.gif
     :align: center
+Virtualized list
+----------------
+
+.. versionadded:: 1.1.0
+
+:class:`~MDList` creates a widget for every item. For long lists use
+:class:`~MDRecycleList`: it creates only the visible items and reuses them
+while the list is scrolled. The items are described by dictionaries:
+
+.. code-block:: python
+
+    from kivymd.app import MDApp
+    from kivymd.uix.list import MDRecycleList
+
+
+    class Example(MDApp):
+        def build(self):
+            return MDRecycleList(
+                data=[
+                    {
+                        "viewclass": "OneLineAvatarIconListItem",
+                        "text": f"Item {i}",
+                        "left_checkbox": False,
+                        "right_icon": "dots-vertical",
+                    }
+                    for i in range(10000)
+                ]
+            )
+
+
+    Example().run()
 """
 
 __all__ = (
@@ -940,10 +971,32 @@ __all__ = (
     "IconRightWidgetWithoutTouch",
     "ImageRightWidgetWithoutTouch",
     "ImageLeftWidgetWithoutTouch",
+    "RecycleListItemBehavior",
+    "RecycleOneLineListItem",
+    "RecycleTwoLineListItem",
+    "RecycleThreeLineListItem",
+    "RecycleOneLineAvatarListItem",
+    "RecycleTwoLineAvatarListItem",
+    "RecycleThreeLineAvatarListItem",
+    "RecycleOneLineIconListItem",
+    "RecycleTwoLineIconListItem",
+    "RecycleThreeLineIconListItem",
+    "RecycleOneLineRightIconListItem",
+    "RecycleTwoLineRightIconListItem",
+    "RecycleThreeLineRightIconListItem",
+    "RecycleOneLineAvatarIconListItem",
+    "RecycleTwoLineAvatarIconListItem",
+    "RecycleThreeLineAvatarIconListItem",
+    "MDRecycleList",
+    "MDRecycleListLayout",
 )
 
 import os
+from contextlib import contextmanager
+from typing import Iterable
 
+from kivy.animation import Animation
+from kivy.factory import Factory
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
@@ -957,6 +1010,9 @@ from kivy.properties import (
 )
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 
 import kivymd.material_resources as m_res
 from kivymd import uix_path
@@ -984,17 +1040,74 @@ class MDList(MDGridLayout):
 
     When adding (or removing) a widget, it will resize itself to fit its
     children, plus top and bottom paddings as described by the `MD` spec.
+    To add many widgets, use :meth:`bulk_add` or :meth:`batch`; the child
+    widgets passed to the constructor are added in one batch too.
     """
 
     _list_vertical_padding = NumericProperty("8dp")
+    _batch_depth = 0
+    _batch_height = 0
+
+    def __init__(self, *args, **kwargs):
+        with self.batch():
+            super().__init__(*args, **kwargs)
+
+    def bulk_add(self, widgets: Iterable) -> None:
+        """
+        Adds the `widgets` widgets in one batch, see :meth:`batch`.
+
+        .. versionadded:: 1.1.0
+        """
+
+        with self.batch():
+            for widget in widgets:
+                self.add_widget(widget)
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that postpones the height update of the list until
+        all widgets added or removed inside it are processed:
+
+        .. code-block:: python
+
+            with md_list.batch():
+                for i in range(500):
+                    md_list.add_widget(OneLineListItem(text=f"Item {i}"))
+
+        The height is updated once, when the batch ends. The layout itself
+        is done once in the next frame, as for any Kivy layout, so the other
+        layouts do not need a batch.
+
+        .. versionadded:: 1.1.0
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._end_batch()
 
     def add_widget(self, widget, index=0, canvas=None):
         super().add_widget(widget, index, canvas)
-        self.height += widget.height
+        if self._batch_depth:
+            self._batch_height += widget.height
+        else:
+            self.height += widget.height
 
     def remove_widget(self, widget):
         super().remove_widget(widget)
-        self.height -= widget.height
+        if self._batch_depth:
+            self._batch_height -= widget.height
+        else:
+            self.height -= widget.height
+
+    def _end_batch(self) -> None:
+        height, self._batch_height = self._batch_height, 0
+        if height:
+            self.height += height
 
 
 class BaseListItem(
@@ -1449,3 +1562,362 @@ class IconLeftWidgetWithoutTouch(TouchBehavior, ILeftBody, MDIconButton):
 
 class CheckboxLeftWidget(ILeftBodyTouch, MDCheckbox):
     pass
+
+
+class RecycleListItemBehavior(RecycleDataViewBehavior):
+    """
+    Makes a list item a :class:`~kivy.uix.recycleview.RecycleView` view.
+
+    Besides the item properties, the data dictionaries may contain the
+    `left_icon`, `left_image`, `left_checkbox`, `right_icon` and
+    `right_image` keys that fill the left and right containers of the item
+    with the :class:`~IconLeftWidget`, :class:`~ImageLeftWidget`,
+    :class:`~CheckboxLeftWidget`, :class:`~IconRightWidget` and
+    :class:`~ImageRightWidget` widgets. The checkbox state is written back
+    to the data dictionary.
+
+    When the view is reused for another item, the properties that are not
+    in the new dictionary are reset to their default values and the
+    ripple, pressed and hover states are cleared.
+
+    .. versionadded:: 1.1.0
+    """
+
+    index = None
+    _item_height = dp(48)
+    _recycleview = None
+    _recycle_keys = ()
+    _refreshing = False
+    _side_keys = {
+        "left_icon": ("_left_container", IconLeftWidget, "icon"),
+        "left_image": ("_left_container", ImageLeftWidget, "source"),
+        "left_checkbox": ("_left_container", CheckboxLeftWidget, "active"),
+        "right_icon": ("_right_container", IconRightWidget, "icon"),
+        "right_image": ("_right_container", ImageRightWidget, "source"),
+    }
+
+    def __init__(self, **kwargs):
+        # Widgets of the left and right containers by container id.
+        self._side_widgets = {}
+        super().__init__(**kwargs)
+
+    def refresh_view_attrs(self, rv, index: int, data: dict) -> None:
+        self._recycleview = rv
+        self.index = index
+        self._refreshing = True
+        try:
+            self.reset_view_state()
+            for key in self._recycle_keys:
+                if key not in data and key not in self._side_keys:
+                    self._reset_attr(key)
+            self._recycle_keys = tuple(data)
+            super().refresh_view_attrs(
+                rv,
+                index,
+                {
+                    key: value
+                    for key, value in data.items()
+                    if key not in self._side_keys
+                },
+            )
+            self._refresh_side_widgets(data)
+        finally:
+            self._refreshing = False
+
+    def reset_view_state(self) -> None:
+        """
+        Clears the ripple, pressed and hover states of the item and of its
+        left and right widgets.
+        """
+
+        for widget in [self, *self._side_widgets.values()]:
+            _reset_ripple(widget)
+            if getattr(widget, "state", "normal") != "normal":
+                widget.state = "normal"
+        if getattr(self, "hovering", False):
+            self.hovering = False
+            self.hover_visible = False
+            self.dispatch("on_leave")
+
+    def _reset_attr(self, key: str) -> None:
+        prop = self.property(key, quiet=True)
+        if prop is not None:
+            setattr(self, key, prop.defaultvalue)
+        else:
+            # E.g. an `on_release` callback of the previous item.
+            self.__dict__.pop(key, None)
+
+    def _refresh_side_widgets(self, data: dict) -> None:
+        widgets = self._side_widgets
+        keys = {}
+        for key, (container, *_) in self._side_keys.items():
+            if key in data and container in self.ids:
+                keys.setdefault(container, key)
+
+        for container in ("_left_container", "_right_container"):
+            key = keys.get(container)
+            widget = widgets.get(container)
+            if widget is not None and (
+                key is None
+                or not isinstance(widget, self._side_keys[key][1])
+            ):
+                widget.parent.remove_widget(widget)
+                if widget in self._touchable_widgets:
+                    self._touchable_widgets.remove(widget)
+                widget = widgets[container] = None
+            if key is None:
+                widgets.pop(container, None)
+                continue
+
+            widget_class, attr = self._side_keys[key][1:]
+            if widget is None:
+                widget = widgets[container] = widget_class()
+                if key == "left_checkbox":
+                    widget.bind(active=self._on_checkbox_active)
+                self.add_widget(widget)
+            value = data[key]
+            if key == "left_checkbox":
+                value = bool(value)
+            if getattr(widget, attr) != value:
+                setattr(widget, attr, value)
+
+    def _on_checkbox_active(self, widget, active: bool) -> None:
+        if self._refreshing:
+            return
+        rv = self._recycleview
+        if rv is not None and self.index is not None:
+            if self.index < len(rv.data):
+                rv.data[self.index]["left_checkbox"] = active
+
+
+class RecycleOneLineListItem(RecycleListItemBehavior, OneLineListItem):
+    """
+    :class:`~OneLineListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+
+class RecycleTwoLineListItem(RecycleListItemBehavior, TwoLineListItem):
+    """
+    :class:`~TwoLineListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(72)
+
+
+class RecycleThreeLineListItem(RecycleListItemBehavior, ThreeLineListItem):
+    """
+    :class:`~ThreeLineListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(88)
+
+
+class RecycleOneLineAvatarListItem(
+    RecycleListItemBehavior, OneLineAvatarListItem
+):
+    """
+    :class:`~OneLineAvatarListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(56)
+
+
+class RecycleTwoLineAvatarListItem(
+    RecycleListItemBehavior, TwoLineAvatarListItem
+):
+    """
+    :class:`~TwoLineAvatarListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(72)
+
+
+class RecycleThreeLineAvatarListItem(
+    RecycleListItemBehavior, ThreeLineAvatarListItem
+):
+    """
+    :class:`~ThreeLineAvatarListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(88)
+
+
+class RecycleOneLineIconListItem(RecycleListItemBehavior, OneLineIconListItem):
+    """
+    :class:`~OneLineIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+
+class RecycleTwoLineIconListItem(RecycleListItemBehavior, TwoLineIconListItem):
+    """
+    :class:`~TwoLineIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(72)
+
+
+class RecycleThreeLineIconListItem(
+    RecycleListItemBehavior, ThreeLineIconListItem
+):
+    """
+    :class:`~ThreeLineIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(88)
+
+
+class RecycleOneLineRightIconListItem(
+    RecycleListItemBehavior, OneLineRightIconListItem
+):
+    """
+    :class:`~OneLineRightIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+
+class RecycleTwoLineRightIconListItem(
+    RecycleListItemBehavior, TwoLineRightIconListItem
+):
+    """
+    :class:`~TwoLineRightIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(72)
+
+
+class RecycleThreeLineRightIconListItem(
+    RecycleListItemBehavior, ThreeLineRightIconListItem
+):
+    """
+    :class:`~ThreeLineRightIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(88)
+
+
+class RecycleOneLineAvatarIconListItem(
+    RecycleListItemBehavior, OneLineAvatarIconListItem
+):
+    """
+    :class:`~OneLineAvatarIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(56)
+
+
+class RecycleTwoLineAvatarIconListItem(
+    RecycleListItemBehavior, TwoLineAvatarIconListItem
+):
+    """
+    :class:`~TwoLineAvatarIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(72)
+
+
+class RecycleThreeLineAvatarIconListItem(
+    RecycleListItemBehavior, ThreeLineAvatarIconListItem
+):
+    """
+    :class:`~ThreeLineAvatarIconListItem` for :class:`~MDRecycleList`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _item_height = dp(88)
+
+
+class MDRecycleListLayout(RecycleBoxLayout):
+    """
+    Layout of :class:`~MDRecycleList`. Replaces the list item classes of
+    the data dictionaries with their `Recycle` variants and sets the item
+    heights without creating the views.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def compute_sizes_from_data(self, data, flags):
+        super().compute_sizes_from_data(data, flags)
+        for opt in self.view_opts:
+            view_class = opt["viewclass"]
+            view_class = opt["viewclass"] = getattr(
+                Factory, f"Recycle{view_class.__name__}", view_class
+            )
+            if opt["height_none"] and hasattr(view_class, "_item_height"):
+                opt["size"][1] = view_class._item_height
+                opt["height_none"] = False
+
+
+class MDRecycleList(ThemableBehavior, RecycleView):
+    """
+    A virtualized list: only the items that are visible are created, and
+    they are reused while the list is scrolled, so the number of widgets
+    does not depend on the number of items.
+
+    The items are described by dictionaries with the same properties as
+    the :class:`~MDList` items and the `left_icon`, `left_image`,
+    `left_checkbox`, `right_icon` and `right_image` keys, see
+    :class:`~RecycleListItemBehavior`:
+
+    .. code-block:: python
+
+        MDRecycleList(
+            data=[
+                {
+                    "viewclass": "TwoLineAvatarIconListItem",
+                    "text": f"Contact {i}",
+                    "secondary_text": f"+1 555 {i:04d}",
+                    "left_icon": "account",
+                    "right_icon": "phone",
+                    "on_release": lambda i=i: print(i),
+                }
+                for i in range(10000)
+            ]
+        )
+
+    The `viewclass` values are the names of the :class:`~MDList` item
+    classes; their `Recycle` variants, e.g.
+    :class:`~RecycleTwoLineAvatarIconListItem`, are used as the views.
+
+    .. versionadded:: 1.1.0
+    """
+
+    _list_vertical_padding = NumericProperty("8dp")
+
+
+def _reset_ripple(widget) -> None:
+    # Stops the ripple animation of the reused view.
+    if getattr(widget, "_doing_ripple", False) or getattr(
+        widget, "_fading_out", False
+    ):
+        Animation.cancel_all(
+            widget, "_ripple_rad", "ripple_color", "rect_color"
+        )
+        widget.anim_complete()
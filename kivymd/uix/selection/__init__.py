@@ -1 +1,7 @@
-from .selection import MDSelectionList  # NOQA F401
+from .selection import (  # NOQA F401
+    MDRecycleSelectionList,
+    MDRecycleSelectionListLayout,
+    MDSelectionList,
+    RecycleSelectionItem,
+    SelectionModel,
+)
@@ -249,15 +249,67 @@ Example with FitImage
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/selection-example-with-fitimage.gif
     :align: center
+
+Virtualized selection list
+--------------------------
+
+.. versionadded:: 1.1.0
+
+:class:`~MDSelectionList` keeps the selection state in its item widgets.
+For long lists use :class:`~MDRecycleSelectionList`: the items are
+described by dictionaries as in :class:`~kivymd.uix.list.MDRecycleList`,
+only the visible items are created, and the selection is kept in
+a :class:`~SelectionModel` object, a bitset over the item indices. Selecting
+all items and counting the selected ones do not depend on the number of
+item widgets:
+
+.. code-block:: python
+
+    from kivymd.app import MDApp
+    from kivymd.uix.selection import MDRecycleSelectionList
+
+
+    class Example(MDApp):
+        def build(self):
+            selection_list = MDRecycleSelectionList(
+                data=[
+                    {
+                        "viewclass": "TwoLineAvatarListItem",
+                        "text": f"Message {i}",
+                        "secondary_text": "Secondary text here",
+                        "left_image": "data/logo/kivy-icon-256.png",
+                    }
+                    for i in range(10000)
+                ]
+            )
+            selection_list.selection.bind(
+                selected_count=lambda instance, count: print(count)
+            )
+            return selection_list
+
+
+    Example().run()
+
+The `on_selected` and `on_unselected` events of
+:class:`~MDRecycleSelectionList` receive the index of the item instead of
+the item widget.
 """
 
-__all__ = ("MDSelectionList",)
+__all__ = (
+    "MDSelectionList",
+    "MDRecycleSelectionList",
+    "MDRecycleSelectionListLayout",
+    "RecycleSelectionItem",
+    "SelectionModel",
+)
 
 import os
-from typing import Union
+from typing import Iterable, Union
 
 from kivy.animation import Animation
 from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.factory import Factory
 from kivy.graphics.context_instructions import Color
 from kivy.graphics.vertex_instructions import (
     Ellipse,
@@ -274,6 +326,9 @@ from kivy.properties import (
     ObjectProperty,
     StringProperty,
 )
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
@@ -663,3 +718,381 @@ class MDSelectionList(MDList):
         """Called when a list item is unselected."""
 
         self.selected_mode = self.get_selected()
+
+
+class SelectionModel(EventDispatcher):
+    """
+    Selection state of the list items: a bitset over the item indices.
+
+    Selecting or clearing all items fills the bitset without touching the
+    item widgets, and :attr:`selected_count` is kept up to date, so it is
+    available in constant time.
+
+    The items are identified by their indices only: the model does not
+    know the items, so after items are inserted, removed or reordered the
+    selected indices point to other items. :class:`~MDRecycleSelectionList`
+    clears the selection in this case, see
+    :attr:`~MDRecycleSelectionList.selection`.
+
+    :param count: number of items;
+
+    :Events:
+        `on_change`
+            Called when the selection changes. The argument is the list of
+            the changed indices or `None` if any item may have changed.
+
+    .. versionadded:: 1.1.0
+    """
+
+    selected_count = NumericProperty(0)
+    """
+    Number of the selected items.
+
+    :attr:`selected_count` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    def __init__(self, count: int = 0, **kwargs):
+        self.register_event_type("on_change")
+        super().__init__(**kwargs)
+        self.count = 0
+        """Number of items."""
+        # One bit per item, padded to whole 64-bit words.
+        self._bits = bytearray()
+        self.resize(count)
+
+    def resize(self, count: int) -> None:
+        """
+        Sets the number of items. The items that are removed from the end
+        are unselected.
+        """
+
+        count = max(0, count)
+        shrunk = count < self.count
+        if shrunk:
+            used = (count + 7) // 8
+            self._bits[used:] = bytes(len(self._bits) - used)
+            if count & 7:
+                self._bits[count >> 3] &= (1 << (count & 7)) - 1
+        size = (count + 63) // 64 * 8
+        del self._bits[size:]
+        self._bits.extend(bytes(size - len(self._bits)))
+        self.count = count
+        if shrunk:
+            selected_count = bin(int.from_bytes(self._bits, "little")).count(
+                "1"
+            )
+            if selected_count != self.selected_count:
+                self.selected_count = selected_count
+                self.dispatch("on_change", None)
+
+    def is_selected(self, index: int) -> bool:
+        """Returns `True` if the `index` item is selected."""
+
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def select(self, index: int) -> None:
+        """Selects the `index` item."""
+
+        self.set_selected(index, True)
+
+    def deselect(self, index: int) -> None:
+        """Unselects the `index` item."""
+
+        self.set_selected(index, False)
+
+    def set_selected(self, index: int, selected: bool) -> None:
+        """Selects or unselects the `index` item."""
+
+        if not 0 <= index < self.count:
+            raise IndexError(f"Item index {index} is out of range")
+        byte, mask = index >> 3, 1 << (index & 7)
+        if bool(self._bits[byte] & mask) == selected:
+            return
+        self._bits[byte] ^= mask
+        self.selected_count += 1 if selected else -1
+        self.dispatch("on_change", [index])
+
+    def select_all(self) -> None:
+        """Selects all items."""
+
+        full = self.count >> 3
+        self._bits[:full] = b"\xff" * full
+        if self.count & 7:
+            self._bits[full] = (1 << (self.count & 7)) - 1
+        self.selected_count = self.count
+        self.dispatch("on_change", None)
+
+    def clear(self) -> None:
+        """Unselects all items."""
+
+        self._bits[:] = bytes(len(self._bits))
+        self.selected_count = 0
+        self.dispatch("on_change", None)
+
+    def get_selected(self) -> list:
+        """
+        Returns the ascending list of the indices of the selected items.
+        The words of the bitset without selected items are skipped.
+        """
+
+        selected = []
+        bits = self._bits
+        with memoryview(bits).cast("Q") as words:
+            for word_index, word in enumerate(words):
+                if not word:
+                    continue
+                start = word_index * 8
+                value = int.from_bytes(bits[start : start + 8], "little")
+                while value:
+                    lowest = value & -value
+                    selected.append(start * 8 + lowest.bit_length() - 1)
+                    value ^= lowest
+        return selected
+
+    def on_change(self, indices: Union[list, None]) -> None:
+        """Called when the selection changes."""
+
+
+class RecycleSelectionItem(RecycleDataViewBehavior, SelectionItem):
+    """
+    View of :class:`~MDRecycleSelectionList`. Shows the list item of the
+    `viewclass` class described by the data dictionary and the selection
+    state of the item in :attr:`~MDRecycleSelectionList.selection`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    index = None
+
+    def __init__(self, **kwargs):
+        # List item widgets by class, reused when the view shows an item
+        # of the same class.
+        self._items = {}
+        super().__init__(instance_icon=SelectionIconCheck(), **kwargs)
+        self.add_widget(self.instance_icon)
+
+    def refresh_view_attrs(self, rv, index: int, data: dict) -> None:
+        self.index = index
+        self.owner = rv
+        self.overlay_color = rv.overlay_color
+        self.progress_round_size = rv.progress_round_size
+        self.progress_round_color = rv.progress_round_color
+        self.instance_icon.icon = rv.icon
+        self.instance_icon.md_bg_color = rv.icon_bg_color
+        self.instance_icon.icon_check_color = rv.icon_check_color
+        if self._touch_long or self._progress_animation:
+            self._touch_long = False
+            self.reset_progress_animation()
+
+        item = self._get_item(data.get("viewclass", "OneLineListItem"))
+        item_data = {
+            key: value for key, value in data.items() if key != "viewclass"
+        }
+        if isinstance(item, RecycleDataViewBehavior):
+            item.refresh_view_attrs(rv, index, item_data)
+        else:
+            for key, value in item_data.items():
+                setattr(item, key, value)
+        self.set_selected_state(rv.selection.is_selected(index))
+
+    def refresh_view_layout(self, rv, index, layout, viewport) -> None:
+        super().refresh_view_layout(rv, index, layout, viewport)
+        icon = self.instance_icon
+        icon.pos = self.owner.icon_pos or (
+            dp(12),
+            self.height / 2 - icon.height / 2,
+        )
+
+    def set_selected_state(self, selected: bool, animate: bool = False):
+        """Shows the selection state of the item."""
+
+        self.selected = selected
+        icon = self.instance_icon
+        Animation.cancel_all(icon, "scale")
+        if animate:
+            Animation(scale=int(selected), d=0.2).start(icon)
+        else:
+            icon.scale = int(selected)
+        if self._instance_overlay_color:
+            self._instance_overlay_color.rgba = self.get_overlay_color()
+
+    def do_selected_item(self, *args) -> None:
+        self._progress_animation = False
+        if self.index is not None:
+            self.owner.selection.select(self.index)
+            self.owner.dispatch("on_selected", self.index)
+
+    def do_unselected_item(self) -> None:
+        if self.index is not None:
+            self.owner.selection.deselect(self.index)
+            self.owner.dispatch("on_unselected", self.index)
+
+    def _get_item(self, name: str):
+        item_class = getattr(Factory, f"Recycle{name}", None) or getattr(
+            Factory, name
+        )
+        item = self._items.get(item_class)
+        if item is None:
+            item = self._items[item_class] = item_class()
+        if item is not self.instance_item:
+            if self.instance_item is not None:
+                self.remove_widget(self.instance_item)
+            # Below the check icon.
+            self.add_widget(item, index=len(self.children))
+            self.instance_item = item
+        return item
+
+
+class MDRecycleSelectionListLayout(RecycleBoxLayout):
+    """
+    Layout of :class:`~MDRecycleSelectionList`. Sets the item heights from
+    the list item classes of the data dictionaries without creating the
+    views.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def compute_sizes_from_data(self, data, flags):
+        super().compute_sizes_from_data(data, flags)
+        item_classes = {}
+        for opt, item in zip(self.view_opts, data):
+            if not opt["height_none"]:
+                continue
+            name = item.get("viewclass", "OneLineListItem")
+            item_class = item_classes.get(name)
+            if item_class is None:
+                item_class = item_classes[name] = getattr(
+                    Factory, f"Recycle{name}", None
+                ) or getattr(Factory, name)
+            if hasattr(item_class, "_item_height"):
+                opt["size"][1] = item_class._item_height
+                opt["height_none"] = False
+
+
+class MDRecycleSelectionList(ThemableBehavior, RecycleView):
+    """
+    A virtualized selection list, see
+    :class:`~kivymd.uix.list.MDRecycleList`. The `viewclass` key of the data
+    dictionaries is the name of the list item class.
+
+    :Events:
+        `on_selected`
+            Called when a list item is selected by the user. The argument
+            is the index of the item.
+        `on_unselected`
+            Called when a list item is unselected by the user. The argument
+            is the index of the item.
+
+    .. versionadded:: 1.1.0
+    """
+
+    selection = ObjectProperty()
+    """
+    Selection state of the items, by the indices of the items in
+    :attr:`~kivy.uix.recycleview.RecycleView.data`.
+
+    The selection is kept while items are only appended to the `data`
+    list. When `data` is replaced or its items are inserted, removed or
+    reordered, the selection is cleared, since the selected indices would
+    point to other items.
+
+    :attr:`selection` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to a :class:`~SelectionModel` object.
+    """
+
+    selected_mode = BooleanProperty(False)
+    """See :attr:`~MDSelectionList.selected_mode`."""
+
+    icon = StringProperty("check")
+    """See :attr:`~MDSelectionList.icon`."""
+
+    icon_pos = ListProperty()
+    """See :attr:`~MDSelectionList.icon_pos`."""
+
+    icon_bg_color = ColorProperty([1, 1, 1, 1])
+    """See :attr:`~MDSelectionList.icon_bg_color`."""
+
+    icon_check_color = ColorProperty([0, 0, 0, 1])
+    """See :attr:`~MDSelectionList.icon_check_color`."""
+
+    overlay_color = ColorProperty([0, 0, 0, 0.2])
+    """See :attr:`~MDSelectionList.overlay_color`."""
+
+    progress_round_size = NumericProperty(dp(46))
+    """See :attr:`~MDSelectionList.progress_round_size`."""
+
+    progress_round_color = ColorProperty(None)
+    """See :attr:`~MDSelectionList.progress_round_color`."""
+
+    def __init__(self, **kwargs):
+        self.register_event_type("on_selected")
+        self.register_event_type("on_unselected")
+        super().__init__(**kwargs)
+        if self.selection is None:
+            self.selection = SelectionModel()
+        self.fbind("data", self._update_selection_size)
+
+    def get_selected(self) -> bool:
+        """Returns ``True`` if at least one item in the list is checked."""
+
+        return self.selection.selected_count > 0
+
+    def get_selected_list_items(self) -> list:
+        """Returns the data dictionaries of the selected items."""
+
+        return [self.data[index] for index in self.selection.get_selected()]
+
+    def unselected_all(self) -> None:
+        self.selection.clear()
+        self.selected_mode = False
+
+    def selected_all(self) -> None:
+        self.selection.select_all()
+        self.selected_mode = True
+
+    def on_selection(
+        self, instance_selection_list, selection: SelectionModel
+    ) -> None:
+        selection.resize(len(self.data or ()))
+        selection.fbind("on_change", self._update_selected_views)
+        self._update_selected_views(selection, None)
+
+    def on_selected(self, *args):
+        """Called when a list item is selected."""
+
+        if not self.selected_mode:
+            self.selected_mode = True
+
+    def on_unselected(self, *args):
+        """Called when a list item is unselected."""
+
+        self.selected_mode = self.get_selected()
+
+    def _update_selection_size(self, instance, data: list) -> None:
+        # The operation of the `data` change, see
+        # `kivy.uix.recycleview.datamodel.RecycleDataModel`. Only the
+        # appended items keep the indices of the selected items.
+        op = getattr(data, "last_op", (None, None))[0]
+        if self.selection.selected_count and op not in (
+            "append",
+            "extend",
+            "__iadd__",
+            "__imul__",
+        ):
+            self.unselected_all()
+        self.selection.resize(len(data))
+
+    def _update_selected_views(
+        self, selection: SelectionModel, indices: Union[Iterable, None]
+    ) -> None:
+        # Only the visible views show the selection, the other ones are
+        # updated when they are reused.
+        if selection is not self.selection or not self.view_adapter:
+            return
+        for index, view in list(self.view_adapter.views.items()):
+            if indices is None or index in indices:
+                view.set_selected_state(
+                    index < selection.count and selection.is_selected(index),
+                    animate=True,
+                )
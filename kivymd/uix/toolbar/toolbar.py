@@ -351,7 +351,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.floatlayout import FloatLayout
 
 from kivymd import uix_path
-from kivymd.color_definitions import text_colors
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import (
     CommonElevationBehavior,
@@ -1361,9 +1360,9 @@ class MDTopAppBar(DeclarativeBehavior, NotchedBox, WindowController):
             [0.0, 0.0, 0.0, 1.0],
             [1.0, 1.0, 1.0, 1.0],
         ):
-            self.specific_text_color = text_colors[
-                self.theme_cls.primary_palette
-            ][self.theme_cls.primary_hue]
+            self.specific_text_color = self.theme_cls.get_text_rgba(
+                self.theme_cls.primary_palette, self.theme_cls.primary_hue
+            )
 
 
 class MDBottomAppBar(DeclarativeBehavior, FloatLayout):
@@ -98,6 +98,7 @@ if __name__ == "__main__":
                 *glob_paths(".pot"),
                 *glob_paths(".po"),
                 *glob_paths(".frag"),
+                *glob_paths(".vert"),
             ]
         },
         extras_require={
@@ -113,6 +114,7 @@ if __name__ == "__main__":
                 "coveralls",
                 "pyinstaller[hook_testing]",
             ],
+            "arrow": ["pyarrow"],
             "docs": [
                 "sphinx",
                 "sphinx-autoapi==1.4.0",